@@ -1,35 +1,62 @@
 # app.py
 import base64
+import functools
+import io
+import os
+import threading
+from collections import Counter
 from pathlib import Path
+import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
 
+import syai_rank
+from syai_rank.batch import score_vectors, scores_table
+from syai_rank.cache import MatrixCache, content_digest, default_root
+from syai_rank.data import DecisionMatrix, sniff_format, table_columns, write_parquet
+
 st.set_page_config(page_title="SYAI-Rank", layout="wide")
 APP_DIR = Path(__file__).resolve().parent
 
+STATIC_DIR = APP_DIR / "static"   # served at app/static/ (.streamlit/config.toml)
+SAMPLE_PATH = Path("/mnt/data/sample (1).csv")
+
+def file_mtime(p: Path) -> int:
+    try:
+        return p.stat().st_mtime_ns
+    except OSError:
+        return 0
+
 # ---------- Optional local images (kept) ----------
-def img_data_uri_try(candidates: list[str]) -> tuple[str, bool]:
+@st.cache_resource(max_entries=8)
+def img_data_uri(path: str, mtime: int) -> str:
+    p = Path(path)
+    ext = p.suffix.lower()
+    mime = "image/jpeg" if ext in (".jpg", ".jpeg") else "image/png"
+    b64 = base64.b64encode(p.read_bytes()).decode("utf-8")
+    return f"data:{mime};base64,{b64}"
+
+def img_src_try(candidates: list[str]) -> tuple[str, bool]:
+    """URL for images under static/ (fetched once, browser-cached); data URI otherwise."""
     for name in candidates:
         p = Path(name)
         if not p.is_absolute():
             p = APP_DIR / name
         if p.exists() and p.is_file():
-            ext = p.suffix.lower()
-            mime = "image/jpeg" if ext in (".jpg", ".jpeg") else "image/png"
-            b64 = base64.b64encode(p.read_bytes()).decode("utf-8")
-            return (f"data:{mime};base64,{b64}", True)
+            if p.parent == STATIC_DIR:
+                return (f"app/static/{p.name}", True)
+            return (img_data_uri(str(p), file_mtime(p)), True)
     return ("", False)
 
-SCATTER_URI, SCATTER_FOUND = img_data_uri_try(
-    ["scatter_matrix.png", "assets/scatter_matrix.png"]
-)
-CORR_URI, CORR_FOUND = img_data_uri_try(
-    ["corr_matrix.png", "assets/corr_matrix.png"]
-)
+IMG_CANDIDATES = {
+    "scatter": ["static/scatter_matrix.png", "scatter_matrix.png", "assets/scatter_matrix.png"],
+    "corr": ["static/corr_matrix.png", "corr_matrix.png", "assets/corr_matrix.png"],
+}
 
 # ---------- Single source of truth for the sample CSV ----------
-def load_sample_csv_text() -> str:
-    p = Path("/mnt/data/sample (1).csv")
+@st.cache_resource(max_entries=2)
+def load_sample_csv_text(mtime: int = 0) -> str:
+    p = SAMPLE_PATH
     if p.exists():
         for enc in ("utf-8", "latin-1"):
             try:
@@ -46,7 +73,7 @@ def load_sample_csv_text() -> str:
         "A5,180,6,7\n"
     )
 
-SAMPLE_CSV = load_sample_csv_text()
+SAMPLE_CSV = load_sample_csv_text(file_mtime(SAMPLE_PATH))
 
 # ---------- base page background (kept) ----------
 st.markdown("""
@@ -56,6 +83,250 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ---------- where the ranking runs ----------
+MODE_BROWSER = "In-browser (interactive page)"
+MODE_SERVER = "Server (Python engine)"
+MODE = st.sidebar.radio(
+    "Computation", [MODE_BROWSER, MODE_SERVER],
+    help="Server mode parses the CSV with pandas and scores it with syai_rank; "
+         "only the top-K rows are sent to the browser, so large files stay responsive.",
+)
+
+# ---------- Server mode: pandas + syai_rank, only results go to the browser ----------
+# Every cache below is process-wide: a second session asking for the same file (by content
+# hash) and parameters is served from memory. Entries expire after CACHE_TTL. Parsed uploads
+# are also kept on disk (memory-mapped), under UPLOAD_CACHE_BYTES and for CACHE_TTL since last use.
+# Weight sensitivity samples on at most SENSITIVITY_WORKERS processes, one run at a time across
+# sessions, so cache misses never fork a pool per core per session.
+CACHE_TTL = "6h"
+UPLOAD_CACHE_BYTES = 2 << 30
+SENSITIVITY_WORKERS = min(4, os.cpu_count() or 1)
+
+class CacheCounters:
+    """Calls and misses per cached function, for the admin expander (hits = calls - misses)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls, self.misses = Counter(), Counter()
+
+    def call(self, name: str):
+        with self._lock:
+            self.calls[name] += 1
+
+    def miss(self, name: str):
+        with self._lock:
+            self.misses[name] += 1
+
+    def clear(self):
+        with self._lock:
+            self.calls.clear()
+            self.misses.clear()
+
+@st.cache_resource
+def cache_counters() -> CacheCounters:
+    return CacheCounters()
+
+def counted(fn):
+    """Count calls to a cached function; its body counts the misses."""
+    @functools.wraps(fn)
+    def call(*args, **kwargs):
+        cache_counters().call(fn.__name__)
+        return fn(*args, **kwargs)
+    call.clear = fn.clear
+    return call
+
+@st.cache_resource
+def sensitivity_lock() -> threading.Lock:
+    return threading.Lock()
+
+@st.cache_resource
+def matrix_cache() -> MatrixCache:
+    """Server-mode uploads only (a subdirectory of the CLI cache), so its limits never prune
+    what ``--cache`` keeps. Leftovers of earlier runs past the limits go at startup."""
+    cache = MatrixCache(default_root() / "uploads", max_bytes=UPLOAD_CACHE_BYTES,
+                        max_age=pd.Timedelta(CACHE_TTL).total_seconds())
+    cache.prune(cache.max_bytes, cache.max_age)
+    return cache
+
+@counted
+@st.cache_resource(max_entries=16, ttl=CACHE_TTL, show_spinner="Reading file…")
+def parse_upload(_data: bytes, digest: str, criteria: tuple | None = None):
+    """Memory-mapped from the on-disk matrix cache, so a file is parsed once per content
+    and shared by every session instead of being pickled per rerun."""
+    cache_counters().miss("parse_upload")
+    return matrix_cache().load(_data, criteria, digest=digest)
+
+def upload_digest(up, data: bytes) -> str:
+    """Content hash of the current upload, computed once per file rather than every rerun."""
+    file_id = up.file_id if up is not None else "sample"
+    memo = st.session_state.setdefault("upload_digest", {})
+    if file_id not in memo:
+        memo.clear()
+        memo[file_id] = content_digest(data)
+    return memo[file_id]
+
+@counted
+@st.cache_data(max_entries=32, ttl=CACHE_TTL, show_spinner="Scoring…")
+def score_server_vectors(_dm: DecisionMatrix, key: str, types: tuple, goals: tuple,
+                         weights: tuple, wmode: str) -> dict:
+    """Score vector per method (SYAI as D+/D-); β is not part of the key."""
+    cache_counters().miss("score_server_vectors")
+    return score_vectors(_dm, types, goals, weights, wmode)
+
+@counted
+@st.cache_data(max_entries=16, ttl=CACHE_TTL, show_spinner="Ranking…")
+def score_server(_dm: DecisionMatrix, key: str, types: tuple, goals: tuple,
+                 weights: tuple, wmode: str, beta: float) -> pd.DataFrame:
+    cache_counters().miss("score_server")
+    return scores_table(_dm.names, score_server_vectors(_dm, key, types, goals, weights, wmode), beta)
+
+@counted
+@st.cache_data(max_entries=4, ttl=CACHE_TTL, show_spinner="Writing Parquet…")
+def scores_parquet(_res: pd.DataFrame, key: str, types: tuple, goals: tuple,
+                   weights: tuple, wmode: str, beta: float) -> bytes:
+    cache_counters().miss("scores_parquet")
+    buf = io.BytesIO()
+    write_parquet(_res, buf)
+    return buf.getvalue()
+
+@counted
+@st.cache_data(max_entries=8, ttl=CACHE_TTL, show_spinner="Sampling weights…")
+def sensitivity_server(_dm: DecisionMatrix, key: str, types: tuple, goals: tuple, weights: tuple,
+                       wmode: str, samples: int, dist: str, concentration: float, depth: int) -> dict:
+    cache_counters().miss("sensitivity_server")
+    with sensitivity_lock():
+        r = syai_rank.weight_sensitivity(_dm.X, types, goals, weights, wmode, samples=samples, dist=dist,
+                                         concentration=concentration, depth=depth,
+                                         stats=_dm.stats, seed=0, workers=SENSITIVITY_WORKERS)
+    first = pd.DataFrame({"Alternative": _dm.names, **r.first})
+    acc = {m: pd.DataFrame(a, columns=[f"rank {k + 1}" for k in range(a.shape[1])]).assign(Alternative=_dm.names)
+           for m, a in r.acceptability.items()}
+    return {"first": first, "acceptability": acc}
+
+def render_sensitivity(dm, key, types, goals, weights, wmode):
+    with st.expander("Weight sensitivity (Monte Carlo)"):
+        c1, c2, c3, c4 = st.columns(4)
+        samples = int(c1.number_input("Samples", min_value=100, max_value=100_000, value=2_000, step=500))
+        dist = "uniform" if c2.radio("Sample", ["Around my weights", "Whole simplex"]) == "Whole simplex" else "dirichlet"
+        conc = c3.number_input("Concentration", min_value=1.0, value=50.0, step=10.0,
+                               disabled=dist == "uniform", help="Larger stays closer to your weights")
+        depth = int(c4.number_input("Ranks reported", min_value=1, max_value=min(20, len(dm.X)), value=min(3, len(dm.X))))
+        if not st.toggle("Run sensitivity analysis", key="srv_sens"):
+            return
+        r = sensitivity_server(dm, key, types, goals, weights, wmode, samples, dist, float(conc), depth)
+        st.caption("Share of sampled weight vectors in which each alternative ranks first.")
+        first = r["first"]
+        top = first.loc[first[list(syai_rank.METHODS)].max(axis=1).nlargest(20).index]
+        st.dataframe(top, hide_index=True, width="stretch")
+        method = st.selectbox("Rank acceptability for", syai_rank.METHODS, index=3)
+        acc = r["acceptability"][method]
+        st.bar_chart(acc.loc[acc["rank 1"].nlargest(20).index].set_index("Alternative"))
+
+SHARED_CACHES = (parse_upload, score_server_vectors, score_server, scores_parquet, sensitivity_server)
+
+def cache_memory() -> dict:
+    """Bytes held per cached function, from Streamlit's own cache stats (the numbers behind
+    /_stcore/metrics); empty if this Streamlit version does not expose them."""
+    from streamlit.runtime import caching
+    out = Counter()
+    try:
+        for provider in (caching.get_data_cache_stats_provider(), caching.get_resource_cache_stats_provider()):
+            for stats in provider.get_stats().values():
+                for s in stats:
+                    out[s.cache_name.rsplit(".", 1)[-1]] += s.byte_length
+    except (AttributeError, TypeError):
+        return {}
+    return out
+
+def render_cache_admin():
+    with st.sidebar.expander("Shared cache (admin)"):
+        counters, mem = cache_counters(), cache_memory()
+        names = [fn.__name__ for fn in SHARED_CACHES]
+        rows = pd.DataFrame({
+            "cache": names,
+            "hits": [counters.calls[n] - counters.misses[n] for n in names],
+            "misses": [counters.misses[n] for n in names],
+            "MB": [mem.get(n, 0) / 2**20 for n in names],
+        })
+        st.dataframe(rows, hide_index=True, width="stretch",
+                     column_config={"MB": st.column_config.NumberColumn(format="%.1f")})
+        disk = sum(size for _, size, _ in matrix_cache().entries())
+        st.caption(f"Entries expire after {CACHE_TTL}. Parsed matrices on disk: {disk / 2**20:,.1f} MB "
+                   f"of {UPLOAD_CACHE_BYTES / 2**20:,.0f} MB, dropped {CACHE_TTL} after last use "
+                   f"({matrix_cache().root}).")
+        if st.button("Clear shared caches"):
+            for fn in SHARED_CACHES:
+                fn.clear()
+            counters.clear()
+            st.rerun()
+
+def render_server_mode():
+    st.title("SYAI-Rank — server mode")
+    up = st.file_uploader("Decision matrix: CSV, Parquet or Arrow/Feather (first column is Alternative)",
+                          type=["csv", "parquet", "arrow", "feather"])
+    data = up.getvalue() if up is not None else SAMPLE_CSV.encode("utf-8")
+    if up is None:
+        st.caption("No file uploaded — using the sample CSV.")
+    criteria = None
+    try:
+        if sniff_format(data) != "csv":
+            # columnar files: read the schema, then decode only the chosen criteria
+            cols = table_columns(data)
+            alt = "Alternative" if "Alternative" in cols else cols[0]
+            options = [c for c in cols if c != alt]
+            criteria = tuple(st.multiselect("Criteria", options, default=options))
+            if not criteria:
+                st.info("Pick at least one criterion.")
+                return
+        digest = upload_digest(up, data)
+        dm = parse_upload(data, digest, criteria)
+    except (ValueError, pd.errors.ParserError) as e:
+        st.error(f"Could not read file: {e}")
+        return
+    if dm.dropped:
+        st.warning(f"Skipped {dm.dropped} row(s) with missing or non-numeric criteria.")
+    if not len(dm.X):
+        st.error("No usable rows.")
+        return
+    st.caption(f"{len(dm.X):,} alternatives × {len(dm.criteria)} criteria")
+
+    spec = st.data_editor(
+        pd.DataFrame({"Criterion": dm.criteria, "Type": syai_rank.BENEFIT,
+                      "Goal": [None] * len(dm.criteria), "Weight": 1.0}),
+        column_config={
+            "Criterion": st.column_config.TextColumn(disabled=True),
+            "Type": st.column_config.SelectboxColumn(options=list(syai_rank.CRITERION_TYPES), required=True),
+            "Goal": st.column_config.NumberColumn(help="Only used for Ideal (Goal) criteria"),
+            "Weight": st.column_config.NumberColumn(min_value=0.0, step=0.001),
+        },
+        hide_index=True, width="stretch", key="srv_spec",
+    )
+    c1, c2, c3, c4 = st.columns(4)
+    wmode = "custom" if c1.radio("Weights", ["Equal (1/m)", "Custom (raw; normalized)"]) != "Equal (1/m)" else "equal"
+    beta = c2.slider("β (blend of D⁺ and D⁻)", 0.0, 1.0, 0.5, 0.01)
+    order_by = c3.selectbox("Rank by", list(syai_rank.METHODS) + ["SYAI (β)"], index=3)
+    top_k = int(c4.number_input("Top K", min_value=1, max_value=max(1, len(dm.X)), value=min(50, len(dm.X))))
+
+    types = tuple(spec["Type"].fillna(syai_rank.BENEFIT))
+    goals = tuple(None if pd.isna(g) or t != syai_rank.IDEAL else float(g) for g, t in zip(spec["Goal"], types))
+    weights = tuple(float(w) if pd.notna(w) else 0.0 for w in spec["Weight"])
+    key = digest + ("|" + "\x1f".join(criteria) if criteria else "")
+    res = score_server(dm, key, types, goals, weights, wmode, beta)
+
+    top = res.nsmallest(top_k, order_by + " rank")
+    st.subheader(f"Top {len(top)} by {order_by}")
+    st.dataframe(top, hide_index=True, width="stretch")
+    st.bar_chart(top.set_index("Alternative")[order_by])
+    st.download_button("Download all scores (Parquet)",
+                       scores_parquet(res, key, types, goals, weights, wmode, beta),
+                       file_name="syai_rank_scores.parquet", mime="application/vnd.apache.parquet")
+    render_sensitivity(dm, key, types, goals, weights, wmode)
+
+if MODE == MODE_SERVER:
+    render_server_mode()
+    render_cache_admin()
+    st.stop()
+
 # ------------------------------- HTML APP -------------------------------
 html = r"""
 <!doctype html>
@@ -112,10 +383,11 @@ html = r"""
 
   .section-title{font-weight:700;font-size:18px;margin-bottom:12px;color:#f9a8d4}
   .label{display:block;font-size:12px;opacity:.85;margin-bottom:4px}
-  input[type="number"],select{width:100%;padding:10px 12px;border-radius:10px;border:1px solid #ddd;background:#f8fafc;color:#111}
+  input[type="number"],input[type="text"],select,textarea{width:100%;padding:10px 12px;border-radius:10px;border:1px solid #ddd;background:#f8fafc;color:#111}
   .hint{font-size:12px;opacity:.8}
 
   .table-wrap{overflow:auto;max-height:360px}
+  .table-wrap thead th{position:sticky;top:0;background:#fff;cursor:pointer;user-select:none}
   table{width:100%;border-collapse:collapse;font-size:14px;color:#111}
   th,td{text-align:left;padding:8px 10px;border-bottom:1px solid #e5e7eb}
 
@@ -146,7 +418,7 @@ html = r"""
 
   <div class="tabs">
     <button type="button" class="tab active" id="tabSYAI">SYAI Method</button>
-    <button type="button" class="tab" id="tabCompare">Comparison (TOPSIS, VIKOR, SAW, SYAI, COBRA, WASPAS, MOORA)</button>
+    <button type="button" class="tab" id="tabCompare">Comparison</button>
   </div>
 
   <!-- ================= TAB 1: SYAI ONLY ================= -->
@@ -162,6 +434,13 @@ html = r"""
 
         <div id="t1" class="card dark" style="display:none">
           <div class="section-title">Step 2: Criteria Types</div>
+          <div class="row mb2" style="gap:8px;align-items:center;flex-wrap:nowrap">
+            <div class="hint">Profile:</div>
+            <select id="prof1" title="Saved settings for files with these criteria"></select>
+            <input id="profName1" type="text" placeholder="Save as…"/>
+            <button type="button" class="btn" id="profSave1">💾</button>
+            <button type="button" class="btn" id="profDel1" title="Delete this profile">🗑</button>
+          </div>
           <div id="types1" class="grid2"></div>
         </div>
 
@@ -179,6 +458,8 @@ html = r"""
           <input id="beta1" type="range" min="0" max="1" step="0.01" value="0.5" style="width:100%"/>
           <div class="hint mt2">β = <b id="beta1v">0.50</b></div>
           <button type="button" class="btn mt4" id="runSYAI">Run SYAI</button>
+          <progress id="syaiProg" class="mt2" max="1" value="0" style="width:100%;display:none"></progress>
+          <div class="hint mt2" id="syaiStatus"></div>
         </div>
       </div>
 
@@ -198,6 +479,10 @@ html = r"""
             <div class="hint mb2">Line Chart (Rank vs Closeness)</div>
             <div class="chart2"><svg id="line1" width="100%" height="100%"></svg></div>
           </div>
+          <div class="mt6">
+            <div class="hint mb2">Rank vs β (top 10 at the current β; bands = rank range over β ∈ [0, 1])</div>
+            <div class="chart2"><svg id="sweep1" width="100%" height="100%"></svg></div>
+          </div>
         </div>
       </div>
     </div>
@@ -216,6 +501,13 @@ html = r"""
 
         <div id="t2" class="card dark" style="display:none">
           <div class="section-title">Step B: Criteria Types</div>
+          <div class="row mb2" style="gap:8px;align-items:center;flex-wrap:nowrap">
+            <div class="hint">Profile:</div>
+            <select id="prof2" title="Saved settings for files with these criteria"></select>
+            <input id="profName2" type="text" placeholder="Save as…"/>
+            <button type="button" class="btn" id="profSave2">💾</button>
+            <button type="button" class="btn" id="profDel2" title="Delete this profile">🗑</button>
+          </div>
           <div id="types2" class="grid2"></div>
         </div>
 
@@ -230,7 +522,30 @@ html = r"""
 
         <div class="card dark">
           <div class="section-title">Step D: Run</div>
+          <div class="row mb2" style="gap:12px;align-items:center">
+            <div class="hint">Top K (0 = rank all):</div>
+            <input id="cmpTopK" type="number" min="0" step="10" value="0" style="width:90px"/>
+            <div class="hint">Rank by:</div>
+            <select id="cmpRankBy"></select>
+          </div>
           <button type="button" class="btn" id="runCmp">▶️ Run Comparison</button>
+          <progress id="cmpProg" class="mt2" max="1" value="0" style="width:100%;display:none"></progress>
+          <div class="hint mt2" id="cmpStatus"></div>
+        </div>
+
+        <div id="s2" class="card dark" style="display:none">
+          <div class="section-title">Step E: Scenario Batch</div>
+          <p class="hint mb2">One row per scenario: <b>Scenario</b>, then per criterion <b>&lt;name&gt;</b> (weight),
+            <b>&lt;name&gt; type</b>, <b>&lt;name&gt; goal</b>, and optionally <b>wmode</b>. Empty cells keep Steps B–C.</p>
+          <textarea id="scnText" rows="6" spellcheck="false" style="font-family:monospace"></textarea>
+          <div class="row mt2" style="gap:12px;align-items:center">
+            <label for="scnFile" class="btn">📤 Scenarios CSV</label>
+            <input id="scnFile" type="file" accept=".csv" style="display:none"/>
+            <button type="button" class="btn" id="scnAdd">➕ Current settings</button>
+            <button type="button" class="btn" id="runScn">▶️ Run Scenarios</button>
+          </div>
+          <progress id="scnProg" class="mt2" max="1" value="0" style="width:100%;display:none"></progress>
+          <div class="hint mt2" id="scnStatus"></div>
         </div>
       </div>
 
@@ -240,6 +555,24 @@ html = r"""
           <div class="table-wrap"><table id="tblm2"></table></div>
         </div>
 
+        <div id="rscn" class="card light" style="display:none">
+          <div class="section-title">Scenario Ranks</div>
+          <div class="row mb2" style="gap:12px;align-items:center">
+            <div class="hint">Method:</div>
+            <select id="scnMethod" style="width:auto"></select>
+            <div class="hint" id="scnInfo"></div>
+          </div>
+          <div class="table-wrap"><table id="scn_table"></table></div>
+          <div class="mt6">
+            <div class="hint mb2">Rank across scenarios (top 10 by mean rank; bands = best–worst rank)</div>
+            <div class="chart2"><svg id="scn_paths" width="100%" height="100%"></svg></div>
+          </div>
+          <div class="mt6">
+            <div class="hint mb2">Share of scenarios ranking each alternative 1st</div>
+            <div class="chart2"><svg id="scn_first" width="100%" height="100%"></svg></div>
+          </div>
+        </div>
+
         <div id="rcmp" class="card light" style="display:none">
           <div class="section-title">Scores & Ranks</div>
           <div class="table-wrap"><table id="mmc_table"></table></div>
@@ -254,15 +587,19 @@ html = r"""
             <div class="hint">Scatter (Pearson line)</div>
             <div class="row" style="gap:12px;align-items:center">
               <div class="hint">X:</div>
-              <select id="mmc_x"><option>SYAI</option><option>TOPSIS</option><option>VIKOR</option><option>SAW</option><option>COBRA</option><option>WASPAS</option><option>MOORA</option></select>
+              <select id="mmc_x"></select>
               <div class="hint">Y:</div>
-              <select id="mmc_y"><option>TOPSIS</option><option>SYAI</option><option>VIKOR</option><option>SAW</option><option>COBRA</option><option>WASPAS</option><option>MOORA</option></select>
+              <select id="mmc_y"></select>
             </div>
             <div class="chart2"><svg id="mmc_sc" width="100%" height="100%"></svg></div>
           </div>
 
           <div class="mt6">
-            <div class="hint mb2">Correlation Heatmap — <b>Spearman</b> </div>
+            <div class="row mb2" style="gap:12px;align-items:center">
+              <div class="hint">Correlation Heatmap —</div>
+              <select id="cmpCorr" style="width:auto"><option value="spearman">Spearman ρ</option><option value="kendall">Kendall τ</option></select>
+            </div>
+            <button type="button" class="btn mb2" id="cmpSpearman" style="display:none">Compute full ranks + Spearman</button>
             <div class="chartTall"><svg id="mmc_heat" width="100%" height="100%"></svg></div>
           </div>
         </div>
@@ -289,7 +626,11 @@ html = r"""
     "SYAI":"#a78bfa",
     "COBRA":"#f472b6",
     "WASPAS":"#93c5fd",
-    "MOORA":"#86efac"
+    "MOORA":"#86efac",
+    "EDAS":"#fb923c",
+    "CODAS":"#22d3ee",
+    "MABAC":"#a3e635",
+    "PROMETHEE II":"#f87171"
   };
 
   // ---------- theme ----------
@@ -327,133 +668,1236 @@ html = r"""
   $("tabCompare").addEventListener("click", activateCompare);
   activateSYAI();
 
-  // ---------- CSV helpers ----------
-  function parseCSVText(text){
-    const rows=[]; let i=0, cur="", inQ=false, row=[];
-    const pushCell=()=>{ row.push(cur); cur=""; };
-    const pushRow =()=>{ rows.push(row); row=[]; };
-    while(i<text.length){
-      const ch=text[i];
-      if(inQ){
-        if(ch==='\"'){ if(text[i+1]==='\"'){ cur+='\"'; i++; } else { inQ=false; } }
-        else cur+=ch;
-      }else{
-        if(ch==='\"') inQ=true;
-        else if(ch===',') pushCell();
-        else if(ch==='\n'){ pushCell(); pushRow(); }
-        else if(ch==='\r'){}
-        else cur+=ch;
+  // ================= KERNELS (pure compute, no DOM) =================
+  // Data model: the CSV is parsed once into D = {names, crit, n, m, X}, where X is a
+  // column-major Float64Array (criterion j occupies X[j*n .. (j+1)*n)).
+  function SYAIKernels(){
+    // ---------- CSV helpers ----------
+    function parseCSVText(text){
+      const rows=[]; let i=0, cur="", inQ=false, row=[];
+      const pushCell=()=>{ row.push(cur); cur=""; };
+      const pushRow =()=>{ rows.push(row); row=[]; };
+      while(i<text.length){
+        const ch=text[i];
+        if(inQ){
+          if(ch==='\"'){ if(text[i+1]==='\"'){ cur+='\"'; i++; } else { inQ=false; } }
+          else cur+=ch;
+        }else{
+          if(ch==='\"') inQ=true;
+          else if(ch===',') pushCell();
+          else if(ch==='\n'){ pushCell(); pushRow(); }
+          else if(ch==='\r'){}
+          else cur+=ch;
+        }
+        i++;
+      }
+      pushCell(); if(row.length>1 || row[0] !== "") pushRow();
+      return rows;
+    }
+    const toNum=(v)=>{ const x=parseFloat(String(v).replace(/,/g,"")); return isFinite(x)?x:NaN; };
+
+    // rows of strings -> D; toNum runs exactly once per cell
+    function toMatrix(arr){
+      const head=arr[0].map(x=> String(x??"").trim());
+      let alt=head.indexOf("Alternative"); if(alt<0) alt=0;
+      const order=[alt].concat(head.map((_,j)=>j).filter(j=> j!==alt)); // display column order
+      const crit=order.slice(1).map(j=> head[j]);
+      const rows=arr.slice(1).filter(r=> r.length>=head.length);
+      const n=rows.length, m=crit.length, X=new Float64Array(n*m), names=new Array(n);
+      for(let i=0;i<n;i++){
+        const r=rows[i]; names[i]=String(r[alt]);
+        for(let j=0;j<m;j++) X[j*n+i]=toNum(r[order[j+1]]);
+      }
+      return {cols:["Alternative"].concat(crit), crit, names, rows, order, n, m, X};
+    }
+    const col=(D,j)=> D.X.subarray(j*D.n, (j+1)*D.n);
+    function minMax(a){
+      let mn=Infinity, mx=-Infinity;
+      for(let i=0;i<a.length;i++){ const v=a[i]; if(v<mn) mn=v; if(v>mx) mx=v; }
+      return [mn, mx];
+    }
+    // One sweep for every per-column reduction (never Math.max(...col), which overflows the
+    // call stack on large columns). NaN cells drop out of min/max; sumFinite skips them too.
+    function reduceCol(a){
+      let mn=Infinity, mx=-Infinity, s=0, q=0, fs=0;
+      for(let i=0;i<a.length;i++){
+        const v=a[i]; if(v<mn) mn=v; if(v>mx) mx=v;
+        s+=v; q+=v*v; if(isFinite(v)) fs+=v;
+      }
+      return {min:mn, max:mx, sum:s, sumsq:q, sumFinite:fs};
+    }
+    const vectorNorm=(vals, r=reduceCol(vals))=>{
+      const d=Math.sqrt(r.sumsq)||1, out=new Float64Array(vals.length);
+      for(let i=0;i<vals.length;i++) out[i]=vals[i]/d;
+      return out;
+    };
+
+    // ---------- SAW utilities ----------
+    function sawUnit(vals, type="Benefit", goal=null, r=reduceCol(vals)){
+      const {min,max}=r, out=new Float64Array(vals.length);
+      if(type==="Benefit"){
+        const M = max || 1; for(let i=0;i<vals.length;i++) out[i]=vals[i]/(M||1); return out;
+      }
+      if(type==="Cost"){
+        const m = min || 1; for(let i=0;i<vals.length;i++) out[i]=m/(vals[i]||1); return out;
+      }
+      // Ideal (Goal)
+      const R=(max-min)||1;
+      const g = isFinite(parseFloat(goal))? parseFloat(goal) : (min+max)/2;
+      for(let i=0;i<vals.length;i++) out[i]=Math.max(0, 1 - Math.abs(vals[i]-g)/R);
+      return out;
+    }
+
+    // ---------- CORE compute ----------
+    // weights by criterion index
+    function computeWeights(crits, weights, mode){
+      const m=crits.length, w=new Float64Array(m);
+      if(mode==='equal'){ w.fill(1/m); }
+      else{
+        let s=0; crits.forEach((c,j)=>{ const v=Math.max(0,parseFloat(weights[c]||0)); w[j]=isFinite(v)?v:0; s+=w[j]; });
+        if(s<=0) w.fill(1/m); else for(let j=0;j<m;j++) w[j]/=s;
+      }
+      return w;
+    }
+    // the same before normalizing (computeWeights = these / their sum)
+    function rawWeights(crits, weights, mode){
+      const r=new Float64Array(crits.length);
+      if(mode==='equal') return r.fill(1);
+      let s=0;
+      crits.forEach((c,j)=>{ const v=Math.max(0,parseFloat(weights[c]||0)); r[j]=isFinite(v)?v:0; s+=r[j]; });
+      return s<=0? r.fill(1) : r;
+    }
+
+    function computeU(D, types, ideals){
+      const U=new Float64Array(D.n*D.m), st=columnStats(D);
+      D.crit.forEach((c,j)=> U.set(sawUnit(col(D,j), types[c]||"Benefit", ideals[c], st[j]), j*D.n));
+      return U;
+    }
+
+    // ---------- shared column statistics ----------
+    // Every method's normalization reduces to per-criterion constants derived from a few column
+    // reductions. Those are swept once per dataset (min, max, sums, L2 norm; cached on D), and the
+    // constants once per (criterion, type, goal). A method then reads each raw column only in
+    // its scoring loop. Same split as syai_rank.engine.column_stats/_plan.
+    function columnStats(D){
+      if(!D.stats) D.stats=D.crit.map((_,j)=>{
+        const r=reduceCol(col(D,j));
+        r.norm=Math.sqrt(r.sumsq)||1; r.mean=r.sumFinite/D.n;
+        return r;
+      });
+      return D.stats;
+    }
+    function columnPlan(D, j, t, goal){
+      const plans=D.plans || (D.plans=new Map());
+      const key=j+"|"+t+"|"+(t==="Ideal (Goal)"? String(goal??"") : "");
+      if(plans.has(key)) return plans.get(key);
+      const st=columnStats(D)[j], cost=t==="Cost", ideal=t==="Ideal (Goal)", c={key, j, t, cost, ideal};
+      // SAW unit (sawUnit)
+      c.uMax=st.max||1; c.uMin=st.min||1; c.uR=(st.max-st.min)||1;
+      const g=parseFloat(goal); c.uG=isFinite(g)? g : (st.min+st.max)/2;
+      // TOPSIS / MOORA vector norm; A+/A- of the unweighted column (weights are >= 0)
+      c.norm=st.norm;
+      const ntMin=st.min/st.norm, ntMax=st.max/st.norm;
+      c.tPlus=cost? ntMin : ntMax; c.tMinus=cost? ntMax : ntMin;
+      // VIKOR
+      c.fStar=cost? st.min : st.max; const fMin=cost? st.max : st.min;
+      c.vDen=Math.abs(c.fStar-fMin)||1; c.vCden=(fMin-c.fStar)||1;
+      // SYAI (normalizeColumn_SYAI); sMin/sMax filled in by syaiRange
+      c.sStar= t==="Benefit"? st.max : cost? st.min : (isFinite(g)? g : st.mean);
+      c.sR=st.max-st.min; c.sFlat=Math.abs(c.sR)<1e-12;
+      // COBRA (max-normalized, f = x/vmax)
+      c.cMax=st.max||1;
+      const f0=st.min/c.cMax, f1=st.max/c.cMax, fmn=Math.min(f0,f1), fmx=Math.max(f0,f1);
+      c.cPIS=cost? fmn : fmx; c.cNIS=cost? fmx : fmn; c.cAS=st.sum/c.cMax/D.n;
+      // EDAS: average solution (for Ideal (Goal), the mean distance to x*, set by syaiRange)
+      c.eAV=st.mean;
+      plans.set(key, c);
+      return c;
+    }
+    // normalizeColumn_SYAI falls as |x - x*| grows, so its column extremes sit at the nearest and
+    // farthest distance from x*: the farthest is an end of [min, max], and the nearest is 0 unless
+    // x* is a goal or the mean (one scan over the column, once per goal, which also sums the
+    // distances for EDAS).
+    function syaiRange(D, c){
+      if(c.sMax!==undefined) return c;
+      const st=columnStats(D)[c.j];
+      let near=0;
+      if(c.ideal){
+        const v=col(D,c.j); let sum=0; near=Infinity;
+        for(let i=0;i<v.length;i++){ const d=Math.abs(v[i]-c.sStar); if(d<near) near=d; if(isFinite(d)) sum+=d; }
+        c.eAV=sum/D.n;
+      }
+      c.sMax=syaiD(c, near); c.sMin=syaiD(c, Math.max(Math.abs(st.min-c.sStar), Math.abs(st.max-c.sStar)));
+      return c;
+    }
+    function sawU(c, x){
+      if(c.t==="Benefit") return x/c.uMax;
+      if(c.cost) return c.uMin/(x||1);
+      return Math.max(0, 1 - Math.abs(x-c.uG)/c.uR);
+    }
+    const syaiD=(c, d)=> c.sFlat? 1.0 : Math.max(0.01, Math.min(1, 0.01 + (1-0.01)*(1-d/c.sR)));
+    const syaiN=(c, x)=> syaiD(c, Math.abs(x-c.sStar));
+    const vikorTerm=(c, x)=> c.cost? (x-c.fStar)/c.vCden : (c.fStar-x)/c.vDen;
+
+    // ---------- method registry ----------
+    // Every method is a sum over criteria of per-alternative terms, read off normalized views of
+    // each column that several methods share, plus one finishing step. An entry declares
+    //   views  the VIEWS its column step reads; each one is built once per column for all methods
+    //   lower  rank direction: true when a smaller score is better
+    //   acc    its per-alternative accumulators and their start values
+    //   prep   (optional) per-plan constants taken from the views, cached on the plan
+    //   add    (A, V, c, lw, qw, n): column c's part, lw being its weight and qw = lw². Terms are
+    //          linear in lw or qw, so makeIncremental takes a column out by adding it with both
+    //          negated; a row max (rowMax) only grows here, and makeIncremental repairs it
+    //   score  (A, n, s): the score vector, s being the factor that normalizes the weights
+    // The runner, makeIncremental, the scenario batch and the page's method lists all follow
+    // METHODS, so a new method is one entry.
+    const VIEWS={
+      x: (D, c)=> col(D, c.j),                      // raw values (VIKOR, EDAS)
+      unit(D, c, out){                              // SAW unit: x/max, min/x, 1 − |x − g|/R
+        const v=col(D, c.j), u=out(); for(let i=0;i<v.length;i++) u[i]=sawU(c, v[i]); return u;
+      },
+      logUnit(D, c, out){                           // WASPAS's product as a sum
+        const v=col(D, c.j), u=out(); for(let i=0;i<v.length;i++) u[i]=Math.log(Math.max(sawU(c, v[i]), 1e-12)); return u;
+      },
+      vector(D, c, out){                            // x/‖x‖ (TOPSIS, MOORA)
+        const v=col(D, c.j), u=out(), d=c.norm; for(let i=0;i<v.length;i++) u[i]=v[i]/d; return u;
+      },
+      max(D, c, out){                               // x/max (COBRA)
+        const v=col(D, c.j), u=out(), d=c.cMax; for(let i=0;i<v.length;i++) u[i]=v[i]/d; return u;
+      },
+      goal(D, c, out){                              // SYAI goal distance, 0.01..1 (SYAI, MABAC)
+        const v=col(D, c.j), u=out(); for(let i=0;i<v.length;i++) u[i]=syaiN(c, v[i]); return u;
+      },
+      flow: (D, c)=> prefFlow(D, c),                // PROMETHEE net flow × (n − 1)
+    };
+    // PROMETHEE with the usual criterion: i is preferred to k on a criterion iff its value is
+    // better, so the criterion's net flow (#worse − #better)/(n − 1) is (2r − n − 1)/(n − 1), with
+    // r the average ascending rank. One sort per column (Cost negates the Benefit flow) or per
+    // goal (ranking −|x − x*|), kept as the integers 2r − n − 1.
+    function prefFlow(D, c){
+      if(c.ideal){
+        if(!c.flow){ const v=col(D, c.j), d=new Float64Array(D.n); for(let i=0;i<D.n;i++) d[i]=-Math.abs(v[i]-c.sStar); c.flow=flowOf(d); }
+        return c.flow;
+      }
+      const F=D.flows || (D.flows=[]);
+      return F[c.j] || (F[c.j]=flowOf(col(D, c.j)));
+    }
+    function flowOf(v){
+      const n=v.length, idx=argsort(v, false), f=new Int32Array(n);
+      for(let i=0;i<n;){ let j=i+1; while(j<n && v[idx[j]]===v[idx[i]]) j++; for(let k=i;k<j;k++) f[idx[k]]=i+j-n; i=j; }
+      return f;
+    }
+    const scaled=(a, s)=>{ const out=new Float64Array(a.length); for(let i=0;i<a.length;i++) out[i]=a[i]*s; return out; };
+    const rootScaled=(a, s)=>{ const out=new Float64Array(a.length); for(let i=0;i<a.length;i++) out[i]=Math.sqrt(Math.max(0, a[i]))*s; return out; };
+
+    const METHODS={
+      TOPSIS:{views:["vector"], acc:{TP:0, TM:0},
+        add(A, V, c, lw, qw, n){
+          const t=V.vector, P=A.TP, M=A.TM;
+          for(let i=0;i<n;i++){ P[i]+=qw*(t[i]-c.tPlus)**2; M[i]+=qw*(t[i]-c.tMinus)**2; }
+        },
+        score(A, n, s){
+          const dp=rootScaled(A.TP, s), dm=rootScaled(A.TM, s);
+          for(let i=0;i<n;i++) dm[i]=dm[i]/((dp[i]+dm[i])||1e-12);
+          return dm;
+        }},
+      VIKOR:{views:["x"], lower:true, acc:{VS:0, VR:-Infinity}, rowMax:{acc:"VR", term:vikorTerm},
+        add(A, V, c, lw, qw, n){
+          const v=V.x, S=A.VS, R=A.VR;
+          for(let i=0;i<n;i++){ const y=lw*vikorTerm(c, v[i]); S[i]+=y; if(lw>0 && y>R[i]) R[i]=y; }
+        },
+        score(A, n, s){
+          const S=scaled(A.VS, s), R=scaled(A.VR, s), [Smin,Smax]=minMax(S), [Rmin,Rmax]=minMax(R);
+          for(let i=0;i<n;i++) S[i]=0.5*((S[i]-Smin)/((Smax-Smin)||1)) + 0.5*((R[i]-Rmin)/((Rmax-Rmin)||1));
+          return S;
+        }},
+      SAW:{views:["unit"], acc:{SAW:0},
+        add(A, V, c, lw, qw, n){ const u=V.unit, S=A.SAW; for(let i=0;i<n;i++) S[i]+=lw*u[i]; },
+        score:(A, n, s)=> scaled(A.SAW, s)},
+      SYAI:{views:["goal"], acc:{SP:0, SM:0},
+        add(A, V, c, lw, qw, n){
+          const y=V.goal, P=A.SP, M=A.SM;
+          for(let i=0;i<n;i++){ P[i]+=lw*(c.sMax-y[i]); M[i]+=lw*(y[i]-c.sMin); }
+        },
+        score:(A, n, s)=> syaiCloseness(scaled(A.SP, s), scaled(A.SM, s), 0.5)},
+      // COBRA (Eqs. 6–26; matches your Excel exactly): r_ij = f_ij/max_j · w_j (Eqs. 7–8),
+      // PIS/NIS/AS (Eqs. 9–13) from the column plan, distances accumulated per alternative
+      COBRA:{views:["max"], lower:true, acc:{eP:0, sP:0, eN:0, sN:0, eAp:0, tAp:0, eAn:0, tAn:0},
+        add(A, V, c, lw, qw, n){
+          const r=V.max, {eP, sP, eN, sN, eAp, tAp, eAn, tAn}=A;
+          for(let i=0;i<n;i++){
+            const f=r[i], dp=c.cPIS-f, dn=c.cNIS-f, da=c.cAS-f;
+            eP[i]+=qw*dp*dp; sP[i]+=lw*dp; eN[i]+=qw*dn*dn; sN[i]+=lw*dn;
+            if(c.cAS<f){ eAp[i]+=qw*da*da; tAp[i]+=lw*Math.abs(da); }   // gate ε⁺ (Eq. 21)
+            if(c.cAS>f){ eAn[i]+=qw*da*da; tAn[i]+=lw*Math.abs(da); }   // gate ε⁻ (Eq. 24)
+          }
+        },
+        score(A, n, s){
+          // Eq. 14: d = dE + ρ * dE * dT, with ρ = max dE − min dE per solution set
+          function dist(e, t, signed){
+            const d=rootScaled(e, s), [mn,mx]=minMax(d), rho=mx-mn;
+            for(let i=0;i<n;i++){ const ti=t[i]*s; d[i]=d[i] + rho*d[i]*(signed? Math.abs(ti) : ti); }
+            return d;
+          }
+          const P=dist(A.eP,A.sP,true), N=dist(A.eN,A.sN,true), Ap=dist(A.eAp,A.tAp,false), An=dist(A.eAn,A.tAn,false);
+          // Step 6 (Eq. 26): final (smaller is better); keep the ÷4; can be negative
+          for(let i=0;i<n;i++) P[i]=(P[i] - N[i] - Ap[i] + An[i]) / 4;
+          return P;
+        }},
+      WASPAS:{views:["unit", "logUnit"], acc:{WS:0, LW:0},
+        add(A, V, c, lw, qw, n){
+          const u=V.unit, lu=V.logUnit, S=A.WS, L=A.LW;
+          for(let i=0;i<n;i++){ S[i]+=lw*u[i]; L[i]+=lw*lu[i]; }
+        },
+        score(A, n, s){
+          const out=new Float64Array(n);
+          for(let i=0;i<n;i++) out[i]=0.5*A.WS[i]*s + 0.5*Math.exp(A.LW[i]*s);
+          return out;
+        }},
+      // Ideal (Goal) criteria count as benefits, on the SAW unit
+      MOORA:{views:["vector", "unit"], acc:{MB:0, MC:0},
+        add(A, V, c, lw, qw, n){
+          const t=c.ideal? V.unit : V.vector, M=c.cost? A.MC : A.MB;
+          for(let i=0;i<n;i++) M[i]+=lw*t[i];
+        },
+        score(A, n, s){
+          const out=new Float64Array(n);
+          for(let i=0;i<n;i++) out[i]=(A.MB[i]-A.MC[i])*s;
+          return out;
+        }},
+      // positive/negative distance from the average solution, each scaled by its largest value;
+      // Ideal (Goal) criteria score the distance to x* as a cost
+      EDAS:{views:["x"], acc:{EP:0, EN:0},
+        add(A, V, c, lw, qw, n){
+          const v=V.x, P=A.EP, N=A.EN, av=c.eAV, k=lw/(Math.abs(av)||1);
+          for(let i=0;i<n;i++){
+            const x=v[i], d= c.ideal? av-Math.abs(x-c.sStar) : c.cost? av-x : x-av;
+            if(d>0) P[i]+=k*d; else N[i]-=k*d;
+          }
+        },
+        score(A, n){   // ratios only, so the weight scale drops out
+          const out=new Float64Array(n), mp=minMax(A.EP)[1]||1, mn=minMax(A.EN)[1]||1;
+          for(let i=0;i<n;i++) out[i]=0.5*(A.EP[i]/mp + 1 - A.EN[i]/mn);
+          return out;
+        }},
+      // Euclidean (E) and taxicab (T) distance from the negative-ideal solution on the SAW unit;
+      // prep takes its lowest unit value per plan (min/x is not monotone across 0, so no shortcut
+      // from the column's min and max)
+      CODAS:{views:["unit"], acc:{CE:0, CT:0},
+        prep(c, V, n){
+          if(c.uLo!==undefined) return;
+          const u=V.unit; let lo=Infinity;
+          for(let i=0;i<n;i++) if(u[i]<lo) lo=u[i];
+          c.uLo=lo;
+        },
+        add(A, V, c, lw, qw, n){
+          const u=V.unit, E=A.CE, T=A.CT;
+          for(let i=0;i<n;i++){ const d=u[i]-c.uLo; E[i]+=qw*d*d; T[i]+=lw*Math.abs(d); }
+        },
+        score:(A, n, s)=> codasScore(rootScaled(A.CE, s), scaled(A.CT, s))},
+      // v = w(t + 1) on the min-max value t (from the goal view: t = (y − 0.01)/0.99), minus the
+      // border approximation area g = w · geometric mean of (t + 1), which prep takes per plan
+      MABAC:{views:["goal"], acc:{MQ:0},
+        prep(c, V, n){
+          if(c.mabG!==undefined) return;
+          const y=V.goal; let s=0, k=0;
+          for(let i=0;i<n;i++){ const l=Math.log1p((y[i]-0.01)/0.99); if(isFinite(l)){ s+=l; k++; } }
+          c.mabG=Math.exp(s/(k||1));
+        },
+        add(A, V, c, lw, qw, n){
+          const y=V.goal, Q=A.MQ, g=c.mabG;
+          for(let i=0;i<n;i++) Q[i]+=lw*((y[i]-0.01)/0.99 + 1 - g);
+        },
+        score:(A, n, s)=> scaled(A.MQ, s)},
+      "PROMETHEE II":{views:["flow"], acc:{PF:0},
+        add(A, V, c, lw, qw, n){
+          const f=V.flow, P=A.PF, k=c.cost? -lw : lw;
+          for(let i=0;i<n;i++) P[i]+=k*f[i];
+        },
+        score:(A, n, s)=> scaled(A.PF, s/((n-1)||1))},
+    };
+    const ORDER=Object.keys(METHODS);
+    const LOWER_IS_BETTER={}; ORDER.forEach(k=>{ if(METHODS[k].lower) LOWER_IS_BETTER[k]=true; });
+
+    // CODAS relative assessment H_i = Σ_k (E_i − E_k) + ψ(E_i − E_k)·(T_i − T_k), ψ = 1 where
+    // |E_i − E_k| ≥ τ. Sorted by E, the k within τ of E_i are one window that slides along with
+    // i; prefix sums of T give the rest. O(n log n) instead of the n² pairs.
+    const CODAS_TAU=0.02;
+    function codasScore(E, T){
+      const n=E.length, idx=argsort(E, false), pre=new Float64Array(n+1), out=new Float64Array(n);
+      let sE=0; for(let i=0;i<n;i++) sE+=E[i];
+      for(let p=0;p<n;p++) pre[p+1]=pre[p]+T[idx[p]];
+      for(let p=0, lo=0, hi=0; p<n; p++){
+        const i=idx[p], e=E[i];
+        while(E[idx[lo]]<=e-CODAS_TAU) lo++;
+        while(hi<n && E[idx[hi]]<e+CODAS_TAU) hi++;
+        out[i]= n*e - sE + (n-(hi-lo))*T[i] - (pre[n]-pre[hi]+pre[lo]);
+      }
+      return out;
+    }
+
+    // ---------- runner ----------
+    // Scores of the methods in `names` for one weighting (w: raw weights by criterion index) over
+    // the plan's columns: per column, every view any of them reads is built once (views(c, name)),
+    // then each method adds its part. A holds the accumulators and may be reused from a previous
+    // run; A.scale = 1/Σw normalizes them. Summing raw weights keeps exact ties exact (PROMETHEE's
+    // integer flows, integer weights) and matches makeIncremental.
+    function runMethods(D, plan, w, names, views, A={}, progress=()=>{}){
+      const n=D.n, ms=names.map(k=> METHODS[k]), need=[...new Set(ms.flatMap(M=> M.views))];
+      let sum=0; for(let j=0;j<w.length;j++) sum+=w[j];
+      A.scale=1/sum;
+      ms.forEach(M=>{ for(const k in M.acc) (A[k] || (A[k]=new Float64Array(n))).fill(M.acc[k]); });
+      plan.forEach((c,j)=>{
+        const V={}; need.forEach(v=> V[v]=views(c, v));
+        ms.forEach(M=>{ if(M.prep) M.prep(c, V, n); M.add(A, V, c, w[j], w[j]*w[j], n); });
+        progress(0.75*(j+1)/plan.length, "Scoring "+D.crit[j]);
+      });
+      const out={}; names.forEach((k,p)=> out[k]=ms[p].score(A, n, A.scale));
+      return out;
+    }
+    // views into one scratch buffer per view, reused from column to column
+    function viewBuffers(D){
+      const buf={};
+      return (c, v)=> VIEWS[v](D, c, ()=> buf[v] || (buf[v]=new Float64Array(D.n)));
+    }
+    // the plan (memoized per-column constants) of a set of types and goals
+    const planOf=(D, types, ideals)=> D.crit.map((cr,j)=> syaiRange(D, columnPlan(D, j, types[cr]||"Benefit", ideals[cr])));
+    const runWith=(D, types, ideals, weights, wmode, names, A, progress)=>
+      runMethods(D, planOf(D, types, ideals), rawWeights(D.crit, weights, wmode), names, viewBuffers(D), A, progress);
+
+    // --------- SYAI (exact, per your working routine) ----------
+    function normalizeColumn_SYAI(vals, ctype, goal, r=reduceCol(vals)){
+      const {min,max}=r, R=max-min, n=vals.length, out=new Float64Array(n);
+      let xStar;
+      if(ctype==="Benefit") xStar=max;
+      else if(ctype==="Cost") xStar=min;
+      else {
+        const g=parseFloat(goal);
+        if(isFinite(g)) xStar=g;
+        else xStar=r.sumFinite/n;
+      }
+      if(Math.abs(R)<1e-12) return out.fill(1.0);
+      for(let i=0;i<n;i++) out[i]=Math.max(0.01, Math.min(1, 0.01 + (1-0.01)*(1-Math.abs(vals[i]-xStar)/R)));
+      return out;
+    }
+
+    // weighted column W = w·normalizeColumn_SYAI; D+ += A+ − W and D− += W − A− (A± = max/min of W)
+    function computeSYAI_exact(D, types, ideals, weights, wmode, beta){
+      const A={}; runWith(D, types, ideals, weights, wmode, ["SYAI"], A);
+      const Dp=scaled(A.SP, A.scale), Dm=scaled(A.SM, A.scale);
+      return {Dp, Dm, Close:syaiCloseness(Dp, Dm, beta)};
+    }
+
+    // ---------- SYAI β sweep ----------
+    // D+ and D- do not depend on β; only the closeness blend does. Given them, a whole grid
+    // of β values is G closeness vectors + G rankings, with no normalization/distance work.
+    function syaiCloseness(Dp, Dm, beta, out=new Float64Array(Dp.length)){
+      for(let i=0;i<Dp.length;i++){
+        const denom = beta*Dp[i] + (1-beta)*Dm[i] || Number.EPSILON;
+        out[i] = ((1-beta)*Dm[i])/denom;
+      }
+      return out;
+    }
+    // ranks[k*w+c] = rank of alternative i at β = k/steps, c = row[i] its cube column; lo/hi = its
+    // best/worst rank over the grid. Up to SWEEP_FULL_ROWS alternatives the cube has every one
+    // (row null, w = n). Past that it keeps only those that reach the top SWEEP_TOP somewhere on
+    // the grid (lo ≤ SWEEP_TOP, at most (steps+1)·SWEEP_TOP of them; a second pass of sorts fills
+    // their ranks), so a million rows hold a few MB instead of 404 bytes each. The chart's top 10
+    // at any β are among them.
+    const SWEEP_FULL_ROWS=20000, SWEEP_TOP=200;
+    function syaiBetaSweep(Dp, Dm, steps=100, progress=()=>{}){
+      const n=Dp.length, G=steps+1, C=new Float64Array(n), full=n<=SWEEP_FULL_ROWS;
+      const lo=new Int32Array(n).fill(n), hi=new Int32Array(n);
+      let row=null, w=n, ranks= full? new Int32Array(G*n) : null;
+      const pass=(visit, p0, p1)=>{
+        for(let k=0;k<G;k++){
+          visit(argsort(syaiCloseness(Dp, Dm, k/steps, C), true), k);
+          progress(p0+(p1-p0)*(k+1)/G, "β sweep");
+        }
+      };
+      pass((idx, k)=>{
+        const off=k*n;
+        for(let p=0;p<n;p++){
+          const i=idx[p], r=p+1;
+          if(full) ranks[off+i]=r;
+          if(r<lo[i]) lo[i]=r; if(r>hi[i]) hi[i]=r;
+        }
+      }, 0, full? 1 : 0.5);
+      if(!full){
+        row=new Int32Array(n).fill(-1); w=0;
+        for(let i=0;i<n;i++) if(lo[i]<=SWEEP_TOP) row[i]=w++;
+        ranks=new Int32Array(G*w);
+        pass((idx, k)=>{ const off=k*w; for(let p=0;p<n;p++){ const c=row[idx[p]]; if(c>=0) ranks[off+c]=p+1; } }, 0.5, 1);
+      }
+      return {steps, n, w, row, ranks, lo, hi};
+    }
+    // rank of alternative i at grid step k (also for the scenario cubes, which have no row map);
+    // 0 when the sweep kept no ranks for it
+    const sweepRank=(sw, k, i)=>{ const c= sw.row? sw.row[i] : i; return c<0? 0 : sw.ranks[k*(sw.w||sw.n)+c]; };
+    // widest grid interval around step k over which alternative i keeps its rank (null: not kept)
+    function stableInterval(sw, i, k){
+      if(sw.row && sw.row[i]<0) return null;
+      const r=sweepRank(sw, k, i); let a=k, b=k;
+      while(a>0 && sweepRank(sw, a-1, i)===r) a--;
+      while(b<sw.steps && sweepRank(sw, b+1, i)===r) b++;
+      return [a/sw.steps, b/sw.steps];
+    }
+    // SYAI tab: D+/D− and the β sweep, in the worker (101 sorts of n)
+    function syaiTask(D, a, progress=()=>{}){
+      progress(0, "D+ / D−");
+      const {Dp, Dm}=computeSYAI_exact(D, a.types, a.ideals, a.weights, a.wmode, 0.5);
+      return {syai:{Dp, Dm}, sweep:syaiBetaSweep(Dp, Dm, 100, (p, stage)=> progress(0.2+0.8*p, stage))};
+    }
+
+    // COBRA on its own (its registry entry)
+    function computeCOBRA(D, types, weights, wmode){
+      return runWith(D, types, {}, weights, wmode, ["COBRA"]).COBRA;
+    }
+
+    // every registered method from one run: each raw column is read once after the stats sweep
+    function compareAll(D, types, ideals, weights, wmode, progress=()=>{}){
+      return runWith(D, types, ideals, weights, wmode, ORDER, {}, progress);
+    }
+
+    // ranks (1 = best); typed index sort, ties keep input order
+    function argsort(a, desc){
+      if(a.length>=RADIX_MIN) return radixArgsort(a, desc);
+      const idx=new Uint32Array(a.length); for(let i=0;i<idx.length;i++) idx[i]=i;
+      return idx.sort(desc? (x,y)=> (a[y]-a[x]) || (x-y) : (x,y)=> (a[x]-a[y]) || (x-y));
+    }
+    // Same order as the comparison sort, in four stable LSD passes over 16-bit digits of the
+    // float bits (mapped so unsigned order is numeric order; all bits flipped when descending).
+    // Passes whose digit is the same for every key are skipped. 4-8x faster on large inputs.
+    const RADIX_MIN=16384;
+    function radixArgsort(a, desc){
+      const n=a.length, f=new Float64Array(n), w=new Uint32Array(f.buffer), flip=desc? 0xffffffff : 0;
+      for(let i=0;i<n;i++) f[i]=a[i]+0;   // -0 → +0, equal as in the comparison sort
+      let lo=new Uint32Array(n), hi=new Uint32Array(n), id=new Uint32Array(n);
+      let lo2=new Uint32Array(n), hi2=new Uint32Array(n), id2=new Uint32Array(n);
+      const C=new Uint32Array(4*65536);
+      for(let i=0;i<n;i++){
+        let l=w[2*i], h=w[2*i+1];
+        if(h>>>31){ l=~l; h=~h; } else h^=0x80000000;
+        l=(l^flip)>>>0; h=(h^flip)>>>0;
+        lo[i]=l; hi[i]=h; id[i]=i;
+        C[l&0xffff]++; C[65536+(l>>>16)]++; C[131072+(h&0xffff)]++; C[196608+(h>>>16)]++;
+      }
+      for(let p=0;p<4;p++){
+        const off=p*65536, src= p<2? lo : hi, sh=(p&1)*16;
+        let sum=0, skip=false;
+        for(let b=0;b<65536;b++){ const c=C[off+b]; if(c===n){ skip=true; break; } C[off+b]=sum; sum+=c; }
+        if(skip) continue;
+        for(let i=0;i<n;i++){ const k=C[off+((src[i]>>>sh)&0xffff)]++; lo2[k]=lo[i]; hi2[k]=hi[i]; id2[k]=id[i]; }
+        let t=lo; lo=lo2; lo2=t; t=hi; hi=hi2; hi2=t; t=id; id=id2; id2=t;
+      }
+      return id;
+    }
+    function ranksFrom(idx){ const rk=new Int32Array(idx.length); for(let k=0;k<idx.length;k++) rk[idx[k]]=k+1; return rk; }
+    const ranksHigher=(a)=> ranksFrom(argsort(a,true));
+    const ranksLower =(a)=> ranksFrom(argsort(a,false));
+
+    // ---------- top-K selection ----------
+    // The k best indices in rank order (ties keep input order) from a bounded heap whose root
+    // is the worst one kept: O(n log k) time, O(k) memory, no full sort.
+    function topK(a, k, desc){
+      const n=a.length; k=Math.max(0, Math.min(k, n));
+      const worse = desc? (x,y)=> a[x]<a[y] || (a[x]===a[y] && x>y) : (x,y)=> a[x]>a[y] || (a[x]===a[y] && x>y);
+      const h=new Uint32Array(k); let size=0;
+      const swap=(p,q)=>{ const t=h[p]; h[p]=h[q]; h[q]=t; };
+      function down(p){
+        for(;;){
+          const l=2*p+1, r=l+1; let w=p;
+          if(l<size && worse(h[l],h[w])) w=l;
+          if(r<size && worse(h[r],h[w])) w=r;
+          if(w===p) return; swap(p,w); p=w;
+        }
+      }
+      for(let i=0;i<n;i++){
+        if(size<k){
+          let p=size++; h[p]=i;
+          while(p>0){ const q=(p-1)>>1; if(!worse(h[p],h[q])) break; swap(p,q); p=q; }
+        } else if(k && worse(h[0], i)){ h[0]=i; down(0); }
+      }
+      const out=new Uint32Array(size);
+      for(let p=size-1;p>=0;p--){ out[p]=h[0]; h[0]=h[--size]; down(0); }
+      return out;
+    }
+    // ordinal rank of one alternative without sorting (O(n)); for ranks shown outside a top-K list
+    function rankOf(a, i, desc){
+      const v=a[i]; let r=1;
+      if(desc){ for(let j=0;j<a.length;j++) if(a[j]>v || (a[j]===v && j<i)) r++; }
+      else    { for(let j=0;j<a.length;j++) if(a[j]<v || (a[j]===v && j<i)) r++; }
+      return r;
+    }
+
+    // ---------- Spearman (average ranks for ties) ----------
+    // average ranks along an existing sort order of a (either direction)
+    function avgRanks(a, idx){
+      const r=new Float64Array(a.length); let i=0;
+      while(i<idx.length){
+        let j=i; while(j+1<idx.length && a[idx[j+1]]===a[idx[i]]) j++;
+        const avg=(i+j)/2 + 1; for(let k=i;k<=j;k++) r[idx[k]]=avg; i=j+1;
+      }
+      return r;
+    }
+    const rankArray=(a)=> avgRanks(a, argsort(a,false));
+    function pearson(x,y){
+      const n=x.length; let mx=0, my=0; for(let i=0;i<n;i++){ mx+=x[i]; my+=y[i]; } mx/=n; my/=n;
+      let num=0, dx=0, dy=0; for(let i=0;i<n;i++){ const a=x[i]-mx, b=y[i]-my; num+=a*b; dx+=a*a; dy+=b*b; }
+      return num/Math.sqrt((dx||1)*(dy||1));
+    }
+    // Z·Zᵀ for k vectors of length n, in row blocks so each block of all k stays in cache while
+    // the k(k-1)/2 off-diagonal dot products accumulate; the diagonal is given.
+    function gram(Z, diag){
+      const k=Z.length, n=k? Z[0].length : 0, B=4096, acc=new Float64Array(k*k);
+      for(let a=0;a<n;a+=B){
+        const b=Math.min(n, a+B);
+        for(let p=0;p<k;p++){
+          const zp=Z[p];
+          for(let q=p+1;q<k;q++){ const zq=Z[q]; let s=0; for(let i=a;i<b;i++) s+=zp[i]*zq[i]; acc[p*k+q]+=s; }
+        }
+      }
+      return Z.map((_,p)=> Z.map((_,q)=> p===q? diag[p] : acc[p<q? p*k+q : q*k+p]));
+    }
+    // Spearman ρ = Pearson on average ranks of the scores. Each method is ranked once (orders/desc
+    // reuse the argsorts already done for ranking; descending ones are flipped back) and scaled
+    // to zero mean, unit length in place: average ranks always have mean (n+1)/2, and flipping
+    // only negates the centred ranks. A constant vector correlates 0 with everything, itself too.
+    function spearmanMatrix(vectors, orders=null, desc=null){
+      const Z=vectors.map((v,k)=> orders? unitRanks(v, orders[k], desc[k]) : unitRanks(v));
+      return gram(Z, Z.map(z=> z.some(x=> x!==0)? 1 : 0));
+    }
+    function unitRanks(v, order=argsort(v, false), flip=false){
+      const r=avgRanks(v, order), n=r.length, mu=(n+1)/2;
+      let ss=0; for(let i=0;i<n;i++){ const d=r[i]-mu; r[i]=d; ss+=d*d; }
+      const f=(flip? -1 : 1)/Math.sqrt(ss||1); for(let i=0;i<n;i++) r[i]*=f;
+      return r;
+    }
+
+    // ---------- Kendall τ-b, O(n log n) ----------
+    // Sorts a ascending in place and returns its number of inversions: insertion sort on runs
+    // of 16 (each shift is one inversion), then bottom-up merges that count, for every element
+    // taken from the right half, the left-half elements it passes.
+    function sortInversions(a){
+      const n=a.length, R=16; let swaps=0;
+      for(let lo=0;lo<n;lo+=R){
+        const hi=Math.min(n, lo+R);
+        for(let i=lo+1;i<hi;i++){ const v=a[i]; let j=i-1; while(j>=lo && a[j]>v){ a[j+1]=a[j]; j--; } swaps+=i-1-j; a[j+1]=v; }
+      }
+      let src=a, dst=new Float64Array(n);
+      for(let w=R; w<n; w*=2){
+        for(let lo=0;lo<n;lo+=2*w){
+          const mid=Math.min(lo+w, n), hi=Math.min(lo+2*w, n); let i=lo, j=mid, k=lo;
+          while(i<mid && j<hi){ if(src[j]<src[i]){ dst[k++]=src[j++]; swaps+=mid-i; } else dst[k++]=src[i++]; }
+          while(i<mid) dst[k++]=src[i++];
+          while(j<hi) dst[k++]=src[j++];
+        }
+        const t=src; src=dst; dst=t;
       }
-      i++;
+      if(src!==a) a.set(src);
+      return swaps;
+    }
+    // pairs within runs of equal a[idx[·]]
+    function tiedPairs(a, idx){
+      let t=0;
+      for(let i=0;i<idx.length;){ let j=i+1; while(j<idx.length && a[idx[j]]===a[idx[i]]) j++; t+=(j-i)*(j-i-1)/2; i=j; }
+      return t;
+    }
+    // Knight's algorithm: walk x in ascending order with ties broken by y, so the discordant
+    // pairs are exactly the inversions of the y sequence. ox: an existing argsort of x, ascending.
+    function kendallTau(x, y, ox=null){
+      const n=x.length, n0=n*(n-1)/2;
+      const idx= ox? Uint32Array.from(ox) : argsort(x, false);
+      let n1=0, n3=0;
+      for(let i=0;i<n;){
+        let j=i+1; while(j<n && x[idx[j]]===x[idx[i]]) j++;
+        if(j-i>1){
+          n1+=(j-i)*(j-i-1)/2;
+          const run=idx.subarray(i, j); run.sort((p,q)=> y[p]-y[q]);
+          n3+=tiedPairs(y, run);
+        }
+        i=j;
+      }
+      const ys=new Float64Array(n); for(let i=0;i<n;i++) ys[i]=y[idx[i]];
+      const swaps=sortInversions(ys);
+      let n2=0;
+      for(let i=0;i<n;){ let j=i+1; while(j<n && ys[j]===ys[i]) j++; n2+=(j-i)*(j-i-1)/2; i=j; }
+      const den=Math.sqrt((n0-n1)*(n0-n2));
+      return den>0? (n0-n1-n2+n3-2*swaps)/den : 0;
+    }
+    // τ-b between every pair of score vectors, reusing argsorts like spearmanMatrix (descending
+    // ones are reversed into ascending ones).
+    function kendallMatrix(vectors, orders=null, desc=null, progress=()=>{}){
+      const k=vectors.length;
+      const asc=vectors.map((v,p)=> !orders? argsort(v, false) : desc[p]? orders[p].slice().reverse() : orders[p]);
+      const R=vectors.map((v,p)=> vectors.map((_,q)=> p===q && tiedPairs(v, asc[p])<v.length*(v.length-1)/2? 1 : 0));
+      let done=0;
+      for(let p=0;p<k;p++) for(let q=p+1;q<k;q++){
+        R[p][q]=R[q][p]= kendallTau(vectors[p], vectors[q], asc[p]);
+        progress(0.9 + 0.1*(++done)/(k*(k-1)/2), "Kendall τ");
+      }
+      return R;
+    }
+
+    // ---------- incremental Comparison ----------
+    // Every per-alternative accumulator of a registered method is a sum over criteria of a term
+    // that is linear (or, for squared distances, quadratic) in that criterion's raw weight;
+    // normalizing the weights is one common factor applied at the end. So editing one weight or
+    // one type swaps a single column's contribution: O(n) instead of rebuilding all O(n·m) columns.
+    // Column statistics are swept once per dataset; the per-(type, goal) constants that stand in
+    // for the normalized columns are cached. A row max (VIKOR's R) cannot be subtracted, so only
+    // rows whose maximum came from the edited column are rescanned. Subtracting contributions
+    // drifts by ulps, so the accumulators are rebuilt from scratch once m columns have been swapped.
+    function makeIncremental(D){
+      const n=D.n, m=D.m, X=D.X, A={}, views=viewBuffers(D);
+      const ms=ORDER.map(k=> METHODS[k]), need=[...new Set(ms.flatMap(M=> M.views))];
+      const maxes=ms.filter(M=> M.rowMax).map(M=> ({...M.rowMax, at:new Int32Array(n)}));   // at: column holding each row's max
+      const specs=new Array(m).fill(null), raw=new Float64Array(m);
+      let swaps=0;
+      const consts=(j, t, goal)=> syaiRange(D, columnPlan(D, j, t, goal));
+
+      // add sgn × column j's contribution (row maxes are left to the caller)
+      function apply(j, c, r, sgn){
+        if(r===0) return;
+        const V={}; need.forEach(v=> V[v]=views(c, v));
+        ms.forEach(M=>{ if(M.prep) M.prep(c, V, n); M.add(A, V, c, sgn*r, r*r*sgn, n); });
+      }
+      function rescan(mx, i){
+        let best=-Infinity, arg=0;
+        for(let k=0;k<m;k++){ const y=raw[k]*mx.term(specs[k], X[k*n+i]); if(y>best){ best=y; arg=k; } }
+        A[mx.acc][i]=best; mx.at[i]=arg;
+      }
+      function rebuild(){
+        ms.forEach(M=>{ for(const k in M.acc) (A[k] || (A[k]=new Float64Array(n))).fill(M.acc[k]); });
+        for(let j=0;j<m;j++) apply(j, specs[j], raw[j], 1);
+        maxes.forEach(mx=>{ for(let i=0;i<n;i++) rescan(mx, i); });
+        swaps=0;
+      }
+      function swap(j, c, r){
+        apply(j, specs[j], raw[j], -1);
+        specs[j]=c; raw[j]=r;
+        apply(j, c, r, 1);
+        const v=col(D,j);
+        maxes.forEach(mx=>{
+          const R=A[mx.acc], at=mx.at;
+          for(let i=0;i<n;i++){
+            const y=r*mx.term(c, v[i]);
+            if(y>=R[i]){ R[i]=y; at[i]=j; }
+            else if(at[i]===j) rescan(mx, i);
+          }
+        });
+        swaps++;
+      }
+
+      function finalize(){
+        let s=0; for(let j=0;j<m;j++) s+=raw[j];
+        const out={}; ORDER.forEach((k,p)=> out[k]=ms[p].score(A, n, 1/s));
+        return out;
+      }
+
+      // Bring the state to these inputs and return the compareAll() scores.
+      function update(a, progress=()=>{}){
+        const r=rawWeights(D.crit, a.weights, a.wmode);
+        const next=D.crit.map((c,j)=> consts(j, a.types[c]||"Benefit", a.ideals[c]));
+        if(specs[0]===null){
+          for(let j=0;j<m;j++){ specs[j]=next[j]; raw[j]=r[j]; }
+          progress(0.1, "Building columns");
+          rebuild();
+        } else {
+          const changed=[]; for(let j=0;j<m;j++) if(next[j]!==specs[j] || r[j]!==raw[j]) changed.push(j);
+          if(swaps+changed.length>m){
+            for(let j=0;j<m;j++){ specs[j]=next[j]; raw[j]=r[j]; }
+            rebuild();
+          } else changed.forEach((j,k)=>{ swap(j, next[j], r[j]); progress(0.7*(k+1)/changed.length, "Updating "+D.crit[j]); });
+        }
+        return finalize();
+      }
+      return {update};
+    }
+
+    // ---------- whole Comparison run (what the worker executes) ----------
+    // `state` persists per dataset (in the worker, or the page when computing inline);
+    // with it, runs after the first only redo the criteria whose type/goal/weight changed.
+    // a.topK > 0 returns only each method's best topK (heap selection) and skips the full
+    // sorts; spearmanTask supplies full ranks + Spearman when those are asked for.
+    // Otherwise one argsort per method serves the ranks, the table and Spearman.
+    function compareTask(D, a, progress=()=>{}, state=null){
+      const methods= state? (state.inc || (state.inc=makeIncremental(D))).update(a, progress)
+                          : compareAll(D, a.types, a.ideals, a.weights, a.wmode, progress);
+      const K=a.topK|0;
+      if(K>0 && K<D.n){
+        progress(0.8, "Top "+K);
+        const top={}; ORDER.forEach(m=> top[m]=topK(methods[m], K, !LOWER_IS_BETTER[m]));
+        return {methods, top};
+      }
+      progress(0.8, "Ranking");
+      const orders={}, ranks={};
+      ORDER.forEach(m=>{ orders[m]=argsort(methods[m], !LOWER_IS_BETTER[m]); ranks[m]=ranksFrom(orders[m]); });
+      progress(0.9, "Spearman");
+      const spearman=spearmanMatrix(...correlationArgs(methods, orders));
+      return {methods, orders, ranks, spearman};
+    }
+    const correlationArgs=(methods, orders)=> [ORDER.map(m=> methods[m]), ORDER.map(m=> orders[m]), ORDER.map(m=> !LOWER_IS_BETTER[m])];
+    const spearmanTask=(D, a, progress, state)=> compareTask(D, {...a, topK:0}, progress, state);
+
+    // ---------- scenario batch ----------
+    // Many scenarios {name, types, ideals, weights, wmode} on one dataset. A criterion's views
+    // depend on (column, type, goal) only, never on the weights, so each distinct one is built once
+    // per batch; a scenario is then every method's weighted adds over those arrays. Views of plans
+    // used by 2+ scenarios are kept while they fit TERMS_BUDGET bytes (8n per view, an upper
+    // bound: x and flow are not copies); the others go through scratch buffers.
+    const TERMS_BUDGET=256<<20;
+    // Rank cube: ranks[m][k*n+i] = rank of alternative i under method m in scenario k (the
+    // syaiBetaSweep layout, one per method), with lo/hi = best/worst rank over the scenarios,
+    // first = how many scenarios rank it 1st, agree[k] = Spearman ρ of scenario k vs the first.
+    function scenarioTask(D, a, progress=()=>{}){
+      const list=a.scenarios, S=list.length, n=D.n;
+      const plans=list.map(s=> planOf(D, s.types, s.ideals));
+      const uses=new Map();   // plans are memoized per (column, type, goal): the object is the key
+      plans.forEach(p=> p.forEach(c=> uses.set(c, (uses.get(c)||0)+1)));
+      const per=8*n*new Set(ORDER.flatMap(k=> METHODS[k].views)).size, keep=new Set(); let bytes=0;
+      [...uses].filter(([,k])=> k>1).sort((x,y)=> y[1]-x[1]).forEach(([c])=>{ if(bytes+per<=TERMS_BUDGET){ keep.add(c); bytes+=per; } });
+      const cache=new Map(), scratch=viewBuffers(D);
+      const views=(c, v)=>{
+        if(!keep.has(c)) return scratch(c, v);
+        let t=cache.get(c); if(!t) cache.set(c, t={});
+        return t[v] || (t[v]=VIEWS[v](D, c, ()=> new Float64Array(n)));
+      };
+      const ranks={}, lo={}, hi={}, first={}, agree={}, z0={};
+      ORDER.forEach(m=>{
+        ranks[m]=new Int32Array(S*n); lo[m]=new Int32Array(n).fill(n); hi[m]=new Int32Array(n);
+        first[m]=new Int32Array(n); agree[m]=new Float64Array(S);
+      });
+      const acc={};   // accumulator buffers, reused across scenarios
+      list.forEach((s,k)=>{
+        const methods=runMethods(D, plans[k], rawWeights(D.crit, s.weights, s.wmode), ORDER, views, acc), off=k*n;
+        ORDER.forEach(m=>{
+          const v=methods[m], idx=argsort(v, !LOWER_IS_BETTER[m]), R=ranks[m], L=lo[m], H=hi[m];
+          for(let p=0;p<n;p++){ const i=idx[p], r=p+1; R[off+i]=r; if(r<L[i]) L[i]=r; if(r>H[i]) H[i]=r; }
+          if(n) first[m][idx[0]]++;
+          const z=unitRanks(v, idx, !LOWER_IS_BETTER[m]);
+          if(!k) z0[m]=z;
+          let dot=0; for(let i=0;i<n;i++) dot+=z0[m][i]*z[i];
+          agree[m][k]=dot;
+        });
+        progress((k+1)/S, s.name);
+      });
+      return {names:list.map(s=> s.name), n, S, ranks, lo, hi, first, agree};
+    }
+    // only the matrix goes back: the page already holds the scores
+    function kendallTask(D, a, progress, state){
+      const {methods, orders}=compareTask(D, {...a, topK:0}, (p, stage)=> progress(0.9*p, stage), state);
+      return {kendall: kendallMatrix(...correlationArgs(methods, orders), progress)};
+    }
+
+    return {parseCSVText, toNum, toMatrix, col, minMax, reduceCol, vectorNorm, sawUnit, computeWeights, rawWeights, computeU, columnStats, columnPlan,
+            METHODS, VIEWS, runMethods, viewBuffers, planOf, prefFlow, codasScore,
+            normalizeColumn_SYAI, computeSYAI_exact, syaiCloseness, syaiBetaSweep, sweepRank, stableInterval, syaiTask, computeCOBRA, compareAll, argsort, ranksHigher, ranksLower,
+            ORDER, LOWER_IS_BETTER, makeIncremental, topK, rankOf, avgRanks, rankArray, pearson, gram, spearmanMatrix,
+            sortInversions, kendallTau, kendallMatrix, compareTask, spearmanTask, kendallTask,
+            radixArgsort, scenarioTask};
+  }
+  const K = SYAIKernels();
+  const {parseCSVText, toMatrix, syaiCloseness, sweepRank, stableInterval, argsort,
+         ORDER, LOWER_IS_BETTER} = K;
+  // the method pickers and the tab title follow the kernels' registry
+  [["cmpRankBy","SYAI"], ["scnMethod","SYAI"], ["mmc_x","SYAI"], ["mmc_y","TOPSIS"]].forEach(([id, pick])=>{
+    const sel=$(id);
+    ORDER.forEach(m=>{ const o=document.createElement("option"); o.value=m; o.textContent=m; sel.appendChild(o); });
+    sel.value=pick;
+  });
+  $("tabCompare").textContent="Comparison ("+ORDER.join(", ")+")";
+  let dataSeq=0;   // identifies a parsed dataset (D.key) so the worker receives it only once
+
+  // ================= COMPUTE WORKER =================
+  // Built from SYAIKernels' own source through a Blob URL, so it ships inside this single page.
+  // One job at a time: starting a new run terminates the in-flight one (cancellation).
+  function workerMain(){
+    const K = SYAIKernels();
+    let D = null, state = null;   // state: per-dataset caches kept between runs (incremental engine)
+    self.onmessage = (e)=>{
+      const msg = e.data;
+      if(msg.type==="load"){ D = msg.D; state = {}; return; }
+      try{
+        if(!D || D.key!==msg.key) throw new Error("dataset not loaded");
+        const out = K[msg.task](D, msg.args, (p, stage)=> self.postMessage({id:msg.id, type:"progress", p, stage}), state);
+        const transfer = [];
+        ["methods","ranks","orders","top","lo","hi","first","agree","syai","sweep"].forEach(k=>{ if(out[k]) Object.values(out[k]).forEach(a=>{ if(a && a.buffer) transfer.push(a.buffer); }); });
+        self.postMessage({id:msg.id, type:"done", out}, transfer);
+      }catch(err){
+        self.postMessage({id:msg.id, type:"error", message:String(err && err.message || err)});
+      }
+    };
+  }
+
+  const Compute = (()=>{
+    let url=null, worker=null, loadedKey=null, job=null, seq=0, pending=null;
+    const inline=new WeakMap();   // dataset -> state, when computing without a worker
+    function spawn(){
+      if(!url) url = URL.createObjectURL(new Blob([SYAIKernels.toString()+"\n("+workerMain.toString()+")();"], {type:"text/javascript"}));
+      worker = new Worker(url); loadedKey = null;
+      worker.onmessage = (e)=>{
+        const m=e.data; if(!job || m.id!==job.id) return;
+        if(m.type==="progress"){ job.onProgress(m.p, m.stage); return; }
+        const j=job; job=null;
+        if(m.type==="done") j.resolve(m.out); else j.reject(new Error(m.message));
+        if(pending){ const p=pending; pending=null; start(p); }
+      };
+      worker.onerror = (e)=>{
+        e.preventDefault(); const j=job; job=null; kill(); if(j) j.reject(new Error(e.message||"worker failed"));
+        if(pending){ const p=pending; pending=null; start(p); }
+      };
+    }
+    function kill(){ if(worker){ worker.terminate(); worker=null; loadedKey=null; } }
+    function drop(){ if(pending){ pending.reject({cancelled:true}); pending=null; } }
+    function cancel(){
+      drop();
+      if(!job) return;
+      const j=job; job=null; kill(); j.reject({cancelled:true});
+    }
+    function start(r){
+      try{
+        if(!worker) spawn();
+        if(loadedKey!==r.D.key){ worker.postMessage({type:"load", D:{key:r.D.key, crit:r.D.crit, n:r.D.n, m:r.D.m, X:r.D.X}}); loadedKey=r.D.key; }
+        job = {id:++seq, resolve:r.resolve, reject:r.reject, onProgress:r.onProgress};
+        worker.postMessage({type:"run", id:job.id, task:r.task, key:r.D.key, args:r.args});
+      }catch(err){
+        // no Worker/Blob support (or blocked): compute inline
+        kill(); job=null;
+        if(!inline.has(r.D)) inline.set(r.D, {});
+        try{ r.resolve(K[r.task](r.D, r.args, r.onProgress, inline.get(r.D))); }catch(e2){ r.reject(e2); }
+      }
+    }
+    const request=(task, D, args, onProgress, how)=> new Promise((resolve, reject)=> how({task, D, args, onProgress, resolve, reject}));
+    // run(): start now, terminating whatever is in flight (explicit Run clicks).
+    const run=(task, D, args, onProgress=()=>{})=> request(task, D, args, onProgress, r=>{ cancel(); start(r); });
+    // latest(): for live edits — let the current job finish (keeping the worker's caches warm)
+    // and queue only the newest request; superseded ones reject with {cancelled:true}.
+    const latest=(task, D, args, onProgress=()=>{})=> request(task, D, args, onProgress, r=>{ drop(); if(job) pending=r; else start(r); });
+    return {run, latest, cancel, drop, busy:()=> !!job};
+  })();
+
+  // Identifies a dataset (by content) + the scoring inputs that matter: goals for Ideal columns
+  // only, weights in Custom mode only. Keys the memoized results of both tabs, in memory and
+  // in ResultStore.
+  function specKey(D, types, ideals, weights, wmode){
+    const spec=D.crit.map(c=>{
+      const t=types[c]||"Benefit";
+      return [t, t==="Ideal (Goal)"? String(ideals[c]??"") : "", wmode==="custom"? String(weights[c]??"") : ""];
+    });
+    return D.hash+"|"+hashText(wmode+"|"+JSON.stringify(spec));
+  }
+
+  // ================= SAVED PROFILES & RESULT STORE =================
+  // 64-bit content hashes (two 32-bit multiply-xor lanes, cyrb53 finalizer) as hex.
+  function hashMix(h1, h2){
+    h1=Math.imul(h1^(h1>>>16), 2246822507) ^ Math.imul(h2^(h2>>>13), 3266489909);
+    h2=Math.imul(h2^(h2>>>16), 2246822507) ^ Math.imul(h1^(h1>>>13), 3266489909);
+    return (h2>>>0).toString(16).padStart(8,"0")+(h1>>>0).toString(16).padStart(8,"0");
+  }
+  function hashText(s, h1=0xdeadbeef, h2=0x41c6ce57, mix=true){
+    for(let i=0;i<s.length;i++){ const c=s.charCodeAt(i); h1=Math.imul(h1^c, 2654435761); h2=Math.imul(h2^c, 1597334677); }
+    return mix? hashMix(h1, h2) : [h1, h2];
+  }
+  // The parsed matrix, not the file text: the same data with other quoting or line endings
+  // hashes the same. X is read as raw 32-bit words.
+  function contentHash(D){
+    let [h1, h2]=hashText(D.crit.join("\x1f")+"\x1e"+D.names.join("\x1f"), 0xdeadbeef, 0x41c6ce57, false);
+    const w=new Uint32Array(D.X.buffer, D.X.byteOffset, D.X.length*2);
+    for(let i=0;i<w.length;i++){ const c=w[i]; h1=Math.imul(h1^c, 2654435761); h2=Math.imul(h2^c, 1597334677); }
+    return hashMix(h1, h2);
+  }
+
+  // Named settings per dataset schema (its set of criterion names) in localStorage; the last one
+  // used is restored when a file with the same criteria is loaded again. A profile holds whatever
+  // either tab saved into it: types, ideals, wmode, weights, beta, topK, rankBy, x, y.
+  const Profiles = (()=>{
+    const KEY="syai-rank:profiles";
+    const load=()=>{ try{ return JSON.parse(localStorage.getItem(KEY)||"{}"); }catch(e){ return {}; } };
+    const save=(all)=>{ try{ localStorage.setItem(KEY, JSON.stringify(all)); }catch(e){} };
+    const schema=(D)=> JSON.stringify([...D.crit].sort());
+    const entry=(all, D)=> all[schema(D)] || (all[schema(D)]={saved:{}, last:null});
+    return {
+      names(D){ return Object.keys(entry(load(), D).saved).sort(); },
+      get(D, name){ return entry(load(), D).saved[name]; },
+      last(D){ const e=entry(load(), D); return e.last && e.saved[e.last]? e.last : null; },
+      use(D, name){ const all=load(); entry(all, D).last=name; save(all); },
+      put(D, name, p){ const all=load(), e=entry(all, D); e.saved[name]={...e.saved[name], ...p}; e.last=name; save(all); },
+      remove(D, name){ const all=load(), e=entry(all, D); delete e.saved[name]; if(e.last===name) e.last=null; save(all); },
+    };
+  })();
+
+  // Computed results in IndexedDB, keyed "<kind>|<specKey>" (content hash + settings hash).
+  // Least recently used entries go once the total passes BUDGET bytes. Without IndexedDB
+  // (or if it fails) get() resolves undefined and put() does nothing.
+  const ResultStore = (()=>{
+    const BUDGET=256<<20, MAX_ENTRIES=200;
+    let dbp=null;
+    function db(){
+      if(!dbp) dbp=new Promise((resolve, reject)=>{
+        const r=indexedDB.open("syai-rank", 1);
+        r.onupgradeneeded=()=>{ r.result.createObjectStore("results"); r.result.createObjectStore("meta"); };
+        r.onsuccess=()=> resolve(r.result); r.onerror=()=> reject(r.error);
+      }).catch(()=> null);
+      return dbp;
+    }
+    const done=(req)=> new Promise((resolve, reject)=>{ req.onsuccess=()=> resolve(req.result); req.onerror=()=> reject(req.error); });
+    function bytes(v){
+      if(ArrayBuffer.isView(v)) return v.byteLength;
+      if(v && typeof v==="object"){ let b=0; for(const k in v) b+=bytes(v[k]); return b+16; }
+      return 8;
+    }
+    async function get(kind, key){
+      try{
+        const d=await db(); if(!d) return undefined;
+        const tx=d.transaction(["results","meta"], "readwrite"), k=kind+"|"+key;
+        const v=await done(tx.objectStore("results").get(k));
+        if(v!==undefined){ const m=await done(tx.objectStore("meta").get(k)); if(m){ m.used=Date.now(); tx.objectStore("meta").put(m, k); } }
+        return v;
+      }catch(e){ return undefined; }
+    }
+    async function put(kind, key, value){
+      try{
+        const d=await db(); if(!d) return;
+        const tx=d.transaction(["results","meta"], "readwrite"), k=kind+"|"+key, meta=tx.objectStore("meta");
+        tx.objectStore("results").put(value, k);
+        meta.put({bytes:bytes(value), used:Date.now()}, k);
+        const [keys, vals]=await Promise.all([done(meta.getAllKeys()), done(meta.getAll())]);
+        const order=keys.map((k,i)=> [k, vals[i]]).sort((a,b)=> b[1].used-a[1].used);
+        let total=0;
+        order.forEach(([k2, m], i)=>{
+          total+=m.bytes;
+          if(i>0 && (total>BUDGET || i>=MAX_ENTRIES)){ tx.objectStore("results").delete(k2); meta.delete(k2); }
+        });
+      }catch(e){}
     }
-    pushCell(); if(row.length>1 || row[0] !== "") pushRow();
-    return rows;
+    return {get, put};
+  })();
+
+  // Profile picker for one tab: read() gives its current settings, apply(p) loads a profile.
+  function wireProfiles(n, getD, read, apply){
+    const sel=$("prof"+n), name=$("profName"+n);
+    function list(current){
+      sel.innerHTML="";
+      const none=document.createElement("option"); none.value=""; none.textContent="(not saved)"; sel.appendChild(none);
+      Profiles.names(getD()).forEach(k=>{ const o=document.createElement("option"); o.value=k; o.textContent=k; sel.appendChild(o); });
+      sel.value=current||"";
+    }
+    sel.onchange=()=>{ const p=sel.value && Profiles.get(getD(), sel.value); if(p){ Profiles.use(getD(), sel.value); apply(p); } };
+    $("profSave"+n).onclick=()=>{
+      const nm=(name.value.trim() || sel.value || "default");
+      Profiles.put(getD(), nm, read()); name.value=""; list(nm);
+    };
+    $("profDel"+n).onclick=()=>{ if(sel.value){ Profiles.remove(getD(), sel.value); list(""); } };
+    // on a new dataset: list its profiles and re-apply the one used last
+    return ()=>{ const last=Profiles.last(getD()); list(last); if(last) apply(Profiles.get(getD(), last)); };
+  }
+  // copy a profile's per-criterion values onto a tab's dicts (only criteria this dataset has)
+  function applyCriteria(D, p, types, ideals, weights){
+    D.crit.forEach(c=>{
+      if(p.types && p.types[c]) types[c]=p.types[c];
+      if(p.ideals && p.ideals[c]!=null) ideals[c]=p.ideals[c];
+      if(p.weights && p.weights[c]!=null) weights[c]=p.weights[c];
+    });
   }
-  const toNum=(v)=>{ const x=parseFloat(String(v).replace(/,/g,"")); return isFinite(x)?x:NaN; };
-  const vectorNorm=(vals)=>{ const d=Math.sqrt(vals.reduce((s,v)=>s+(v*v),0))||1; return vals.map(v=>v/d); };
-
-  // ---------- SAW utilities ----------
-  function sawUnit(vals, type="Benefit", goal=null){
-    const max=Math.max(...vals), min=Math.min(...vals);
-    if(type==="Benefit"){
-      const M = max || 1; return vals.map(x=> (x)/(M||1));
-    }
-    if(type==="Cost"){
-      const m = min || 1; return vals.map(x=> (m)/(x||1));
-    }
-    // Ideal (Goal)
-    const R=(max-min)||1;
-    const g = isFinite(parseFloat(goal))? parseFloat(goal) : (min+max)/2;
-    return vals.map(x=> Math.max(0, 1 - Math.abs(x-g)/R ));
+  function setWmode(n, mode){
+    $("w"+n+"eq").checked= mode!=="custom"; $("w"+n+"c").checked= mode==="custom";
+    $("wg"+n).style.display= mode==="custom"? "" : "none";
   }
 
   // ================= TAB 1: SYAI =================
-  let c1=[], r1=[], crit1=[], type1={}, ideal1={}, w1={}, wmode1='equal', beta1=0.5;
-  $("beta1").oninput = ()=>{ beta1=parseFloat($("beta1").value); $("beta1v").textContent=beta1.toFixed(2); };
+  let D1=null, type1={}, ideal1={}, w1={}, wmode1='equal', beta1=0.5;
+  let syai1=null;   // {key, Dp, Dm, sweep} of the last Run; dragging β re-ranks from it
+  $("beta1").oninput = ()=>{
+    beta1=parseFloat($("beta1").value); $("beta1v").textContent=beta1.toFixed(2);
+    if(syai1 && syai1.key===specKey(D1, type1, ideal1, w1, wmode1)) renderSYAI();
+  };
   $("w1eq").onchange = ()=>{ wmode1='equal'; $("wg1").style.display="none"; };
   $("w1c").onchange  = ()=>{ wmode1='custom'; $("wg1").style.display=""; };
   $("csv1").onchange = (e)=>{ const f=e.target.files[0]; if(!f) return; const r=new FileReader(); r.onload=()=>initSYAI(String(r.result)); r.readAsText(f); };
 
   function initSYAI(txt){
     const arr=parseCSVText(txt); if(!arr.length) return;
-    c1 = arr[0].map(x=> String(x??"").trim());
-    if(c1[0] !== "Alternative"){
-      const idx = c1.indexOf("Alternative");
-      if(idx>0){ const nm=c1.splice(idx,1)[0]; c1.unshift(nm); } else c1[0]="Alternative";
-    }
-    crit1 = c1.slice(1);
-    r1 = arr.slice(1).filter(r=>r.length>=c1.length).map(r=>{ const o={}; c1.forEach((c,i)=> o[c]=r[i]); return o; });
-    type1  = Object.fromEntries(crit1.map(c=>[c,"Benefit"]));
-    ideal1 = Object.fromEntries(crit1.map(c=>[c,""]));
-    w1     = Object.fromEntries(crit1.map(c=>[c,1]));
-    renderMatrix("tblm1", c1, r1);
-    renderTypes("types1", crit1, type1, ideal1);
-    renderWeights("wg1", crit1, w1);
+    D1 = toMatrix(arr); D1.key = ++dataSeq; D1.hash = contentHash(D1); syai1=null;
+    type1  = Object.fromEntries(D1.crit.map(c=>[c,"Benefit"]));
+    ideal1 = Object.fromEntries(D1.crit.map(c=>[c,""]));
+    w1     = Object.fromEntries(D1.crit.map(c=>[c,1]));
+    renderMatrix("tblm1", D1);
+    renderTypes("types1", D1.crit, type1, ideal1);
+    renderWeights("wg1", D1.crit, w1);
+    restoreProfile1();
     show($("m1"),true); show($("t1"),true); show($("w1"),true); show($("b1"),true); show($("r1"),false);
   }
-
-  $("runSYAI").onclick = ()=>{
-    if(!r1.length) return;
-    const res = computeSYAI_exact(r1, crit1, type1, ideal1, w1, wmode1, beta1)
-                 .map(o=> ({Alternative:o.alt, Dp:o.Dp, Dm:o.Dm, Close:o.Close}));
-    res.sort((a,b)=> b.Close-a.Close);
-    res.forEach((r,i)=> r.Rank = i+1);
-
-    const tb=$("tblr1"); tb.innerHTML="";
-    const thead=document.createElement("thead"); thead.innerHTML="<tr><th>Alternative</th><th>D+</th><th>D-</th><th>Closeness</th><th>Rank</th></tr>"; tb.appendChild(thead);
-    const tbody=document.createElement("tbody");
-    res.forEach(r=>{
-      const tr=document.createElement("tr");
-      tr.innerHTML = `<td>${r.Alternative}</td><td>${r.Dp.toFixed(6)}</td><td>${r.Dm.toFixed(6)}</td><td>${r.Close.toFixed(6)}</td><td>${r.Rank}</td>`;
-      tbody.appendChild(tr);
+  const restoreProfile1 = wireProfiles("1", ()=> D1,
+    ()=> ({types:{...type1}, ideals:{...ideal1}, weights:{...w1}, wmode:wmode1, beta:beta1}),
+    (p)=>{
+      applyCriteria(D1, p, type1, ideal1, w1);
+      if(p.wmode){ wmode1=p.wmode; setWmode("1", wmode1); }
+      if(p.beta!=null){ beta1=+p.beta; $("beta1").value=beta1; $("beta1v").textContent=beta1.toFixed(2); }
+      renderTypes("types1", D1.crit, type1, ideal1);
+      renderWeights("wg1", D1.crit, w1);
     });
-    tb.appendChild(tbody);
+
+  // D+/D- and the β sweep come from ResultStore when this dataset + settings were run before,
+  // otherwise from syaiTask in the Compute worker.
+  let syaiReq=0;
+  function setSyaiStatus(text, p){
+    $("syaiStatus").textContent = text;
+    const bar=$("syaiProg"); show(bar, p!=null); if(p!=null) bar.value=p;
+  }
+  $("runSYAI").onclick = async ()=>{
+    if(!D1 || !D1.n) return;
+    const key=specKey(D1, type1, ideal1, w1, wmode1), req=++syaiReq;
+    if(!syai1 || syai1.key!==key){
+      const stored=await ResultStore.get("syai", key);
+      if(req!==syaiReq) return;
+      if(stored) syai1={key, ...stored};
+      else {
+        setSyaiStatus("Computing…", 0);
+        let out;
+        try{
+          out=await Compute.run("syaiTask", D1, {types:{...type1}, ideals:{...ideal1}, weights:{...w1}, wmode:wmode1},
+                                (p, stage)=> setSyaiStatus("Computing… "+stage, p));
+        }catch(err){
+          if(!(err && err.cancelled) && req===syaiReq) setSyaiStatus("⚠️ "+(err && err.message || err), null);
+          return;
+        }
+        if(req!==syaiReq) return;
+        setSyaiStatus("", null);
+        syai1 = {key, Dp:out.syai.Dp, Dm:out.syai.Dm, sweep:out.sweep};
+        ResultStore.put("syai", key, {Dp:syai1.Dp, Dm:syai1.Dm, sweep:syai1.sweep});
+      }
+    }
+    renderSYAI();
+  };
+
+  function renderSYAI(){
+    const {Dp, Dm, sweep}=syai1, n=D1.n;
+    const Close = syaiCloseness(Dp, Dm, beta1);
+    const k = Math.round(beta1*sweep.steps);
+    const ranks = (k/sweep.steps===beta1 && !sweep.row)? sweep.ranks.subarray(k*n, (k+1)*n) : K.ranksHigher(Close);
+    const idx = new Uint32Array(n); for(let i=0;i<n;i++) idx[ranks[i]-1]=i;
+    const res = Array.from(idx, (i,p)=> ({Alternative:D1.names[i], Close:Close[i], Rank:p+1}));
+    const interval=(i)=> stableInterval(sweep, i, k);   // null past the sweep's kept rows
+    vtable("tblr1", n, [
+      {label:"Alternative", text:i=> D1.names[i]},
+      {label:"D+", text:i=> Dp[i].toFixed(6), num:i=> Dp[i]},
+      {label:"D-", text:i=> Dm[i].toFixed(6), num:i=> Dm[i]},
+      {label:"Closeness", text:i=> Close[i].toFixed(6), num:i=> Close[i]},
+      {label:"Rank", text:i=> String(ranks[i]), num:i=> ranks[i]},
+      {label:"Rank range (β 0–1)", text:i=> sweep.lo[i]+"–"+sweep.hi[i], num:i=> sweep.hi[i]-sweep.lo[i]},
+      {label:"Same rank for β", text:i=>{ const v=interval(i); return v? v[0].toFixed(2)+" – "+v[1].toFixed(2) : "—"; },
+       num:i=>{ const v=interval(i); return v? v[1]-v[0] : -1; }},
+    ], idx);
     show($("r1"),true);
 
     drawSimpleBar("bar1", res.map(d=>({name:d.Alternative, value:d.Close})));
     drawSimpleLine("line1", res.map(d=>({rank:d.Rank, value:d.Close, name:d.Alternative})));
-  };
+    const kept=Array.from(idx.subarray(0, Math.min(10, n))).filter(i=> !sweep.row || sweep.row[i]>=0);
+    drawBetaSweep("sweep1", sweep, kept, D1.names, beta1);
+  }
 
   // ================= TAB 2: COMPARISON =================
-  let c2=[], r2=[], crit2=[], type2={}, ideal2={}, w2={}, wmode2='equal';
-  $("w2eq").onchange = ()=>{ wmode2='equal'; $("wg2").style.display="none"; };
-  $("w2c").onchange  = ()=>{ wmode2='custom'; $("wg2").style.display=""; };
+  let D2=null, type2={}, ideal2={}, w2={}, wmode2='equal';
+  const TOPK_AUTO_ROWS=2000;   // above this many alternatives the Comparison defaults to top-50
+  $("w2eq").onchange = ()=>{ wmode2='equal'; $("wg2").style.display="none"; liveComparison(); };
+  $("w2c").onchange  = ()=>{ wmode2='custom'; $("wg2").style.display=""; liveComparison(); };
   $("csv2").onchange = (e)=>{ const f=e.target.files[0]; if(!f) return; const r=new FileReader(); r.onload=()=>initCmp(String(r.result)); r.readAsText(f); };
 
   function initCmp(txt){
     const arr=parseCSVText(txt); if(!arr.length) return;
-    c2 = arr[0].map(x=> String(x??"").trim());
-    if(c2[0] !== "Alternative"){
-      const idx=c2.indexOf("Alternative");
-      if(idx>0){ const nm=c2.splice(idx,1)[0]; c2.unshift(nm); } else c2[0]="Alternative";
-    }
-    crit2 = c2.slice(1);
-    r2 = arr.slice(1).filter(r=>r.length>=c2.length).map(r=>{ const o={}; c2.forEach((c,i)=> o[c]=r[i]); return o; });
-    type2  = Object.fromEntries(crit2.map(c=>[c,"Benefit"]));
-    ideal2 = Object.fromEntries(crit2.map(c=>[c,""]));
-    w2     = Object.fromEntries(crit2.map(c=>[c,1]));
-    renderMatrix("tblm2", c2, r2);
-    renderTypes("types2", crit2, type2, ideal2);
-    renderWeights("wg2", crit2, w2);
-    show($("m2"),true); show($("t2"),true); show($("w2"),true); show($("rcmp"),false);
+    D2 = toMatrix(arr); D2.key = ++dataSeq; D2.hash = contentHash(D2); CmpCache.clear(); shownCmp=null;
+    type2  = Object.fromEntries(D2.crit.map(c=>[c,"Benefit"]));
+    ideal2 = Object.fromEntries(D2.crit.map(c=>[c,""]));
+    w2     = Object.fromEntries(D2.crit.map(c=>[c,1]));
+    renderMatrix("tblm2", D2);
+    renderTypes("types2", D2.crit, type2, ideal2, liveComparison);
+    renderWeights("wg2", D2.crit, w2, liveComparison);
+    $("cmpTopK").value = D2.n>TOPK_AUTO_ROWS? 50 : 0;
+    restoreProfile2();
+    shownScn=null; $("scnText").value="";
+    show($("m2"),true); show($("t2"),true); show($("w2"),true); show($("s2"),true); show($("rcmp"),false); show($("rscn"),false);
   }
+  const restoreProfile2 = wireProfiles("2", ()=> D2,
+    ()=> ({types:{...type2}, ideals:{...ideal2}, weights:{...w2}, wmode:wmode2,
+           topK:$("cmpTopK").value, rankBy:$("cmpRankBy").value, x:$("mmc_x").value, y:$("mmc_y").value}),
+    (p)=>{
+      applyCriteria(D2, p, type2, ideal2, w2);
+      if(p.wmode){ wmode2=p.wmode; setWmode("2", wmode2); }
+      if(p.topK!=null) $("cmpTopK").value=p.topK;
+      if(p.rankBy) $("cmpRankBy").value=p.rankBy;
+      if(p.x) $("mmc_x").value=p.x;
+      if(p.y) $("mmc_y").value=p.y;
+      renderTypes("types2", D2.crit, type2, ideal2, liveComparison);
+      renderWeights("wg2", D2.crit, w2, liveComparison);
+      liveComparison();
+    });
 
-  // ---------- renderers ----------
-  function renderMatrix(tid, cols, rows){
-    const tb=$(tid); tb.innerHTML="";
-    const thead=document.createElement("thead"); const trh=document.createElement("tr");
-    cols.forEach(c=>{ const th=document.createElement("th"); th.textContent=c; trh.appendChild(th); });
-    thead.appendChild(trh); tb.appendChild(thead);
-    const tbody=document.createElement("tbody");
-    rows.forEach(r=>{
-      const tr=document.createElement("tr");
-      cols.forEach(c=>{ const td=document.createElement("td"); td.textContent=String(r[c]??""); tr.appendChild(td); });
-      tbody.appendChild(tr);
+  // ---------- virtual table ----------
+  // Only rows inside (or just around) the scroll viewport of the .table-wrap exist in the DOM;
+  // two spacer rows stand in for the rest, so rendering cost and node count do not grow with
+  // the row count. Cells are read on demand from the (typed) data arrays. Clicking a header
+  // sorts through an index permutation (argsort over that column).
+  // columns: [{label, text(i) -> string, num(i) -> number | str(i) -> string for sorting}]
+  // order: row ids in default order (e.g. rank order, or a top-K list); default 0..count-1
+  const VROW_H=37, VOVERSCAN=8, VMAX_PX=4e6;   // spacer heights past ~4M px are scaled down
+  function vtable(tid, count, columns, order=null){
+    const tb=$(tid), wrap=tb.parentNode, prev=tb._vt;
+    const st={columns, order, view:order, sortCol:-1, desc:false, rowH:prev? prev.rowH : VROW_H, first:-1, last:-1};
+    tb._vt=st; tb.innerHTML="";
+    const thead=document.createElement("thead"), trh=document.createElement("tr");
+    const ths=columns.map((c,k)=>{
+      const th=document.createElement("th"); th.textContent=c.label; th.onclick=()=>{ sortBy(k, st.sortCol===k? !st.desc : !!c.num); paint(true); };
+      trh.appendChild(th); return th;
     });
-    tb.appendChild(tbody);
+    thead.appendChild(trh); tb.appendChild(thead);
+    const tbody=document.createElement("tbody"); tb.appendChild(tbody);
+    const spacer=()=>{ const tr=document.createElement("tr"), td=document.createElement("td"); td.colSpan=columns.length; td.style.padding="0"; td.style.border="0"; tr.appendChild(td); return tr; };
+    const padTop=spacer(), padBot=spacer();
+
+    function sortBy(k, desc){
+      const c=columns[k], ids=st.order || Uint32Array.from({length:count}, (_,i)=> i);
+      let perm;
+      if(c.num){ const key=new Float64Array(count); for(let p=0;p<count;p++) key[p]=c.num(ids[p]); perm=argsort(key, desc); }
+      else { const key=Array.from(ids, i=> c.str? c.str(i) : c.text(i)); perm=Uint32Array.from({length:count}, (_,p)=> p).sort((x,y)=> (desc? key[y].localeCompare(key[x]) : key[x].localeCompare(key[y])) || (x-y)); }
+      st.view=Uint32Array.from(perm, p=> ids[p]); st.sortCol=k; st.desc=desc;
+      ths.forEach((th,j)=> th.textContent=columns[j].label + (j===k? (desc? " ▼" : " ▲") : ""));
+    }
+    function paint(force){
+      const H=wrap.clientHeight||360, total=count*st.rowH, real=Math.min(total, VMAX_PX);
+      const top=Math.min(wrap.scrollTop||0, Math.max(0, real-H));
+      const vtop= real>H? top/(real-H)*(total-H) : 0;        // scroll position in unscaled px
+      const first=Math.max(0, Math.floor(vtop/st.rowH)-VOVERSCAN), last=Math.min(count, Math.ceil((vtop+H)/st.rowH)+VOVERSCAN);
+      if(!force && first===st.first && last===st.last) return;
+      st.first=first; st.last=last;
+      while(tbody.firstChild) tbody.removeChild(tbody.firstChild);
+      const above=Math.max(0, top-(vtop-first*st.rowH));
+      padTop.firstChild.style.height=above+"px"; tbody.appendChild(padTop);
+      for(let p=first;p<last;p++){
+        const i=st.view? st.view[p] : p, tr=document.createElement("tr");
+        columns.forEach(c=>{ const td=document.createElement("td"); td.textContent=c.text(i); tr.appendChild(td); });
+        tbody.appendChild(tr);
+      }
+      padBot.firstChild.style.height=Math.max(0, real-above-(last-first)*st.rowH)+"px"; tbody.appendChild(padBot);
+      const h=first<last? tbody.children[1].getBoundingClientRect().height : 0;
+      if(h>0 && h<4*VROW_H && Math.abs(h-st.rowH)>0.5){ st.rowH=h; paint(true); }   // real row height, once
+    }
+    wrap.onscroll=()=>{ if(!st.raf) st.raf=requestAnimationFrame(()=>{ st.raf=0; paint(false); }); };
+    if(prev && prev.sortCol>=0 && prev.columns.length===columns.length && prev.columns[prev.sortCol].label===columns[prev.sortCol].label)
+      sortBy(prev.sortCol, prev.desc);   // keep the user's sort across re-renders of the same table
+    paint(true);
+  }
+
+  // ---------- renderers ----------
+  function renderMatrix(tid, D){
+    vtable(tid, D.n, D.cols.map((c,k)=> k===0
+      ? {label:c, text:i=> D.names[i]}
+      : {label:c, text:i=> String(D.rows[i][D.order[k]]??""), num:i=> D.X[(k-1)*D.n+i]}));
   }
 
-  function renderTypes(id, crits, types, ideals){
+  // onEdit fires after any type/goal/weight change (the Comparison tab re-ranks live)
+  function renderTypes(id, crits, types, ideals, onEdit=()=>{}){
     const wrap=$(id); wrap.innerHTML="";
     crits.forEach(c=>{
       const box=document.createElement("div");
@@ -465,13 +1909,14 @@ html = r"""
       sel.value = types[c]||"Benefit";
       sel.onchange = ()=>{
         types[c]=sel.value;
-        renderTypes(id,crits,types,ideals);
+        renderTypes(id,crits,types,ideals,onEdit);
+        onEdit();
       };
       box.appendChild(sel);
 
       if((types[c]||"")==="Ideal (Goal)"){
         const inp=document.createElement("input"); inp.className="mt2"; inp.type="number"; inp.step="any"; inp.placeholder="Goal";
-        inp.value=ideals[c]||""; inp.oninput=()=> ideals[c]=inp.value;
+        inp.value=ideals[c]||""; inp.oninput=()=>{ ideals[c]=inp.value; onEdit(); };
         box.appendChild(inp);
       } else {
         delete ideals[c];
@@ -480,278 +1925,464 @@ html = r"""
     });
   }
 
-  function renderWeights(id, crits, weights){
+  function renderWeights(id, crits, weights, onEdit=()=>{}){
     const wrap=$(id); wrap.innerHTML="";
     crits.forEach(c=>{
       const box=document.createElement("div");
       const lab=document.createElement("div"); lab.className="label"; lab.textContent="w("+c+")"; box.appendChild(lab);
       const inp=document.createElement("input"); inp.type="number"; inp.step="0.001"; inp.min="0"; inp.value=weights[c]??0;
-      inp.oninput=()=> weights[c]=inp.value; box.appendChild(inp);
+      inp.oninput=()=>{ weights[c]=inp.value; onEdit(); }; box.appendChild(inp);
       wrap.appendChild(box);
     });
   }
 
-  // ---------- CORE compute ----------
-  function computeWeights(crits, weights, mode){
-    const w={};
-    if(mode==='equal'){ crits.forEach(c=> w[c]=1/crits.length); }
-    else{
-      let s=0; crits.forEach(c=>{ const v=Math.max(0,parseFloat(weights[c]||0)); w[c]=isFinite(v)?v:0; s+=w[c]; });
-      if(s<=0) crits.forEach(c=> w[c]=1/crits.length); else crits.forEach(c=> w[c]/=s);
-    }
-    return w;
+  function setCmpStatus(text, p){
+    $("cmpStatus").textContent = text;
+    const bar=$("cmpProg"); show(bar, p!=null); if(p!=null) bar.value=p;
   }
 
-  function computeU(rows, crits, types, ideals){
-    const U={};
-    crits.forEach(c=>{
-      const vals = rows.map(r=> toNum(r[c]));
-      U[c] = sawUnit(vals, types[c]||"Benefit", ideals[c]);
-    });
-    return U;
+  // ---------- memoized results ----------
+  // Keyed by specKey() plus the set of methods (results stored by a page with other methods
+  // never match). A few recent settings are kept so flipping
+  // a type or weight back and forth redraws without recomputing.
+  const METHODS_KEY=hashText(ORDER.join("|"));
+  const CmpCache = (()=>{
+    const MAX=8, map=new Map();
+    return {
+      get(k){ const v=map.get(k); if(v!==undefined){ map.delete(k); map.set(k,v); } return v; },
+      set(k,v){ map.delete(k); map.set(k,v); if(map.size>MAX) map.delete(map.keys().next().value); },
+      clear(){ map.clear(); }
+    };
+  })();
+  // Cache key for the comparison on the current Step B–C inputs; topK 0 means full ranks.
+  const cmpKey=(topK)=> specKey(D2, type2, ideal2, w2, wmode2)+"|K"+topK+"|"+METHODS_KEY;
+  let shownCmp=null;   // {key, res} currently on screen
+  let cmpReq=0;        // newest request; older results are cached but not drawn
+
+  // Clicking Run while a run is in flight cancels it and starts over with the current inputs.
+  // Live edits (live=true) never cancel: the worker finishes, then takes the newest inputs,
+  // and its incremental state only recomputes the criteria that changed.
+  function runComparison(live=false){
+    if(!D2 || !D2.n) return;
+    const topK=cmpTopK(), key=cmpKey(topK), req=++cmpReq;
+    const showHit=(hit)=>{
+      Compute.drop(); setCmpStatus("", null);   // an older job still running only fills the cache
+      if(!shownCmp || shownCmp.key!==key){ shownCmp={key, res:hit}; renderComparison(hit); }
+    };
+    const hit= shownCmp && shownCmp.key===key? shownCmp.res : CmpCache.get(key);
+    if(hit) return showHit(hit);
+    const args={types:{...type2}, ideals:{...ideal2}, weights:{...w2}, wmode:wmode2, topK};
+    ResultStore.get("cmp", key).then(stored=>{
+      if(stored){ CmpCache.set(key, stored); if(req===cmpReq) showHit(stored); return; }
+      if(req!==cmpReq) return;
+      if(!live) setCmpStatus("Computing…", 0);
+      return Compute[live? "latest" : "run"]("compareTask", D2, args, (p, stage)=>{ if(!live) setCmpStatus("Computing… "+stage, p); })
+        .then(res=>{
+          CmpCache.set(key, res); ResultStore.put("cmp", key, res);
+          if(req!==cmpReq) return;   // superseded while computing
+          setCmpStatus("", null); shownCmp={key, res}; renderComparison(res);
+        });
+    }).catch(err=>{ if(!(err && err.cancelled)) setCmpStatus("⚠️ "+(err && err.message || err), null); });
   }
 
-  // --------- SYAI (exact, per your working routine) ----------
-  function normalizeColumn_SYAI(vals, ctype, goal){
-    const max=Math.max(...vals), min=Math.min(...vals), R=max-min;
-    let xStar;
-    if(ctype==="Benefit") xStar=max;
-    else if(ctype==="Cost") xStar=min;
-    else {
-      const g=parseFloat(goal);
-      xStar = isFinite(g) ? g : (vals.reduce((s,v)=>s+(isFinite(v)?v:0),0)/vals.length);
-    }
-    if(Math.abs(R)<1e-12) return vals.map(_=>1.0);
-    return vals.map(x=> Math.max(0.01, Math.min(1, 0.01 + (1-0.01)*(1-Math.abs(x-xStar)/R))));
+  const cmpTopK=()=>{ const k=parseInt($("cmpTopK").value,10); return k>0 && k<D2.n? k : 0; };
+
+  // Top-K results carry no Spearman; fetch full ranks only when asked for.
+  function runSpearman(){
+    if($("cmpCorr").value==="kendall") return runKendall();
+    if(!shownCmp || shownCmp.res.spearman) return;
+    const base=specKey(D2, type2, ideal2, w2, wmode2), full=cmpKey(0);
+    if(!shownCmp.key.startsWith(base+"|")) return;   // inputs changed since: Run first
+    const req=++cmpReq;
+    setCmpStatus("Ranking all alternatives…", 0.8);
+    Compute.run("spearmanTask", D2, {types:{...type2}, ideals:{...ideal2}, weights:{...w2}, wmode:wmode2},
+                (p, stage)=> setCmpStatus("Computing… "+stage, p))
+      .then(res=>{
+        CmpCache.set(full, res); ResultStore.put("cmp", full, res);
+        if(req!==cmpReq) return;
+        setCmpStatus("", null);
+        shownCmp.res.spearman=res.spearman; shownCmp.res.full=res;
+        drawCorrelation(shownCmp.res);
+      })
+      .catch(err=>{ if(!(err && err.cancelled)) setCmpStatus("⚠️ "+(err && err.message || err), null); });
   }
-
-  function computeSYAI_exact(rows, crits, types, ideals, weights, wmode, beta){
-    const N={};
-    crits.forEach(c=>{
-      const series = rows.map(r=> toNum(r[c]));
-      N[c] = normalizeColumn_SYAI(series, types[c]||"Benefit", ideals[c]);
-    });
-    const w = computeWeights(crits, weights, wmode);
-    const W = rows.map((_,i)=> Object.fromEntries(crits.map(c=>[c,N[c][i]*w[c]])) );
-
-    const Aplus={}, Aminus={};
-    crits.forEach(c=>{
-      let mx=-Infinity, mn=Infinity;
-      W.forEach(row=>{ if(row[c]>mx) mx=row[c]; if(row[c]<mn) mn=row[c]; });
-      Aplus[c]=mx; Aminus[c]=mn;
+  // Kendall τ only when picked: O(n log n) per pair of methods, in the worker, kept on the result.
+  function runKendall(){
+    if(!shownCmp || shownCmp.res.kendall) return;
+    if(!shownCmp.key.startsWith(specKey(D2, type2, ideal2, w2, wmode2)+"|")) return;   // inputs changed since: Run first
+    const req=++cmpReq, shown=shownCmp;
+    setCmpStatus("Kendall τ…", 0);
+    Compute.run("kendallTask", D2, {types:{...type2}, ideals:{...ideal2}, weights:{...w2}, wmode:wmode2},
+                (p, stage)=> setCmpStatus("Computing… "+stage, p))
+      .then(({kendall})=>{
+        if(req!==cmpReq) return;   // superseded: a newer run owns the status and the result
+        shown.res.kendall=kendall;
+        setCmpStatus("", null); drawCorrelation(shown.res);
+      })
+      .catch(err=>{ if(!(err && err.cancelled)) setCmpStatus("⚠️ "+(err && err.message || err), null); });
+  }
+  // ---------- scenario batch ----------
+  // Scenario table -> [{name, types, ideals, weights, wmode}]. Per criterion c: "c" or
+  // "c weight", "c type" (Benefit / Cost / Ideal (Goal); the first letter is enough) and
+  // "c goal"; "wmode" is equal or custom. Empty cells keep the current Step B–C settings;
+  // with any weight column, scenarios default to custom weights.
+  const TYPE_NAMES=["Benefit","Cost","Ideal (Goal)"];
+  function parseScenarios(text, D, base){
+    const rows=parseCSVText(text.trim()+"\n").filter(r=> r.some(v=> String(v).trim()!==""));
+    if(rows.length<2) throw new Error("need a header row and at least one scenario");
+    const head=rows[0].map(h=> String(h).trim()), nameCol=head.findIndex(h=> h.toLowerCase()==="scenario");
+    const fields=head.map((h,k)=>{
+      if(k===nameCol) return null;
+      if(h.toLowerCase()==="wmode") return {wmode:true};
+      const m=/^(.*?)\s+(weight|type|goal)$/i.exec(h), crit= m? m[1] : h;
+      if(!D.crit.includes(crit)) throw new Error(`column "${h}": no criterion "${crit}"`);
+      return {crit, what: m? m[2].toLowerCase() : "weight"};
     });
-
-    return rows.map((r,i)=>{
-      let Dp=0, Dm=0;
-      crits.forEach(c=>{ Dp+=Math.abs(W[i][c]-Aplus[c]); Dm+=Math.abs(W[i][c]-Aminus[c]); });
-      const denom = beta*Dp + (1-beta)*Dm || Number.EPSILON;
-      const Close = ((1-beta)*Dm)/denom;
-      return { alt:String(r["Alternative"]), Dp, Dm, Close };
+    const weighted=fields.some(f=> f && f.what==="weight");
+    return rows.slice(1).map((r,i)=>{
+      const name= nameCol>=0 && String(r[nameCol]??"").trim() || "S"+(i+1);
+      const sc={name, types:{...base.types}, ideals:{...base.ideals}, weights:{...base.weights}, wmode: weighted? "custom" : base.wmode};
+      fields.forEach((f,k)=>{
+        const v=String(r[k]??"").trim();
+        if(!f || v==="") return;
+        if(f.wmode){
+          if(!/^(equal|custom)$/i.test(v)) throw new Error(`${name}: wmode must be equal or custom, got "${v}"`);
+          sc.wmode=v.toLowerCase();
+        } else if(f.what==="type"){
+          const t=TYPE_NAMES.find(t=> t[0].toLowerCase()===v[0].toLowerCase());
+          if(!t) throw new Error(`${name}: "${v}" is not Benefit, Cost or Ideal (Goal)`);
+          sc.types[f.crit]=t;
+        } else if(f.what==="goal") sc.ideals[f.crit]=v;
+        else sc.weights[f.crit]=v;
+      });
+      return sc;
     });
   }
+  const csvCell=(v)=> /[",\n]/.test(v)? '"'+v.replace(/"/g,'""')+'"' : v;
+  // append the current Step B–C settings as one more scenario row (header first if empty)
+  function addScenarioRow(){
+    if(!D2) return;
+    const ta=$("scnText"), text=ta.value.trim();
+    const head=["Scenario","wmode"].concat(...D2.crit.map(c=> [c, c+" type", c+" goal"]));
+    const row=["S"+(text? text.split("\n").length : 1), wmode2].concat(...D2.crit.map(c=> [String(w2[c]??""), type2[c]||"Benefit", String(ideal2[c]??"")]));
+    ta.value=(text? text : head.map(csvCell).join(","))+"\n"+row.map(csvCell).join(",");
+  }
 
-// --------- COBRA (Eqs. 6–26; matches your Excel exactly) ----------
-function computeCOBRA(rows, crits, types, weights, wmode){
-  const n = rows.length;
-  const w = computeWeights(crits, weights, wmode);   // equal -> 1/m; custom -> normalized
-
-  // Step 2 (Eq. 7): max-normalize for ALL criteria
-  const F = {}; // f_ij
-  crits.forEach(c=>{
-    const vals = rows.map(r => toNum(r[c]));
-    const vmax = Math.max(...vals) || 1;
-    F[c] = vals.map(x => x / (vmax || 1));
-  });
-
-  // Step 3 (Eq. 8): weighted normalized r_ij = f_ij * w_j
-  const Rw = rows.map((_,i)=> Object.fromEntries(crits.map(c => [c, F[c][i] * w[c]])));
-
-  // Step 4 (Eqs. 9–12) + AS (Eq. 13)
-  const PIS = {}, NIS = {}, AS = {};
-  crits.forEach(c=>{
-    const col = Rw.map(r => r[c]);
-    if ((types[c] || "Benefit") === "Cost"){ // non-beneficial
-      PIS[c] = Math.min(...col);
-      NIS[c] = Math.max(...col);
-    } else {                                  // beneficial
-      PIS[c] = Math.max(...col);
-      NIS[c] = Math.min(...col);
-    }
-    AS[c] = col.reduce((s,v)=>s+v,0) / n;
-  });
-
-  // Helpers
-  const cols = crits;
-  function dE_to(target, gate=null){
-    return Rw.map(row=>{
-      let s=0;
-      cols.forEach(c=>{
-        const use = gate ? gate(row[c], AS[c]) : 1;
-        if(use>0){ const d = target[c]-row[c]; s += d*d; }
-      });
-      return Math.sqrt(s);
-    });
+  let shownScn=null, scnReq=0;
+  function setScnStatus(text, p){
+    $("scnStatus").textContent=text;
+    const bar=$("scnProg"); show(bar, p!=null); if(p!=null) bar.value=p;
   }
-  // Excel behavior for PIS/NIS: | sum_j (target_j - r_ij) |
-  function dT_signed_sum(target){
-    return Rw.map(row=>{
-      let s = 0;
-      cols.forEach(c=>{ s += (target[c] - row[c]); });
-      return Math.abs(s);
-    });
+  function runScenarios(){
+    if(!D2) return;
+    let scenarios;
+    try{ scenarios=parseScenarios($("scnText").value, D2, {types:type2, ideals:ideal2, weights:w2, wmode:wmode2}); }
+    catch(err){ setScnStatus("⚠️ "+err.message, null); return; }
+    const req=++scnReq, t0=performance.now();
+    setScnStatus("Scoring "+scenarios.length+" scenarios…", 0);
+    Compute.run("scenarioTask", D2, {scenarios}, (p, stage)=> setScnStatus("Scenario "+stage+"…", p))
+      .then(cube=>{
+        if(req!==scnReq) return;
+        setScnStatus(`${cube.S} scenarios × ${cube.n.toLocaleString()} alternatives in ${Math.round(performance.now()-t0)} ms`, null);
+        shownScn=cube; renderScenarios();
+      })
+      .catch(err=>{ if(!(err && err.cancelled)) setScnStatus("⚠️ "+(err && err.message || err), null); });
   }
-  // AS± use standard taxicab on gated subset: sum_j |target_j - r_ij|
-  function dT_gated(target, gate){
-    return Rw.map(row=>{
-      let s=0;
-      cols.forEach(c=>{
-        const use = gate ? gate(row[c], AS[c]) : 1;
-        if(use>0) s += Math.abs(target[c] - row[c]);
-      });
-      return s;
-    });
+  // one method's slice of the rank cube: table (ranks per scenario), rank paths, first-place share
+  function renderScenarios(){
+    const cube=shownScn; if(!cube) return;
+    const m=$("scnMethod").value, {n, S}=cube, R=cube.ranks[m], lo=cube.lo[m], hi=cube.hi[m], first=cube.first[m];
+    const mean=new Float64Array(n);
+    for(let k=0;k<S;k++){ const off=k*n; for(let i=0;i<n;i++) mean[i]+=R[off+i]; }
+    for(let i=0;i<n;i++) mean[i]/=S;
+    const order=argsort(mean, false);
+    show($("rscn"), true);
+    $("scnInfo").textContent= S>1? `ρ = Spearman vs ${cube.names[0]}` : "";
+    vtable("scn_table", n, [
+      {label:"Alternative", text:i=> D2.names[i]},
+      {label:"Mean rank", text:i=> mean[i].toFixed(2), num:i=> mean[i]},
+      {label:"Best", text:i=> String(lo[i]), num:i=> lo[i]},
+      {label:"Worst", text:i=> String(hi[i]), num:i=> hi[i]},
+      {label:"1st", text:i=> String(first[i]), num:i=> first[i]},
+    ].concat(cube.names.map((nm,k)=> ({label: k? `${nm} (ρ ${cube.agree[m][k].toFixed(2)})` : nm, text:i=> String(R[k*n+i]), num:i=> R[k*n+i]}))), order);
+    const top=Array.from(order.subarray(0, Math.min(10, n)));
+    const ticks=[], every=Math.max(1, Math.ceil(S/8));
+    for(let k=0;k<S;k+=every) ticks.push([S>1? k/(S-1) : 0.5, cube.names[k]]);
+    drawRankPaths("scn_paths", {steps:S-1, n, ranks:R, lo, hi}, top, D2.names, ticks, "the scenarios", null);
+    const byFirst=argsort(Float64Array.from(first), true), bars=[];
+    for(let p=0;p<Math.min(20, n) && first[byFirst[p]]>0;p++) bars.push({name:D2.names[byFirst[p]], value:first[byFirst[p]]/S});
+    drawSimpleBar("scn_first", bars);
   }
 
-  // Gates (strict) per Eqs. 21 & 24
-  const gatePos = (rij, asj)=> (asj < rij ? 1 : 0); // ε⁺
-  const gateNeg = (rij, asj)=> (asj > rij ? 1 : 0); // ε⁻
-
-  // Distances
-  const dE_PIS = dE_to(PIS),          dT_PIS = dT_signed_sum(PIS);
-  const dE_NIS = dE_to(NIS),          dT_NIS = dT_signed_sum(NIS);
-  const dE_ASp = dE_to(AS, gatePos),  dT_ASp = dT_gated(AS, gatePos);
-  const dE_ASn = dE_to(AS, gateNeg),  dT_ASn = dT_gated(AS, gateNeg);
-
-  // ρ (Eq. 14): max dE − min dE for each solution set
-  const rho = arr => Math.max(...arr) - Math.min(...arr);
-  const ρP = rho(dE_PIS), ρN = rho(dE_NIS), ρAp = rho(dE_ASp), ρAn = rho(dE_ASn);
-
-  // Eq. 14: d = dE + ρ * dE * dT  (multiplicative dE per your Excel)
-  const D_PIS = dE_PIS.map((v,i)=> v + ρP  * v * dT_PIS[i]);
-  const D_NIS = dE_NIS.map((v,i)=> v + ρN  * v * dT_NIS[i]);
-  const D_ASp = dE_ASp.map((v,i)=> v + ρAp * v * dT_ASp[i]);
-  const D_ASn = dE_ASn.map((v,i)=> v + ρAn * v * dT_ASn[i]);
+  // heatmap of the picked measure, or a button to compute it (top-K runs carry neither)
+  function drawCorrelation(res){
+    const tau=$("cmpCorr").value==="kendall", R= tau? res.kendall : res.spearman;
+    if(R) drawHeatCorr(R, tau? "τ" : "ρ", tau? "Kendall τ" : "Spearman ρ");
+    else { const svg=$("mmc_heat"); while(svg.firstChild) svg.removeChild(svg.firstChild); }
+    $("cmpSpearman").textContent= tau? "Compute Kendall τ" : "Compute full ranks + Spearman";
+    show($("cmpSpearman"), !R);
+  }
 
-  // Step 6 (Eq. 26): final (smaller is better); keep the ÷4
-  return D_PIS.map((_,i)=> ( D_PIS[i] - D_NIS[i] - D_ASp[i] + D_ASn[i] ) / 4 );
-}
+  // Once results are on screen, edits re-rank without pressing Run.
+  function liveComparison(){ if(shownCmp) runComparison(true); }
 
+  // Axis pickers only re-project the cached score vectors.
+  function redrawCmpScatter(){
+    if(!shownCmp) return;
+    drawCmpScatter({methods:shownCmp.res.methods, names:D2.names}, $("mmc_x").value, $("mmc_y").value);
+  }
 
-  function runComparison(){
-    if(!r2.length) return;
+  // Rank of alternative i under method m: read from full ranks, from the top-K list, or
+  // counted on first display (O(n), memoized) for rows outside a method's top K.
+  function rankLookup(res){
+    if(res.ranks) return (m,i)=> res.ranks[m][i];
+    const pos={}, memo=new Map();
+    return (m,i)=>{
+      if(res.full) return res.full.ranks[m][i];
+      if(!pos[m]){ pos[m]=new Map(); res.top[m].forEach((j,p)=> pos[m].set(j, p+1)); }
+      const r=pos[m].get(i); if(r!==undefined) return r;
+      const k=m+":"+i; if(!memo.has(k)) memo.set(k, K.rankOf(res.methods[m], i, !LOWER_IS_BETTER[m]));
+      return memo.get(k);
+    };
+  }
+  // Main thread only renders: table, bars, scatter, heatmap from the worker's result.
+  function renderComparison(res){
+    const {methods}=res;
+    const rows = res.top? res.top[$("cmpRankBy").value] : null;   // top-K: K rows in rank order
+    renderCmpTable(res, rows);
+    show($("rcmp"),true);
 
-    const U = computeU(r2, crit2, type2, ideal2);
-    const w = computeWeights(crit2, w2, wmode2);
+    // charts
+    if(rows){
+      const sub={}; ORDER.forEach(m=>{ sub[m]=Float64Array.from(rows, i=> methods[m][i]); });
+      drawCmpBars(sub, null, Array.from(rows, i=> D2.names[i]));
+    } else drawCmpBars(methods, res.ranks, D2.names);
+    drawCmpScatter({methods, names:D2.names}, $("mmc_x").value, $("mmc_y").value);
+    drawCorrelation(res);
+  }
 
-    // ---------- SAW ----------
-    const SAW = r2.map((_,i)=> crit2.reduce((s,c)=> s + w[c]*U[c][i], 0));
+  function renderCmpTable(res, rows){
+    const {methods}=res, rankOf=rankLookup(res);
+    vtable("mmc_table", rows? rows.length : D2.n, [{label:"Alternative", text:i=> D2.names[i]}].concat(
+      ORDER.map(m=> ({label:m, text:i=> methods[m][i].toFixed(4)+" ("+rankOf(m,i)+")", num:i=> methods[m][i]}))), rows);
+  }
 
-    // ---------- WASPAS ----------
-    const WPM = r2.map((_,i)=> crit2.reduce((p,c)=> p * Math.pow(Math.max(U[c][i],1e-12), w[c]), 1));
-    const WASPAS = r2.map((_,i)=> 0.5*SAW[i] + 0.5*WPM[i]);
+  // ---------- Tooltip ----------
+  const TT = $("tt");
+  function showTT(x,y,html){ TT.style.display="block"; TT.style.left=(x+12)+"px"; TT.style.top=(y+12)+"px"; TT.innerHTML=html; }
+  function hideTT(){ TT.style.display="none"; }
 
-    // ---------- MOORA ----------
-    const NV={}; crit2.forEach(c=>{
-      const vals = r2.map(r=> toNum(r[c]));
-      NV[c] = ( (type2[c]||"Benefit")==="Ideal (Goal)") ? U[c] : vectorNorm(vals);
-    });
-    const MOORA = r2.map((_,i)=>{
-      let sumB=0, sumC=0;
-      crit2.forEach(c=>{
-        if((type2[c]||"Benefit")==="Cost") sumC += w[c]*NV[c][i];
-        else sumB += w[c]*NV[c][i];
+  // ---------- Canvas backend ----------
+  // Charts with more than SVG_MARKS marks draw into one <canvas> beside their <svg>.
+  // Alternatives are binned to pixel columns (bars, lines) or to a density grid (scatter),
+  // and a single mousemove handler per canvas maps the pointer back to a bin for the tooltip.
+  const SVG_MARKS = 2000;
+  function chartSvg(svgId){
+    const svg=$(svgId); while(svg.firstChild) svg.removeChild(svg.firstChild);
+    if(svg._cv){ svg._cv.style.display="none"; svg.style.display=""; }
+    return svg;
+  }
+  function chartCanvas(svgId, defW, defH){
+    const svg=$(svgId), box=svg.parentNode;
+    while(svg.firstChild) svg.removeChild(svg.firstChild);
+    let cv=svg._cv;
+    if(!cv){
+      cv=svg._cv=document.createElement("canvas");
+      cv.style.width="100%"; cv.style.height="100%"; cv.style.display="block";
+      box.appendChild(cv);
+      cv.addEventListener("mousemove",(ev)=>{
+        const r=cv.getBoundingClientRect(), html=cv._hit && cv._hit(ev.clientX-r.left, ev.clientY-r.top);
+        if(html) showTT(ev.clientX, ev.clientY, html); else hideTT();
       });
-      return sumB - sumC;
-    });
+      cv.addEventListener("mouseleave", hideTT);
+    }
+    svg.style.display="none"; cv.style.display="block";
+    const W=box.clientWidth||defW, H=box.clientHeight||defH, dpr=window.devicePixelRatio||1;
+    cv.width=Math.round(W*dpr); cv.height=Math.round(H*dpr);
+    const ctx=cv.getContext("2d");
+    ctx.setTransform(dpr,0,0,dpr,0,0); ctx.clearRect(0,0,W,H);
+    ctx.font="12px ui-sans-serif,system-ui,Arial"; ctx.lineWidth=1;
+    cv._hit=null;
+    return {cv, ctx, W, H};
+  }
+  // Axes plus dashed gridlines and tick labels, as the SVG charts draw them.
+  function canvasAxes(ctx, W, H, padL, padR, padT, padB, yMin, yMax, ticks){
+    ctx.strokeStyle="#000"; ctx.fillStyle="#000";
+    ctx.beginPath(); ctx.moveTo(padL,padT); ctx.lineTo(padL,H-padB); ctx.lineTo(W-padR,H-padB); ctx.stroke();
+    if(!ticks) return;
+    ctx.setLineDash([3,3]); ctx.textAlign="right"; ctx.textBaseline="middle";
+    for(let t=0;t<=ticks;t++){
+      const val=yMin+(yMax-yMin)*t/ticks, y=H-padB-(H-padT-padB)*t/ticks;
+      ctx.beginPath(); ctx.moveTo(padL,y); ctx.lineTo(W-padR,y); ctx.stroke();
+      ctx.fillText(val.toFixed(2), padL-10, y);
+    }
+    ctx.setLineDash([]);
+  }
+  // One pass: alternative i (in the given order) falls in bin floor(i*bins/n).
+  // [min, max] of val(0..n-1) in one pass; spreading a series into Math.max/min overflows the stack
+  function extent(n, val){
+    let lo=Infinity, hi=-Infinity;
+    for(let i=0;i<n;i++){ const v=val(i); if(v<lo) lo=v; if(v>hi) hi=v; }
+    return [lo, hi];
+  }
+  function binSeries(n, bins, val){
+    const lo=new Float64Array(bins).fill(Infinity), hi=new Float64Array(bins).fill(-Infinity);
+    const sum=new Float64Array(bins), arg=new Int32Array(bins), start=new Int32Array(bins+1);
+    for(let i=0, k=0;i<n;i++){
+      const b=Math.floor(i*bins/n);
+      if(b!==k || i===0){ k=b; start[b]=i; }
+      const v=val(i); sum[b]+=v;
+      if(v<lo[b]) lo[b]=v;
+      if(v>hi[b]){ hi[b]=v; arg[b]=i; }
+    }
+    start[bins]=n;
+    return {bins, lo, hi, sum, arg, start, count:(b)=> start[b+1]-start[b], mean:(b)=> sum[b]/(start[b+1]-start[b])};
+  }
+  function binLabel(bs, b, name){
+    const c=bs.count(b), a=bs.start[b];
+    return c===1? `<b>${name(a)}</b>` : `<b>${name(a)} … ${name(a+c-1)}</b> (${c} alternatives)`;
+  }
+  // A few evenly spaced labels under binned bars, instead of one per alternative.
+  function canvasXLabels(ctx, bs, x0, cell, y, name){
+    ctx.fillStyle="#000"; ctx.textAlign="center"; ctx.textBaseline="alphabetic";
+    const every=Math.max(1, Math.ceil(90/cell));
+    for(let b=0;b<bs.bins;b+=every) ctx.fillText(name(bs.start[b]), x0+(b+0.5)*cell, y);
+  }
 
-    // ---------- TOPSIS ----------
-    const Nt={}; crit2.forEach(c=>{ Nt[c]=vectorNorm(r2.map(r=> toNum(r[c]))); });
-    const Wt = r2.map((_,i)=> Object.fromEntries(crit2.map(c=>[c, Nt[c][i]*w[c]])) );
-    const Aplus={}, Aminus={}; crit2.forEach(c=>{
-      const arr=Wt.map(r=>r[c]);
-      if((type2[c]||"Benefit")==="Cost"){ Aplus[c]=Math.min(...arr); Aminus[c]=Math.max(...arr); }
-      else { Aplus[c]=Math.max(...arr); Aminus[c]=Math.min(...arr); }
-    });
-    const TOPSIS = r2.map((_,i)=>{
-      let dp=0, dm=0;
-      crit2.forEach(c=>{ const v=Wt[i][c]; dp+=(v-Aplus[c])**2; dm+=(v-Aminus[c])**2; });
-      dp=Math.sqrt(dp); dm=Math.sqrt(dm);
-      return dm/((dp+dm)||1e-12);
-    });
+  function canvasBar(svgId, data){
+    const {cv,ctx,W,H}=chartCanvas(svgId, 800, 360), padL=50,padR=20,padT=18,padB=44;
+    const n=data.length, pw=W-padL-padR, ph=H-padT-padB;
+    const bs=binSeries(n, Math.max(1, Math.min(n, Math.floor(pw/2))), i=> data[i].value);
+    let max=0; for(let b=0;b<bs.bins;b++) if(bs.hi[b]>max) max=bs.hi[b];
+    max=max||1;
+    canvasAxes(ctx, W, H, padL, padR, padT, padB, 0, max, 5);
+    const cell=pw/bs.bins, barW=Math.max(1, cell*0.8), y=(v)=> H-padB-ph*(v/max);
+    for(let b=0;b<bs.bins;b++){   // bar = bin maximum, so peaks survive; tick = bin mean
+      ctx.fillStyle=PASTELS[b%PASTELS.length];
+      ctx.fillRect(padL+b*cell+(cell-barW)/2, y(bs.hi[b]), barW, H-padB-y(bs.hi[b]));
+    }
+    if(bs.bins<n){
+      ctx.fillStyle="#64748b";
+      for(let b=0;b<bs.bins;b++) ctx.fillRect(padL+b*cell, y(bs.mean(b))-0.5, cell, 1);
+    }
+    canvasXLabels(ctx, bs, padL, cell, H-12, i=> data[i].name);
+    cv._hit=(x,yy)=>{
+      const b=Math.floor((x-padL)/cell);
+      if(b<0 || b>=bs.bins || yy<padT || yy>H-padB) return null;
+      if(bs.count(b)===1) return `<b>${data[bs.start[b]].name}</b><br/>${data[bs.start[b]].value.toFixed(6)}`;
+      return binLabel(bs, b, i=> data[i].name)+`<br/>max ${bs.hi[b].toFixed(6)} (${data[bs.arg[b]].name})<br/>mean ${bs.mean(b).toFixed(6)}<br/>min ${bs.lo[b].toFixed(6)}`;
+    };
+  }
 
-    // ---------- VIKOR (lower better) ----------
-    const fStar={}, fMin={}; crit2.forEach(c=>{
-      const vals=r2.map(r=> toNum(r[c]));
-      if((type2[c]||"Benefit")==="Cost"){ fStar[c]=Math.min(...vals); fMin[c]=Math.max(...vals); }
-      else { fStar[c]=Math.max(...vals); fMin[c]=Math.min(...vals); }
+  function canvasLine(svgId, data){
+    const {cv,ctx,W,H}=chartCanvas(svgId, 800, 300), padL=50,padR=20,padT=14,padB=30;
+    data.sort((a,b)=> a.rank-b.rank);
+    const n=data.length, pw=W-padL-padR, ph=H-padT-padB;
+    const bs=binSeries(n, Math.max(1, Math.min(n, Math.floor(pw))), i=> data[i].value);
+    let maxY=0; for(let b=0;b<bs.bins;b++) if(bs.hi[b]>maxY) maxY=bs.hi[b];
+    maxY=maxY||1;
+    canvasAxes(ctx, W, H, padL, padR, padT, padB, 0, maxY, 0);
+    const cell=pw/bs.bins, sy=(v)=> H-padB-ph*(v/maxY);
+    ctx.strokeStyle="#64748b";
+    ctx.beginPath();                      // min–max envelope per pixel column
+    for(let b=0;b<bs.bins;b++){ const x=padL+(b+0.5)*cell; ctx.moveTo(x, sy(bs.lo[b])); ctx.lineTo(x, sy(bs.hi[b])+0.5); }
+    ctx.stroke();
+    ctx.lineWidth=2; ctx.beginPath();
+    for(let b=0;b<bs.bins;b++){ const x=padL+(b+0.5)*cell, y=sy(bs.mean(b)); b? ctx.lineTo(x,y) : ctx.moveTo(x,y); }
+    ctx.stroke();
+    cv._hit=(x,y)=>{
+      const b=Math.floor((x-padL)/cell);
+      if(b<0 || b>=bs.bins || y<padT || y>H-padB) return null;
+      const a=data[bs.start[b]], z=data[bs.start[b+1]-1];
+      return bs.count(b)===1? `<b>Rank ${a.rank}</b><br/>${a.value.toFixed(6)}`
+        : `<b>Rank ${a.rank}–${z.rank}</b><br/>${bs.hi[b].toFixed(6)} – ${bs.lo[b].toFixed(6)}`;
+    };
+  }
+
+  // Grouped bars per bin of alternatives: bar = method mean, whisker = min..max in the bin.
+  function canvasCmpBars(methods, names, order){
+    const {cv,ctx,W,H}=chartCanvas("mmc_bar", 900, 360), padL=70,padR=20,padT=20,padB=66;
+    const n=names.length, pw=W-padL-padR, ph=H-padT-padB, gap=2;
+    const bins=Math.max(1, Math.min(n, Math.floor(pw/(order.length*3+gap*(order.length-1)+4))));
+    const bs={}; let yMin=0, yMax=0;
+    order.forEach(m=>{
+      const v=methods[m], s=bs[m]=binSeries(n, bins, i=> v[i]);
+      for(let b=0;b<bins;b++){ if(s.lo[b]<yMin) yMin=s.lo[b]; if(s.hi[b]>yMax) yMax=s.hi[b]; }
     });
-    const S = r2.map(r=> crit2.reduce((s,c)=>{
-      const denom = Math.abs(fStar[c]-fMin[c])||1;
-      const term = ((type2[c]||"Benefit")==="Cost") ? ((toNum(r[c])-fStar[c])/((fMin[c]-fStar[c])||1))
-                                                    : ((fStar[c]-toNum(r[c]))/denom);
-      return s + w[c]*term;
-    },0));
-    const R = r2.map(r=> Math.max(...crit2.map(c=>{
-      const denom = Math.abs(fStar[c]-fMin[c])||1;
-      const term = ((type2[c]||"Benefit")==="Cost") ? ((toNum(r[c])-fStar[c])/((fMin[c]-fStar[c])||1))
-                                                    : ((fStar[c]-toNum(r[c]))/denom);
-      return w[c]*term;
-    })));
-    const Smin=Math.min(...S), Smax=Math.max(...S), Rmin=Math.min(...R), Rmax=Math.max(...R);
-    const VIKOR = S.map((_,i)=> 0.5*((S[i]-Smin)/((Smax-Smin)||1)) + 0.5*((R[i]-Rmin)/((Rmax-Rmin)||1)));
-
-    // ---------- SYAI (exact) ----------
-    const sy = computeSYAI_exact(r2, crit2, type2, ideal2, w2, wmode2, 0.5);
-    const SYAI = sy.map(o=> o.Close);
-
-    // ---------- COBRA (per paper; can be negative) ----------
-    const COBRA = computeCOBRA(r2, crit2, type2, w2, wmode2);
-
-    // ranks
-    function ranksHigher(a){ const idx=a.map((v,i)=>({v,i})).sort((x,y)=> y.v-x.v); const rk=new Array(a.length); idx.forEach((o,k)=> rk[o.i]=k+1); return rk; }
-    function ranksLower(a){ const idx=a.map((v,i)=>({v,i})).sort((x,y)=> x.v-y.v); const rk=new Array(a.length); idx.forEach((o,k)=> rk[o.i]=k+1); return rk; }
-
-    const methods={TOPSIS, VIKOR, SAW, SYAI, COBRA, WASPAS, MOORA};
-    const ranks={ TOPSIS:ranksHigher(TOPSIS), VIKOR:ranksLower(VIKOR), SAW:ranksHigher(SAW),
-                  SYAI:ranksHigher(SYAI), COBRA:ranksLower(COBRA), WASPAS:ranksHigher(WASPAS), MOORA:ranksHigher(MOORA) };
-
-    const order=["TOPSIS","VIKOR","SAW","SYAI","COBRA","WASPAS","MOORA"];
-
-    // table
-    const tb=$("mmc_table"); tb.innerHTML="";
-    const thead=document.createElement("thead"); const trh=document.createElement("tr");
-    ["Alternative"].concat(order).forEach(h=>{ const th=document.createElement("th"); th.textContent=h; trh.appendChild(th); });
-    thead.appendChild(trh); tb.appendChild(thead);
-    const tbody=document.createElement("tbody");
-    r2.forEach((row,i)=>{
-      const tr=document.createElement("tr");
-      const t0=document.createElement("td"); t0.textContent=String(row["Alternative"]); tr.appendChild(t0);
-      order.forEach(m=>{
-        const td=document.createElement("td"); td.textContent = methods[m][i].toFixed(4)+" ("+ranks[m][i]+")"; tr.appendChild(td);
-      });
-      tbody.appendChild(tr);
+    const range=(yMax-yMin)||1, sy=(v)=> H-padB-ph*((v-yMin)/range), y0=sy(0);
+    canvasAxes(ctx, W, H, padL, padR, padT, padB, yMin, yMin+range, 5);
+    const cell=pw/bins, barW=Math.max(1, ((cell*0.8)-(order.length-1)*gap)/order.length);
+    const groupW=barW*order.length+gap*(order.length-1);
+    order.forEach((m,k)=>{
+      const s=bs[m], color=METHOD_COLORS[m] || PASTELS[k%PASTELS.length];
+      ctx.fillStyle=color;
+      for(let b=0;b<bins;b++){
+        const x=padL+b*cell+(cell-groupW)/2+k*(barW+gap), y=sy(s.mean(b));
+        ctx.fillRect(x, Math.min(y,y0), barW, Math.abs(y0-y));
+      }
+      if(bins<n){
+        ctx.strokeStyle=color; ctx.globalAlpha=0.6; ctx.beginPath();
+        for(let b=0;b<bins;b++){ const x=padL+b*cell+(cell-groupW)/2+k*(barW+gap)+barW/2; ctx.moveTo(x, sy(s.lo[b])); ctx.lineTo(x, sy(s.hi[b])); }
+        ctx.stroke(); ctx.globalAlpha=1;
+      }
     });
-    tb.appendChild(tbody);
-    show($("rcmp"),true);
-
-    // charts
-    drawCmpBars(methods, ranks, r2.map(r=> String(r["Alternative"])));
-    drawCmpScatter({methods, names:r2.map(r=> String(r["Alternative"]))}, $("mmc_x").value, $("mmc_y").value);
-    drawHeatSpearman({methods});
+    canvasXLabels(ctx, bs[order[0]], padL, cell, H-8, i=> names[i]);
+    cv._hit=(x,y)=>{
+      const b=Math.floor((x-padL)/cell);
+      if(b<0 || b>=bins || y<padT || y>H-padB) return null;
+      const k=Math.floor((x-padL-b*cell-(cell-groupW)/2)/(barW+gap)), s0=bs[order[0]];
+      const one=s0.count(b)===1;
+      return binLabel(s0, b, i=> names[i])+order.map((m,j)=>{
+        const s=bs[m], row=one? s.hi[b].toFixed(6) : `${s.mean(b).toFixed(6)} (${s.lo[b].toFixed(4)} – ${s.hi[b].toFixed(4)})`;
+        return "<br/>"+(j===k? `<b>${m}</b>` : m)+": "+row;
+      }).join("");
+    };
   }
 
-  // ---------- Tooltip ----------
-  const TT = $("tt");
-  function showTT(x,y,html){ TT.style.display="block"; TT.style.left=(x+12)+"px"; TT.style.top=(y+12)+"px"; TT.innerHTML=html; }
-  function hideTT(){ TT.style.display="none"; }
+  // Density scatter: counts on a CELL-px grid, shaded on a log scale; hover reports the cell.
+  function canvasScatter(xs, ys, names, mx, my, fit){
+    const {cv,ctx,W,H}=chartCanvas("mmc_sc", 900, 360), padL=60,padR=20,padT=20,padB=50, CELL=3;
+    const {Xmin,Xmax,Ymin,Ymax,sx,sy}=fit;
+    canvasAxes(ctx, W, H, padL, padR, padT, padB, 0, 0, 0);
+    const gx=Math.ceil((W-padL-padR)/CELL)+1, gy=Math.ceil((H-padT-padB)/CELL)+1;
+    const cnt=new Uint32Array(gx*gy), rep=new Int32Array(gx*gy);
+    let top=0;
+    for(let i=0;i<xs.length;i++){
+      const c=Math.floor((sy(ys[i])-padT)/CELL)*gx+Math.floor((sx(xs[i])-padL)/CELL);
+      rep[c]=i; if(++cnt[c]>top) top=cnt[c];
+    }
+    const lt=Math.log(top+1);
+    for(let c=0;c<cnt.length;c++){
+      if(!cnt[c]) continue;
+      const t=0.25+0.75*Math.log(cnt[c]+1)/lt;   // light pink -> hot pink -> near black
+      const r=Math.round(t<0.7? 249-(249-236)*t/0.7 : 236-(236-80)*(t-0.7)/0.3);
+      const g=Math.round(t<0.7? 168-(168-72)*t/0.7 : 72-(72-7)*(t-0.7)/0.3);
+      const bl=Math.round(t<0.7? 212-(212-153)*t/0.7 : 153-(153-50)*(t-0.7)/0.3);
+      ctx.fillStyle="rgb("+r+","+g+","+bl+")";
+      ctx.fillRect(padL+(c%gx)*CELL, padT+Math.floor(c/gx)*CELL, CELL, CELL);
+    }
+    ctx.strokeStyle="#000"; ctx.lineWidth=2; ctx.beginPath();
+    ctx.moveTo(padL, sy(fit.a+fit.b*Xmin)); ctx.lineTo(W-padR, sy(fit.a+fit.b*Xmax)); ctx.stroke();
+    ctx.fillStyle="#000"; ctx.textAlign="center"; ctx.textBaseline="alphabetic";
+    ctx.fillText("Pearson r = "+fit.r.toFixed(3), (padL+W-padR)/2, padT+14);
+    cv._hit=(x,y)=>{
+      const cx=Math.floor((x-padL)/CELL), cy=Math.floor((y-padT)/CELL);
+      if(cx<0 || cy<0 || cx>=gx || cy>=gy) return null;
+      const c=cy*gx+cx, i=rep[c];
+      if(!cnt[c]) return null;
+      const pt=`${mx}: ${xs[i].toFixed(6)}<br/>${my}: ${ys[i].toFixed(6)}`;
+      return cnt[c]===1? `<b>${names[i]}</b><br/>`+pt : `<b>${cnt[c]} alternatives</b>, e.g. ${names[i]}<br/>`+pt;
+    };
+  }
 
   // ---------- Charts ----------
   function drawSimpleBar(svgId, data){
-    const svg=$(svgId); while(svg.firstChild) svg.removeChild(svg.firstChild);
+    if(data.length>SVG_MARKS) return canvasBar(svgId, data);
+    const svg=chartSvg(svgId);
     const W=(svg.getBoundingClientRect().width||800), H=(svg.getBoundingClientRect().height||360);
     svg.setAttribute("viewBox","0 0 "+W+" "+H);
     const padL=50,padR=20,padT=18,padB=44;
-    const max=Math.max(...data.map(d=>d.value))||1;
+    const max=extent(data.length, i=> data[i].value)[1]||1;
     const cell=(W-padL-padR)/data.length, barW=cell*0.8;
 
     const yAxis=document.createElementNS("http://www.w3.org/2000/svg","line");
@@ -785,11 +2416,12 @@ function computeCOBRA(rows, crits, types, weights, wmode){
   }
 
   function drawSimpleLine(svgId, data){
-    const svg=$(svgId); while(svg.firstChild) svg.removeChild(svg.firstChild);
+    if(data.length>SVG_MARKS) return canvasLine(svgId, data);
+    const svg=chartSvg(svgId);
     const W=(svg.getBoundingClientRect().width||800), H=(svg.getBoundingClientRect().height||300);
     svg.setAttribute("viewBox","0 0 "+W+" "+H);
     const padL=50,padR=20,padT=14,padB=30;
-    const maxY=Math.max(...data.map(d=>d.value))||1, minX=1, maxX=Math.max(...data.map(d=>d.rank))||1;
+    const maxY=extent(data.length, i=> data[i].value)[1]||1, minX=1, maxX=extent(data.length, i=> data[i].rank)[1]||1;
     const sx=(r)=> padL+(W-padL-padR)*((r-minX)/(maxX-minX||1));
     const sy=(v)=> H-padB-(H-padT-padB)*(v/maxY);
 
@@ -813,14 +2445,74 @@ function computeCOBRA(rows, crits, types, weights, wmode){
     svg.appendChild(p);
   }
 
+  // Rank of each shown alternative across the β grid; the shaded band is its rank range.
+  function drawBetaSweep(svgId, sw, alts, names, beta){
+    const ticks=[0, 0.2, 0.4, 0.6, 0.8, 1].map(b=> [b, b.toFixed(1)]);
+    drawRankPaths(svgId, sw, alts, names, ticks, "β ∈ [0, 1]", beta);
+  }
+  // sw: {steps, n, ranks, lo, hi} over steps+1 x positions spread across [0, 1] (read through
+  // sweepRank);
+  // ticks: [[x, label]], span: what the x axis covers (tooltip), marker: x of a dashed line
+  function drawRankPaths(svgId, sw, alts, names, ticks, span, marker){
+    const svg=$(svgId); while(svg.firstChild) svg.removeChild(svg.firstChild);
+    const W=(svg.getBoundingClientRect().width||800), H=(svg.getBoundingClientRect().height||360);
+    svg.setAttribute("viewBox","0 0 "+W+" "+H);
+    const padL=50,padR=110,padT=14,padB=36, n=sw.n;
+    let worst=1; alts.forEach(i=>{ if(sw.hi[i]>worst) worst=sw.hi[i]; });
+    const sx=(b)=> padL+(W-padL-padR)*b;
+    const sy=(r)=> padT+(H-padT-padB)*((r-1)/((worst-1)||1));
+
+    const yAxis=document.createElementNS("http://www.w3.org/2000/svg","line");
+    yAxis.setAttribute("x1",padL); yAxis.setAttribute("x2",padL); yAxis.setAttribute("y1",padT); yAxis.setAttribute("y2",H-padB); yAxis.setAttribute("stroke","#000"); svg.appendChild(yAxis);
+    const xAxis=document.createElementNS("http://www.w3.org/2000/svg","line");
+    xAxis.setAttribute("x1",padL); xAxis.setAttribute("x2",W-padR); xAxis.setAttribute("y1",H-padB); xAxis.setAttribute("y2",H-padB); xAxis.setAttribute("stroke","#000"); svg.appendChild(xAxis);
+    ticks.forEach(([x, label])=>{
+      const tx=document.createElementNS("http://www.w3.org/2000/svg","text");
+      tx.setAttribute("x",sx(x)); tx.setAttribute("y",H-padB+16); tx.setAttribute("text-anchor","middle");
+      tx.setAttribute("font-size","12"); tx.setAttribute("fill","#000"); tx.textContent=label; svg.appendChild(tx);
+    });
+    const at=(k)=> sw.steps? k/sw.steps : 0.5;
+    const step=Math.max(1, Math.ceil((worst-1)/8));
+    for(let r=1;r<=worst;r+=step){
+      const tx=document.createElementNS("http://www.w3.org/2000/svg","text");
+      tx.setAttribute("x",padL-10); tx.setAttribute("y",sy(r)+4); tx.setAttribute("text-anchor","end");
+      tx.setAttribute("font-size","12"); tx.setAttribute("fill","#000"); tx.textContent=r; svg.appendChild(tx);
+    }
+
+    alts.forEach((i,s)=>{
+      const color=PASTELS[s%PASTELS.length];
+      const band=document.createElementNS("http://www.w3.org/2000/svg","rect");
+      band.setAttribute("x",padL); band.setAttribute("width",W-padL-padR);
+      band.setAttribute("y",sy(sw.lo[i])-3); band.setAttribute("height",sy(sw.hi[i])-sy(sw.lo[i])+6);
+      band.setAttribute("fill",color); band.setAttribute("opacity","0.25"); svg.appendChild(band);
+      let d="";
+      for(let k=0;k<=sw.steps;k++) d += (k? "L":"M")+sx(at(k))+" "+sy(sweepRank(sw, k, i))+" ";
+      const p=document.createElementNS("http://www.w3.org/2000/svg","path");
+      p.setAttribute("d",d.trim()); p.setAttribute("fill","none"); p.setAttribute("stroke",color); p.setAttribute("stroke-width","3");
+      p.addEventListener("mousemove",(ev)=> showTT(ev.clientX, ev.clientY, `<b>${names[i]}</b><br/>rank ${sw.lo[i]}–${sw.hi[i]} over ${span}`));
+      p.addEventListener("mouseleave", hideTT);
+      svg.appendChild(p);
+      const lbl=document.createElementNS("http://www.w3.org/2000/svg","text");
+      lbl.setAttribute("x",W-padR+6); lbl.setAttribute("y",sy(sweepRank(sw, sw.steps, i))+4);
+      lbl.setAttribute("font-size","12"); lbl.setAttribute("fill","#000"); lbl.textContent=names[i]; svg.appendChild(lbl);
+    });
+
+    if(marker==null) return;
+    const mk=document.createElementNS("http://www.w3.org/2000/svg","line");
+    mk.setAttribute("x1",sx(marker)); mk.setAttribute("x2",sx(marker)); mk.setAttribute("y1",padT); mk.setAttribute("y2",H-padB);
+    mk.setAttribute("stroke","#000"); mk.setAttribute("stroke-dasharray","4 3"); svg.appendChild(mk);
+  }
+
   function drawCmpBars(methods, ranks, names){
-    const svg=$("mmc_bar"); while(svg.firstChild) svg.removeChild(svg.firstChild);
+    const order=ORDER;
+    drawLegend(order);
+    if(names.length*order.length>SVG_MARKS) return canvasCmpBars(methods, names, order);
+    const svg=chartSvg("mmc_bar");
     const W=(svg.getBoundingClientRect().width||900), H=(svg.getBoundingClientRect().height||360);
     svg.setAttribute("viewBox","0 0 "+W+" "+H);
     const padL=70,padR=20,padT=20,padB=66;
-    const order=["TOPSIS","VIKOR","SAW","SYAI","COBRA","WASPAS","MOORA"];
-    const vals = names.map((nm,i)=> order.map(m=> methods[m][i]));
-    const max = Math.max(...vals.flat()), min = Math.min(...vals.flat());
+    let min=Infinity, max=-Infinity;
+    order.forEach(m=>{ const [lo,hi]=extent(names.length, i=> methods[m][i]); if(lo<min) min=lo; if(hi>max) max=hi; });
     const yMin=Math.min(min,0), yMax=Math.max(max,0), range=(yMax-yMin)||1;
 
     const yAxis=document.createElementNS("http://www.w3.org/2000/svg","line");
@@ -861,8 +2553,10 @@ function computeCOBRA(rows, crits, types, weights, wmode){
         svg.appendChild(rect);
       });
     });
+  }
 
-    // Legend (method → color)
+  // Legend (method → color)
+  function drawLegend(order){
     const leg = $("legend"); leg.innerHTML="";
     order.forEach(m=>{
       const pill = document.createElement("span"); pill.className="pill";
@@ -875,15 +2569,25 @@ function computeCOBRA(rows, crits, types, weights, wmode){
 
   // Scatter (STRIKING per alternative)
   function drawCmpScatter(res, mx, my){
-    const svg=$("mmc_sc"); while(svg.firstChild) svg.removeChild(svg.firstChild);
-    const W=(svg.getBoundingClientRect().width||900), H=(svg.getBoundingClientRect().height||360);
+    const xs=res.methods[mx], ys=res.methods[my], n=xs.length;
+    const W0=900, H0=360, padL=60,padR=20,padT=20,padB=50;
+    const box=$("mmc_sc").parentNode, W=box.clientWidth||W0, H=box.clientHeight||H0;
+    let Xmin=Infinity, Xmax=-Infinity, Ymin=Infinity, Ymax=-Infinity, mxv=0, myv=0;
+    for(let i=0;i<n;i++){
+      const x=xs[i], y=ys[i]; mxv+=x; myv+=y;
+      if(x<Xmin) Xmin=x; if(x>Xmax) Xmax=x; if(y<Ymin) Ymin=y; if(y>Ymax) Ymax=y;
+    }
+    mxv/=n; myv/=n;
+    let num=0, dx=0, dy=0;
+    for(let i=0;i<n;i++){ const a=xs[i]-mxv, b=ys[i]-myv; num+=a*b; dx+=a*a; dy+=b*b; }
+    const fit={Xmin, Xmax, Ymin, Ymax, r:num/Math.sqrt((dx||1)*(dy||1)), b:num/(dx||1)};
+    fit.a=myv-fit.b*mxv;
+    fit.sx=(x)=> padL + (W-padL-padR)*((x-Xmin)/((Xmax-Xmin)||1));
+    fit.sy=(y)=> H-padB - (H-padT-padB)*((y-Ymin)/((Ymax-Ymin)||1));
+    if(n>SVG_MARKS) return canvasScatter(xs, ys, res.names, mx, my, fit);
+
+    const svg=chartSvg("mmc_sc"), {sx, sy}=fit;
     svg.setAttribute("viewBox","0 0 "+W+" "+H);
-    const padL=60,padR=20,padT=20,padB=50;
-    const xs=res.methods[mx], ys=res.methods[my];
-    const Xmin=Math.min(...xs), Xmax=Math.max(...xs), Ymin=Math.min(...ys), Ymax=Math.max(...ys);
-    const sx=(x)=> padL + (W-padL-padR)*((x-Xmin)/((Xmax-Xmin)||1));
-    const sy=(y)=> H-padB - (H-padT-padB)*((y-Ymin)/((Ymax-Ymin)||1));
-
     const ax=document.createElementNS("http://www.w3.org/2000/svg","line");
     ax.setAttribute("x1",padL); ax.setAttribute("x2",padL); ax.setAttribute("y1",padT); ax.setAttribute("y2",H-padB); ax.setAttribute("stroke","#000"); svg.appendChild(ax);
     const ay=document.createElementNS("http://www.w3.org/2000/svg","line");
@@ -898,49 +2602,24 @@ function computeCOBRA(rows, crits, types, weights, wmode){
       svg.appendChild(c);
     });
 
-    const mean=(a)=> a.reduce((s,v)=>s+v,0)/a.length;
-    const mxv=mean(xs), myv=mean(ys);
-    let num=0, dx=0, dy=0;
-    for(let i=0;i<xs.length;i++){ const a=xs[i]-mxv, b=ys[i]-myv; num+=a*b; dx+=a*a; dy+=b*b; }
-    const r = num/Math.sqrt((dx||1)*(dy||1));
-    const b = num/(dx||1), a = myv - b*mxv;
     const line=document.createElementNS("http://www.w3.org/2000/svg","line");
-    line.setAttribute("x1",padL); line.setAttribute("y1",sy(a+b*Xmin));
-    line.setAttribute("x2",W-padR); line.setAttribute("y2",sy(a+b*Xmax));
+    line.setAttribute("x1",padL); line.setAttribute("y1",sy(fit.a+fit.b*Xmin));
+    line.setAttribute("x2",W-padR); line.setAttribute("y2",sy(fit.a+fit.b*Xmax));
     line.setAttribute("stroke","#000"); line.setAttribute("stroke-width","2"); svg.appendChild(line);
     const cap=document.createElementNS("http://www.w3.org/2000/svg","text");
     cap.setAttribute("x",(padL+W-padR)/2); cap.setAttribute("y",padT+14); cap.setAttribute("text-anchor","middle");
-    cap.setAttribute("font-size","12"); cap.setAttribute("fill","#000"); cap.textContent="Pearson r = "+r.toFixed(3); svg.appendChild(cap);
+    cap.setAttribute("font-size","12"); cap.setAttribute("fill","#000"); cap.textContent="Pearson r = "+fit.r.toFixed(3); svg.appendChild(cap);
   }
 
-  // Spearman heatmap — HOT PINK palette + legend + hover
-  function drawHeatSpearman(res){
-    const methods=["TOPSIS","VIKOR","SAW","SYAI","COBRA","WASPAS","MOORA"];
+  // Rank-correlation heatmap — HOT PINK palette + legend + hover
+  function drawHeatCorr(R, sym, title){
+    const methods=ORDER;
     const svg=$("mmc_heat"); while(svg.firstChild) svg.removeChild(svg.firstChild);
     const W=(svg.getBoundingClientRect().width||900), H=(svg.getBoundingClientRect().height||480);
     svg.setAttribute("viewBox","0 0 "+W+" "+H);
     const padL=120, padR=60, padT=60, padB=80;
     const n=methods.length;
 
-    function rankArray(a){
-      const idx=a.map((v,i)=>({v,i})).sort((x,y)=> x.v-y.v);
-      const r=new Array(a.length); let i=0;
-      while(i<idx.length){
-        let j=i; while(j+1<idx.length && idx[j+1].v===idx[i].v) j++;
-        const avg=(i+j)/2 + 1; for(let k=i;k<=j;k++) r[idx[k].i]=avg; i=j+1;
-      }
-      return r;
-    }
-    function pearson(x,y){
-      const n=x.length; const mx=x.reduce((s,v)=>s+v,0)/n, my=y.reduce((s,v)=>s+v,0)/n;
-      let num=0, dx=0, dy=0; for(let i=0;i<n;i++){ const a=x[i]-mx, b=y[i]-my; num+=a*b; dx+=a*a; dy+=b*b; }
-      return num/Math.sqrt((dx||1)*(dy||1));
-    }
-
-    const data = methods.map(m=> res.methods[m]);
-    const ranks = data.map(arr=> rankArray(arr));
-    const R = methods.map((_,i)=> methods.map((_,j)=> pearson(ranks[i], ranks[j])));
-
     function colorFor(v){ // v in [-1,1]
       const t = (v+1)/2; // 0..1
       const c0 = {r:255,g:233,b:242}; // #ffe9f2 very light pink
@@ -972,7 +2651,7 @@ function computeCOBRA(rows, crits, types, weights, wmode){
         const rect=document.createElementNS("http://www.w3.org/2000/svg","rect");
         rect.setAttribute("x",x); rect.setAttribute("y",y); rect.setAttribute("width",cellW-1); rect.setAttribute("height",cellH-1);
         rect.setAttribute("fill", colorFor(val)); rect.setAttribute("stroke","#ffffff"); rect.setAttribute("stroke-width","0.5");
-        rect.addEventListener("mousemove",(ev)=> showTT(ev.clientX, ev.clientY, `<b>${methods[i]}</b> vs <b>${methods[j]}</b><br/>ρ = ${val.toFixed(3)}`));
+        rect.addEventListener("mousemove",(ev)=> showTT(ev.clientX, ev.clientY, `<b>${methods[i]}</b> vs <b>${methods[j]}</b><br/>${sym} = ${val.toFixed(3)}`));
         rect.addEventListener("mouseleave", hideTT);
         svg.appendChild(rect);
       }
@@ -998,15 +2677,23 @@ function computeCOBRA(rows, crits, types, weights, wmode){
       t.setAttribute("x", Lx + Lw + 6); t.setAttribute("y", y+4); t.setAttribute("font-size","12"); t.setAttribute("fill","#000");
       t.textContent = v.toFixed(1); svg.appendChild(t);
     });
-    const lh=document.createElementNS("http://www.w3.org/200/svg","text");
+    const lh=document.createElementNS("http://www.w3.org/2000/svg","text");
     lh.setAttribute("x", Lx-2); lh.setAttribute("y", Ly-10); lh.setAttribute("text-anchor","end");
-    lh.setAttribute("font-size","12"); lh.setAttribute("fill","#000"); lh.textContent="Spearman ρ (hot pink)"; svg.appendChild(lh);
+    lh.setAttribute("font-size","12"); lh.setAttribute("fill","#000"); lh.textContent=title+" (hot pink)"; svg.appendChild(lh);
   }
 
   // ---------- events ----------
   $("runCmp").onclick = ()=> runComparison();
-  $("mmc_x").onchange = ()=> runComparison();
-  $("mmc_y").onchange = ()=> runComparison();
+  $("mmc_x").onchange = redrawCmpScatter;
+  $("cmpRankBy").onchange = ()=>{ if(shownCmp) renderComparison(shownCmp.res); };
+  $("cmpTopK").onchange = ()=> liveComparison();
+  $("cmpSpearman").onclick = runSpearman;
+  $("runScn").onclick = runScenarios;
+  $("scnAdd").onclick = addScenarioRow;
+  $("scnMethod").onchange = renderScenarios;
+  $("scnFile").onchange = (e)=>{ const f=e.target.files[0]; if(!f) return; const r=new FileReader(); r.onload=()=>{ $("scnText").value=String(r.result); }; r.readAsText(f); };
+  $("cmpCorr").onchange = ()=>{ if(!shownCmp) return; drawCorrelation(shownCmp.res); if($("cmpCorr").value==="kendall") runKendall(); };
+  $("mmc_y").onchange = redrawCmpScatter;
 
   // ---------- preload sample on SYAI tab ----------
   initSYAI(SAMPLE_TEXT);
@@ -1017,13 +2704,20 @@ function computeCOBRA(rows, crits, types, weights, wmode){
 </html>
 """
 
-# inject image URIs
-html = html.replace("SCATTER_DATA_URI", SCATTER_URI or "")
-html = html.replace("CORR_DATA_URI", CORR_URI or "")
-html = html.replace("HAS_SCATTER_FLAG", "1" if SCATTER_FOUND else "0")
-html = html.replace("HAS_CORR_FLAG", "1" if CORR_FOUND else "0")
-
-# inject *exact same* sample text used by both Load and Download
-html = html.replace("__INJECT_SAMPLE_CSV__", SAMPLE_CSV.replace("`","\\`"))
-
-components.html(html, height=4200, scrolling=True)
+# ---------- page assembly: once per process, rebuilt only when a source file changes ----------
+@st.cache_resource(max_entries=2)
+def build_page_html(asset_key: tuple) -> str:
+    scatter_src, scatter_found = img_src_try(IMG_CANDIDATES["scatter"])
+    corr_src, corr_found = img_src_try(IMG_CANDIDATES["corr"])
+    page = html.replace("SCATTER_DATA_URI", scatter_src or "")
+    page = page.replace("CORR_DATA_URI", corr_src or "")
+    page = page.replace("HAS_SCATTER_FLAG", "1" if scatter_found else "0")
+    page = page.replace("HAS_CORR_FLAG", "1" if corr_found else "0")
+    # inject *exact same* sample text used by both Load and Download
+    return page.replace("__INJECT_SAMPLE_CSV__", SAMPLE_CSV.replace("`","\\`"))
+
+ASSET_KEY = (
+    file_mtime(Path(__file__)), file_mtime(SAMPLE_PATH),
+    *(file_mtime(APP_DIR / c) for names in IMG_CANDIDATES.values() for c in names),
+)
+components.html(build_page_html(ASSET_KEY), height=4200, scrolling=True)
@@ -0,0 +1,43 @@
+"""SYAI-Rank: headless ranking engine behind the Streamlit page in app.py."""
+from .engine import (
+    BENEFIT,
+    COST,
+    CRITERION_TYPES,
+    HIGHER_IS_BETTER,
+    IDEAL,
+    METHODS,
+    ColumnMatrix,
+    ColumnStats,
+    as_columns,
+    cobra,
+    codas,
+    column_stats,
+    compare,
+    compute_weights,
+    edas,
+    mabac,
+    moora,
+    normalize_syai,
+    promethee,
+    rank,
+    rank_all,
+    saw,
+    saw_unit,
+    syai,
+    syai_closeness,
+    topsis,
+    vector_norm,
+    vikor,
+    waspas,
+)
+from .sensitivity import Sensitivity, sample_weights, weight_sensitivity
+
+__all__ = [
+    "BENEFIT", "COST", "IDEAL", "CRITERION_TYPES", "METHODS", "HIGHER_IS_BETTER",
+    "ColumnMatrix", "ColumnStats", "column_stats", "as_columns", "compute_weights",
+    "vector_norm", "saw_unit", "normalize_syai",
+    "syai", "syai_closeness", "cobra", "topsis", "vikor", "saw", "waspas", "moora",
+    "edas", "codas", "mabac", "promethee",
+    "compare", "rank", "rank_all",
+    "Sensitivity", "sample_weights", "weight_sensitivity",
+]
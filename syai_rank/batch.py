@@ -0,0 +1,231 @@
+# syai_rank/batch.py
+"""Score many CSV/Arrow/Parquet files into ranked tables, one process per file.
+
+A run is described by a JSON (or TOML) config keyed by criterion name, the
+same shape as the page's type/ideal/w dicts::
+
+    {"types": {"Cost": "Cost", "Delivery": "Ideal (Goal)"},
+     "goals": {"Delivery": 5},
+     "weights": {"Cost": 2, "Quality": 1},
+     "wmode": "custom", "beta": 0.5,
+     "methods": ["SYAI", "TOPSIS"],
+     "criteria": ["Cost", "Quality", "Delivery"]}
+
+Criteria missing from ``types`` are Benefit; with ``wmode="custom"`` a
+missing weight is 0, as an empty weight box is in the page. ``wmode``
+defaults to "custom" when weights are given and "equal" otherwise.
+``criteria`` (optional) restricts scoring to those columns; Arrow and
+Parquet inputs then never read the others.
+"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, Mapping, NamedTuple, Sequence
+
+import pandas as pd
+
+from .data import DecisionMatrix, read_matrix, write_parquet
+from .engine import HIGHER_IS_BETTER, METHODS, _evaluate, as_columns, rank, syai_closeness
+
+SYAI_BETA = "SYAI (β)"
+OUTPUT_SUFFIXES = {"csv": ".ranked.csv", "parquet": ".ranked.parquet"}
+
+
+class BatchConfig(NamedTuple):
+    types: Mapping = {}
+    goals: Mapping = {}
+    weights: Mapping = {}
+    wmode: str = "equal"
+    beta: float = 0.5
+    methods: tuple = METHODS
+    criteria: tuple | None = None
+
+    def columns(self, criteria: Sequence[str]) -> tuple[list, list, list]:
+        """Per-column types, goals and weights for one file's criteria."""
+        return (as_columns(criteria, self.types), as_columns(criteria, self.goals),
+                as_columns(criteria, self.weights))
+
+
+def load_config(path: str | os.PathLike | None = None, **overrides) -> BatchConfig:
+    """Read a JSON/TOML config (see module docstring); ``None`` values in overrides are ignored."""
+    raw = {}
+    if path is not None:
+        p = Path(path)
+        if p.suffix.lower() == ".toml":
+            import tomllib
+            raw = tomllib.loads(p.read_text(encoding="utf-8"))
+        else:
+            raw = json.loads(p.read_text(encoding="utf-8"))
+        if not isinstance(raw, dict):
+            raise ValueError(f"{p}: config must be an object")
+    raw.update((k, v) for k, v in overrides.items() if v is not None)
+    unknown = set(raw) - set(BatchConfig._fields)
+    if unknown:
+        raise ValueError(f"unknown config key(s): {sorted(unknown)}")
+    for key in ("types", "goals", "weights"):
+        if not isinstance(raw.get(key, {}), Mapping):
+            raise ValueError(f"{key!r} must map criterion names to values")
+    methods = tuple(dict.fromkeys(raw.get("methods", METHODS)))   # configured order, duplicates dropped
+    bad = set(raw.get("methods", ())) - set(METHODS)
+    if bad or not methods:
+        raise ValueError(f"unknown or empty method list: {sorted(bad) or raw.get('methods')}")
+    wmode = raw.get("wmode") or ("custom" if raw.get("weights") else "equal")
+    if wmode not in ("equal", "custom"):
+        raise ValueError(f"wmode must be 'equal' or 'custom', got {wmode!r}")
+    beta = float(raw.get("beta", 0.5))
+    if not 0.0 <= beta <= 1.0:
+        raise ValueError(f"beta must be in [0, 1], got {beta}")
+    criteria = raw.get("criteria")
+    if criteria is not None:
+        if isinstance(criteria, str) or not all(isinstance(c, str) for c in criteria):
+            raise ValueError("'criteria' must be a list of column names")
+        criteria = tuple(criteria)
+    return BatchConfig(raw.get("types", {}), raw.get("goals", {}), raw.get("weights", {}), wmode, beta,
+                       methods, criteria)
+
+
+def sort_column(cfg: BatchConfig, sort_by: str | None = None) -> str:
+    """The scored column named by ``sort_by`` in any case (default: the first configured method)."""
+    if not sort_by:
+        return cfg.methods[0]
+    names = [*cfg.methods, SYAI_BETA] if "SYAI" in cfg.methods else list(cfg.methods)
+    hit = {m.casefold(): m for m in names}.get(sort_by.strip().casefold())
+    if hit is None:
+        raise ValueError(f"cannot sort by {sort_by!r}: not among the scored methods {names}")
+    return hit
+
+
+def score_vectors(dm: DecisionMatrix, types, goals, weights, wmode: str = "equal",
+                  methods: Sequence[str] = METHODS, workers: int | None = None) -> dict:
+    """Score vector per method, plus ``"D+"``/``"D-"`` when SYAI is asked for.
+
+    Nothing here depends on β, so the result can be kept while β is varied
+    and turned into a table with scores_table(). Every method, SYAI's
+    distances included, comes from one fused pass over ``dm.X``.
+    """
+    r = _evaluate(dm.X, types, goals, weights, wmode, methods, dm.stats, workers)
+    scores = {}
+    for m in methods:   # in the order asked for; SYAI's place is kept by D+/D-
+        if m == "SYAI":
+            scores["D+"], scores["D-"] = r["_Dp"], r["_Dm"]
+        else:
+            scores[m] = r[m]
+    return scores
+
+
+def scores_table(names, vectors: Mapping, beta: float = 0.5) -> pd.DataFrame:
+    """Alternative, D+/D- when SYAI was scored, then ``<method>`` and ``<method> rank``
+    per method in the order of ``vectors`` (SYAI at beta = 0.5, as in compare(),
+    where D+ sits), and SYAI (β) last."""
+    out = pd.DataFrame({"Alternative": names})
+    scores = {}
+    for k, v in vectors.items():
+        if k == "D+":
+            Dp, Dm = v, vectors["D-"]
+            out["D+"], out["D-"] = Dp, Dm
+            scores["SYAI"] = syai_closeness(Dp, Dm, 0.5)
+        elif k in METHODS:
+            scores[k] = v
+    if "D+" in vectors:
+        scores[SYAI_BETA] = syai_closeness(Dp, Dm, beta)
+    for m, v in scores.items():
+        out[m] = v
+        out[m + " rank"] = rank(v, HIGHER_IS_BETTER.get(m, True))
+    return out
+
+
+def score_frame(dm: DecisionMatrix, types, goals, weights, wmode: str = "equal", beta: float = 0.5,
+                methods: Sequence[str] = METHODS, workers: int | None = None) -> pd.DataFrame:
+    """Scores and ranks as one table (see scores_table())."""
+    return scores_table(dm.names, score_vectors(dm, types, goals, weights, wmode, methods, workers), beta)
+
+
+# ---------- files ----------
+class FileResult(NamedTuple):
+    source: str
+    output: str | None
+    rows: int = 0
+    dropped: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def expand_inputs(patterns: Sequence[str]) -> list[str]:
+    """Glob patterns (``**`` allowed) and plain paths, deduplicated, in sorted order.
+
+    Glob matches skip earlier outputs (``*.ranked.csv``) so re-runs over the
+    same directory do not rank their own results.
+    """
+    seen = {}
+    for pat in patterns:
+        magic = glob.has_magic(pat)
+        for h in glob.glob(pat, recursive=True) if magic else [pat]:
+            if magic and h.endswith(tuple(OUTPUT_SUFFIXES.values())):
+                continue
+            if os.path.isfile(h):
+                seen.setdefault(os.path.abspath(h), h)
+    return sorted(seen.values())
+
+
+def output_path(source: str, out_dir: str | os.PathLike | None, fmt: str = "csv") -> Path:
+    src = Path(source)
+    return (Path(out_dir) if out_dir is not None else src.parent) / (src.stem + OUTPUT_SUFFIXES[fmt])
+
+
+def rank_file(source: str, cfg: BatchConfig, out_dir=None, sort_by: str | None = None,
+              fmt: str = "csv", cache: str | os.PathLike | None = None) -> FileResult:
+    """Score one file and write it sorted by ``sort_by`` (default: the first configured method).
+
+    With ``cache`` (a directory) the parsed matrix is read from, or stored
+    to, a cache.MatrixCache there instead of parsing the file every run.
+    """
+    t0 = time.perf_counter()
+    try:
+        if cache is not None:
+            from .cache import MatrixCache
+            dm = MatrixCache(cache).load(source, cfg.criteria)
+        else:
+            dm = read_matrix(source, cfg.criteria)
+        if not len(dm.X):
+            raise ValueError("no usable rows")
+        types, goals, weights = cfg.columns(dm.criteria)
+        df = score_frame(dm, types, goals, weights, cfg.wmode, cfg.beta, cfg.methods, workers=1)
+        key = sort_column(cfg, sort_by) + " rank"
+        dest = output_path(source, out_dir, fmt)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        df = df.sort_values(key, kind="stable")
+        if fmt == "parquet":
+            write_parquet(df, dest)
+        else:
+            df.to_csv(dest, index=False)
+    except (OSError, ValueError, ImportError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+        return FileResult(source, None, seconds=time.perf_counter() - t0, error=f"{type(e).__name__}: {e}")
+    return FileResult(source, str(dest), len(dm.X), dm.dropped, time.perf_counter() - t0)
+
+
+def run_batch(sources: Sequence[str], cfg: BatchConfig, out_dir=None, sort_by: str | None = None,
+              jobs: int | None = None, fmt: str = "csv", cache=None) -> Iterator[FileResult]:
+    """Rank every file on a process pool, yielding results as files finish.
+
+    Each file is scored single-threaded inside its process, so throughput
+    grows with ``jobs`` (default: all cores) instead of threads competing
+    within one file.
+    """
+    clash = [d for d, c in Counter(output_path(s, out_dir, fmt) for s in sources).items() if c > 1]
+    if clash:
+        raise ValueError(f"several inputs would write {clash[0]}; use distinct file names")
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(sources) or 1))
+    if jobs == 1:
+        for s in sources:
+            yield rank_file(s, cfg, out_dir, sort_by, fmt, cache)
+        return
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = [pool.submit(rank_file, s, cfg, out_dir, sort_by, fmt, cache) for s in sources]
+        for f in as_completed(futures):
+            yield f.result()
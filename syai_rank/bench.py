@@ -0,0 +1,237 @@
+# syai_rank/bench.py
+"""Reproducible timings: ``python -m syai_rank bench --sizes 1000x8,100000x12 -o bench.json``.
+
+Each size gets one seeded synthetic matrix: criteria cycle through Benefit,
+Cost and Ideal (Goal), every fourth criterion is a 1-9 rating (heavy ties),
+and a share of the rows duplicates earlier ones. The same CSV text is timed
+in both runtimes:
+
+* ``python`` - CSV ingest, column_stats, the normalization helpers, each
+  method on its own and compare() for all of them, ranking and Spearman.
+* ``js`` - the page's own SYAIKernels, cut out of app.py and run under
+  ``node`` when it is on PATH: parseCSVText/toMatrix, sawUnit,
+  normalizeColumn_SYAI, vectorNorm, computeSYAI_exact, computeCOBRA,
+  compareAll, the β sweep, ranking, spearmanMatrix, kendallMatrix and
+  scenarioTask over ten reweighted scenarios.
+
+Every case is run once to warm up, then ``repeat`` times. The JSON report
+keeps min and median seconds per (runtime, n, m, case) plus the
+environment, so two reports can be diffed for regressions. Chart
+rendering needs a browser DOM and is not covered.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+
+from .data import read_matrix
+from .engine import (
+    BENEFIT, COST, IDEAL, METHODS, cobra, codas, column_stats, compare, edas, mabac, moora,
+    normalize_syai, promethee, rank_all, saw, saw_unit, syai, topsis, vector_norm, vikor, waspas,
+)
+
+DEFAULT_SIZES = ((1_000, 8), (10_000, 8), (100_000, 12))
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+_TYPES = (BENEFIT, COST, IDEAL)
+
+
+# ---------- synthetic data ----------
+def synthetic_csv(n: int, m: int, seed: int = 0, dup: float = 0.05) -> tuple[str, dict]:
+    """CSV text for an ``n`` x ``m`` matrix plus its page inputs (types, ideals, weights by name)."""
+    rng = np.random.default_rng(seed)
+    X = np.empty((n, m))
+    for j in range(m):
+        X[:, j] = rng.integers(1, 10, n) if j % 4 == 3 else np.round(rng.lognormal(3.0, 0.6, n), 2)
+    if n > 1 and dup > 0:
+        k = int(n * dup)
+        X[rng.choice(np.arange(1, n), k, replace=False)] = X[rng.integers(0, n // 2 + 1, k)]
+    crit = [f"C{j + 1}" for j in range(m)]
+    types = {c: _TYPES[j % 3] for j, c in enumerate(crit)}
+    ideals = {c: float(np.median(X[:, j])) for j, c in enumerate(crit) if types[c] == IDEAL}
+    weights = {c: float(w) for c, w in zip(crit, rng.integers(1, 6, m))}
+    lines = ["Alternative," + ",".join(crit)]
+    lines += [f"A{i + 1}," + ",".join(f"{v:g}" for v in row) for i, row in enumerate(X)]
+    return "\n".join(lines) + "\n", {"types": types, "ideals": ideals, "weights": weights}
+
+
+# ---------- timing ----------
+def timeit(fn: Callable[[], object], repeat: int = 5) -> list[float]:
+    fn()
+    out = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return out
+
+
+def _row(runtime: str, n: int, m: int, case: str, times: Sequence[float]) -> dict:
+    return {"runtime": runtime, "n": n, "m": m, "case": case, "runs": len(times),
+            "min_s": min(times), "median_s": statistics.median(times)}
+
+
+def bench_python(csv: str, spec: dict, repeat: int = 5, workers: int | None = 1) -> list[dict]:
+    data = csv.encode("utf-8")
+    dm = read_matrix(data)
+    X, crit = np.asarray(dm.X), dm.criteria
+    n, m = X.shape
+    t = [spec["types"].get(c, BENEFIT) for c in crit]
+    g = [spec["ideals"].get(c) for c in crit]
+    w = [spec["weights"].get(c, 0) for c in crit]
+    kw = {"workers": workers}
+    scores = compare(X, t, g, w, "custom", **kw)
+    ranks = rank_all(scores)
+    R = np.array([ranks[k] for k in METHODS], dtype=np.float64)
+    cases = {
+        "ingest_csv": lambda: read_matrix(data),
+        "column_stats": lambda: column_stats(X, workers),
+        "vector_norm": lambda: vector_norm(X),
+        "saw_unit": lambda: saw_unit(X, t, g),
+        "normalize_syai": lambda: normalize_syai(X, t, g),
+        "TOPSIS": lambda: topsis(X, t, w, "custom", **kw),
+        "VIKOR": lambda: vikor(X, t, w, "custom", **kw),
+        "SAW": lambda: saw(X, t, g, w, "custom", **kw),
+        "SYAI": lambda: syai(X, t, g, w, "custom", 0.5, **kw),
+        "COBRA": lambda: cobra(X, t, w, "custom", **kw),
+        "WASPAS": lambda: waspas(X, t, g, w, "custom", **kw),
+        "MOORA": lambda: moora(X, t, g, w, "custom", **kw),
+        "EDAS": lambda: edas(X, t, g, w, "custom", **kw),
+        "CODAS": lambda: codas(X, t, g, w, "custom", **kw),
+        "MABAC": lambda: mabac(X, t, g, w, "custom", **kw),
+        "PROMETHEE II": lambda: promethee(X, t, g, w, "custom", **kw),
+        "compare_all": lambda: compare(X, t, g, w, "custom", **kw),
+        "rank_all": lambda: rank_all(scores),
+        "spearman": lambda: np.corrcoef(R),
+    }
+    return [_row("python", n, m, k, timeit(fn, repeat)) for k, fn in cases.items()]
+
+
+# ---------- in-page JS ----------
+_JS_DRIVER = r"""
+const fs = require("fs");
+const K = (%s)();
+const {csv, repeat, types, ideals, weights} = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+function timeit(fn){
+  fn(); const t = [];
+  for(let r = 0; r < repeat; r++){ const a = process.hrtime.bigint(); fn(); t.push(Number(process.hrtime.bigint() - a) / 1e9); }
+  return t;
+}
+const D = K.toMatrix(K.parseCSVText(csv)), cols = D.crit.map((c, j) => K.col(D, j));
+const methods = K.compareAll(D, types, ideals, weights, "custom");
+const sy = K.computeSYAI_exact(D, types, ideals, weights, "custom", 0.5);
+const scenarios = Array.from({length: 10}, (_, k) => ({name: "S" + k, types, ideals, wmode: "custom",
+  weights: Object.fromEntries(D.crit.map((c, j) => [c, weights[c] * (1 + (j + k) %% 3)]))}));
+const rank = k => K.LOWER_IS_BETTER[k] ? K.ranksLower(methods[k]) : K.ranksHigher(methods[k]);
+const cases = {
+  parseCSVText: () => K.parseCSVText(csv),
+  toMatrix: () => K.toMatrix(K.parseCSVText(csv)),
+  vectorNorm: () => cols.forEach(K.vectorNorm),
+  sawUnit: () => cols.forEach((v, j) => K.sawUnit(v, types[D.crit[j]], ideals[D.crit[j]])),
+  normalizeColumn_SYAI: () => cols.forEach((v, j) => K.normalizeColumn_SYAI(v, types[D.crit[j]], ideals[D.crit[j]])),
+  computeSYAI_exact: () => K.computeSYAI_exact(D, types, ideals, weights, "custom", 0.5),
+  computeCOBRA: () => K.computeCOBRA(D, types, weights, "custom"),
+  compareAll: () => K.compareAll(D, types, ideals, weights, "custom"),
+  syaiBetaSweep: () => K.syaiBetaSweep(sy.Dp, sy.Dm, 100),
+  rank_all: () => K.ORDER.forEach(rank),
+  spearmanMatrix: () => K.spearmanMatrix(K.ORDER.map(k => methods[k]), null, K.ORDER.map(k => !K.LOWER_IS_BETTER[k])),
+  kendallMatrix: () => K.kendallMatrix(K.ORDER.map(k => methods[k])),
+  scenarioTask: () => K.scenarioTask(D, {scenarios}),
+};
+const out = {};
+for(const k in cases) out[k] = timeit(cases[k]);
+console.log(JSON.stringify({n: D.n, m: D.m, node: process.version, times: out}));
+"""
+
+
+def kernels_source(app: str | os.PathLike = APP_PATH) -> str:
+    """Source of the page's ``function SYAIKernels(){...}``, brace-matched out of app.py."""
+    src = Path(app).read_text(encoding="utf-8")
+    start = src.find("function SYAIKernels(")
+    if start < 0:
+        raise ValueError(f"{app}: SYAIKernels not found")
+    depth = 0
+    for i in range(src.index("{", start), len(src)):
+        depth += {"{": 1, "}": -1}.get(src[i], 0)
+        if depth == 0:
+            return src[start:i + 1]
+    raise ValueError(f"{app}: unbalanced SYAIKernels source")
+
+
+def node_path() -> str | None:
+    return shutil.which("node")
+
+
+def bench_js(csv: str, spec: dict, repeat: int = 5, app: str | os.PathLike = APP_PATH,
+             node: str | None = None) -> tuple[list[dict], str]:
+    """Time the page kernels under node; returns the rows and node's version."""
+    node = node or node_path()
+    if node is None:
+        raise RuntimeError("node not found on PATH")
+    with tempfile.TemporaryDirectory() as tmp:
+        driver, args = Path(tmp, "bench.js"), Path(tmp, "args.json")
+        driver.write_text(_JS_DRIVER % kernels_source(app), encoding="utf-8")
+        args.write_text(json.dumps({"csv": csv, "repeat": repeat, **spec}), encoding="utf-8")
+        proc = subprocess.run([node, "--max-old-space-size=8192", str(driver), str(args)],
+                              capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f"node failed: {proc.stderr.strip()[-2000:]}")
+    r = json.loads(proc.stdout.strip().splitlines()[-1])
+    return [_row("js", r["n"], r["m"], k, t) for k, t in r["times"].items()], r["node"]
+
+
+# ---------- report ----------
+def _commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+                              capture_output=True, text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: Sequence[tuple[int, int]] = DEFAULT_SIZES, repeat: int = 5, seed: int = 0,
+        js: bool = True, workers: int | None = 1, log=None) -> dict:
+    """Benchmark every size in both runtimes; the JSON-ready report."""
+    meta = {"created": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "commit": _commit(), "seed": seed,
+            "repeat": repeat, "workers": workers, "python": platform.python_version(),
+            "numpy": np.__version__, "platform": platform.platform(), "cpus": os.cpu_count(), "node": None}
+    results = []
+    node = node_path() if js else None
+    for n, m in sizes:
+        csv, spec = synthetic_csv(n, m, seed)
+        if log:
+            log(f"python {n}x{m}")
+        results += bench_python(csv, spec, repeat, workers)
+        if node:
+            if log:
+                log(f"js     {n}x{m}")
+            rows, meta["node"] = bench_js(csv, spec, repeat, node=node)
+            results += rows
+    return {"meta": meta, "results": results}
+
+
+def parse_sizes(s: str) -> list[tuple[int, int]]:
+    """``"1000x8,1e5x12"`` -> ``[(1000, 8), (100000, 12)]``."""
+    out = []
+    for part in s.split(","):
+        if part.strip():
+            n, _, m = part.lower().partition("x")
+            out.append((int(float(n)), int(m or 8)))
+    return out
+
+
+def format_table(report: dict) -> str:
+    lines = [f"{'runtime':<7} {'n':>9} {'m':>3}  {'case':<22} {'min ms':>10} {'median ms':>10}"]
+    for r in report["results"]:
+        lines.append(f"{r['runtime']:<7} {r['n']:>9} {r['m']:>3}  {r['case']:<22} "
+                     f"{r['min_s'] * 1e3:>10.3f} {r['median_s'] * 1e3:>10.3f}")
+    return "\n".join(lines)
@@ -0,0 +1,200 @@
+# syai_rank/cache.py
+"""On-disk cache of parsed decision matrices, keyed by file content.
+
+Each entry is a directory named after the BLAKE2b digest of the source bytes:
+
+* ``X.npy`` - float64 criteria matrix in column-major order, so one
+  criterion is one contiguous run of the file;
+* ``names.npy`` - alternative labels as a fixed-width unicode array;
+* ``meta.json`` - criteria, dropped-row count, column statistics and format
+  version.
+
+Loading memory-maps both arrays read-only and rebuilds the ColumnStats from
+the sidecar, so re-opening a parsed file costs a few syscalls. Pages are
+read only when a column is touched, and a criteria subset never touches the
+others. Looking a path up skips hashing while its size and mtime match
+what ``index.json`` recorded for it.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .data import DecisionMatrix, read_matrix
+from .engine import ColumnMatrix, ColumnStats
+
+FORMAT = 1
+_HASH_CHUNK = 1 << 22
+
+
+def default_root() -> Path:
+    """``$SYAI_RANK_CACHE``, else ``$XDG_CACHE_HOME/syai_rank`` (``~/.cache/syai_rank``)."""
+    if os.environ.get("SYAI_RANK_CACHE"):
+        return Path(os.environ["SYAI_RANK_CACHE"])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "syai_rank"
+
+
+def content_digest(source) -> str:
+    """BLAKE2b-128 of a file path's contents or of a bytes-like object."""
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK):
+                h.update(chunk)
+    else:
+        h.update(memoryview(source))
+    return h.hexdigest()
+
+
+class MatrixCache:
+    """Content-addressed store of parsed matrices under ``root``.
+
+    ``max_bytes`` bounds the total size and ``max_age`` (seconds) the time
+    since an entry was last loaded; both are enforced after each store, the
+    least recently loaded entries going first. The entry just stored is
+    kept even when it alone exceeds ``max_bytes``.
+    """
+
+    def __init__(self, root: str | os.PathLike | None = None, max_bytes: int | None = None,
+                 max_age: float | None = None):
+        self.root = Path(root) if root is not None else default_root()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    # ---------- lookup ----------
+    def load(self, source, criteria=None, alt: str | None = None, digest: str | None = None) -> DecisionMatrix:
+        """DecisionMatrix for a path or bytes, parsing (and storing) only on a miss.
+
+        The whole file is stored, so any later ``criteria`` subset is served
+        from the same entry. ``digest`` skips hashing when the caller already
+        has content_digest(source).
+        """
+        digest = digest or self._digest(source)
+        entry = self.root / digest
+        if not (entry / "meta.json").exists():
+            self._store(entry, read_matrix(source, alt=alt), source)
+        return self._open(entry, criteria)
+
+    def __contains__(self, source) -> bool:
+        return (self.root / self._digest(source) / "meta.json").exists()
+
+    def _digest(self, source) -> str:
+        if not isinstance(source, (str, os.PathLike)):
+            return content_digest(source)
+        path = os.path.abspath(source)
+        st = os.stat(path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        index = self._read_index()
+        hit = index.get(path)
+        if hit and hit[:2] == stamp:
+            return hit[2]
+        digest = content_digest(path)
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            index = self._read_index()
+            index[path] = stamp + [digest]
+            self._write_json(self.root / "index.json", index)
+        return digest
+
+    def _read_index(self) -> dict:
+        try:
+            return json.loads((self.root / "index.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    # ---------- entries ----------
+    def _open(self, entry: Path, criteria) -> DecisionMatrix:
+        meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("format") != FORMAT:
+            raise ValueError(f"{entry}: cache format {meta.get('format')}, expected {FORMAT}")
+        os.utime(entry / "meta.json")          # recency for pruning
+        X = np.load(entry / "X.npy", mmap_mode="r")
+        names = np.load(entry / "names.npy", mmap_mode="r")
+        all_criteria = meta["criteria"]
+        if criteria is None:
+            criteria = all_criteria
+        missing = [c for c in criteria if c not in all_criteria]
+        if missing:
+            raise ValueError(f"column(s) not in file: {missing}")
+        idx = [all_criteria.index(c) for c in criteria]
+        s = meta["stats"]
+        stats = ColumnStats(s["n"], *(np.asarray(s[k], dtype=np.float64)[idx] for k in ("min", "max", "sum", "sumsq"))) \
+            if s else None
+        return DecisionMatrix(names, list(criteria), ColumnMatrix([X[:, j] for j in idx]), meta["dropped"], stats)
+
+    def _store(self, entry: Path, dm: DecisionMatrix, source):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.root))
+        try:
+            n, m = len(dm.names), len(dm.criteria)
+            X = np.lib.format.open_memmap(tmp / "X.npy", mode="w+", dtype=np.float64, shape=(n, m),
+                                          fortran_order=True)
+            step = max(1, (1 << 20) // max(m, 1))
+            for a in range(0, n, step):       # row blocks keep a ColumnMatrix source unmaterialized
+                X[a:a + step] = dm.X[a:a + step]
+            X.flush()
+            del X
+            width = max((len(x) for x in dm.names), default=1)
+            np.save(tmp / "names.npy", np.asarray(dm.names, dtype=f"<U{max(width, 1)}"))
+            st = dm.stats
+            meta = {"format": FORMAT, "criteria": list(dm.criteria), "dropped": dm.dropped,
+                    "source": os.fspath(source) if isinstance(source, (str, os.PathLike)) else None,
+                    "stats": {"n": st.n, "min": st.min.tolist(), "max": st.max.tolist(),
+                              "sum": st.sum.tolist(), "sumsq": st.sumsq.tolist()} if st else None}
+            self._write_json(tmp / "meta.json", meta)
+            try:
+                os.replace(tmp, entry)
+            except OSError:                 # another process stored the same content first
+                shutil.rmtree(tmp, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        if self.max_bytes is not None or self.max_age is not None:
+            self.prune(self.max_bytes, self.max_age, keep=entry.name)
+
+    @staticmethod
+    def _write_json(path: Path, obj):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(obj), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ---------- housekeeping ----------
+    def entries(self) -> list[tuple[str, int, float]]:
+        """``(digest, bytes, last_used)`` per entry, most recently used first."""
+        out = []
+        if self.root.is_dir():
+            for d in self.root.iterdir():
+                meta = d / "meta.json"
+                if d.name.startswith(".") or not meta.exists():
+                    continue
+                size = sum(f.stat().st_size for f in d.iterdir())
+                out.append((d.name, size, meta.stat().st_mtime))
+        return sorted(out, key=lambda e: -e[2])
+
+    def prune(self, max_bytes: int | None = None, max_age: float | None = None,
+              keep: str | None = None) -> int:
+        """Remove entries unused for over ``max_age`` seconds, then least recently used ones
+        until the total fits ``max_bytes``; returns bytes freed. Entry ``keep`` (a digest)
+        counts towards the total but is never removed."""
+        total, freed = 0, 0
+        cutoff = time.time() - max_age if max_age is not None else None
+        for digest, size, used in self.entries():
+            total += size
+            if digest == keep:
+                continue
+            if (max_bytes is not None and total > max_bytes) or (cutoff is not None and used < cutoff):
+                shutil.rmtree(self.root / digest, ignore_errors=True)
+                freed += size
+        return freed
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,137 @@
+# syai_rank/cli.py
+"""Command line: ``python -m syai_rank batch 'suppliers/*.csv' -c config.json -o ranked/``
+, ``python -m syai_rank serve --port 8000`` and ``python -m syai_rank bench``."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from .engine import METHODS
+
+
+def _methods(s: str) -> list[str]:
+    return [m.strip().upper() for m in s.split(",") if m.strip()]
+
+
+def _cmd_batch(args) -> int:
+    from .batch import expand_inputs, load_config, run_batch, sort_column
+
+    try:
+        cfg = load_config(args.config, wmode=args.wmode, beta=args.beta, methods=args.methods,
+                          criteria=args.criteria)
+        args.sort_by = sort_column(cfg, args.sort_by)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if args.format == "parquet":
+        from .data import _pyarrow
+        try:
+            _pyarrow()   # every file would fail on the write; Arrow inputs fail one by one
+        except ImportError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+    if args.cache == "":
+        from .cache import default_root
+        args.cache = str(default_root())
+    sources = expand_inputs(args.inputs)
+    if not sources:
+        print("error: no input files matched", file=sys.stderr)
+        return 2
+    t0, failed, rows = time.perf_counter(), 0, 0
+    try:
+        for r in run_batch(sources, cfg, args.out, args.sort_by, args.jobs, args.format, args.cache):
+            if r.error:
+                failed += 1
+                print(f"FAIL {r.source}: {r.error}", file=sys.stderr)
+                continue
+            rows += r.rows
+            if not args.quiet:
+                skipped = f", {r.dropped} skipped" if r.dropped else ""
+                print(f"ok   {r.source} -> {r.output} ({r.rows} rows{skipped}, {r.seconds:.2f}s)", file=sys.stderr)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    dt = time.perf_counter() - t0
+    print(f"{len(sources) - failed}/{len(sources)} files, {rows} rows in {dt:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _cmd_bench(args) -> int:
+    from .bench import format_table, node_path, run
+
+    if args.js and node_path() is None:
+        print("note: node not found, timing the Python engine only", file=sys.stderr)
+    report = run(args.sizes, args.repeat, args.seed, args.js, args.workers,
+                 log=None if args.quiet else (lambda s: print(s, file=sys.stderr)))
+    text = json.dumps(report, indent=1)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(format_table(report), file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+def _cmd_serve(args) -> int:
+    from .service import serve
+
+    serve(args.host, args.port, args.jobs, args.quiet)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m syai_rank", description="Headless SYAI-Rank.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    b = sub.add_parser("batch", help="rank many CSV/Arrow/Parquet files in parallel",
+                       description="Score every matching file with the configured methods and write "
+                                   "<name>.ranked.csv (or .ranked.parquet) per input, sorted by rank.")
+    b.add_argument("inputs", nargs="+", help="CSV/Arrow/Parquet paths or glob patterns (quote them; ** recurses)")
+    b.add_argument("-c", "--config", help="JSON/TOML with types, goals, weights, wmode, beta, methods")
+    b.add_argument("-o", "--out", help="output directory (default: next to each input)")
+    b.add_argument("-j", "--jobs", type=int, help="worker processes (default: all cores)")
+    b.add_argument("--methods", type=_methods, help=f"comma-separated subset of {','.join(METHODS)}")
+    b.add_argument("--beta", type=float, help="SYAI β for the 'SYAI (β)' column")
+    b.add_argument("--wmode", choices=("equal", "custom"))
+    b.add_argument("--criteria", type=lambda s: [c.strip() for c in s.split(",") if c.strip()],
+                   help="comma-separated criteria to score (Arrow/Parquet read only these)")
+    b.add_argument("-f", "--format", choices=("csv", "parquet"), default="csv", help="output format")
+    b.add_argument("--cache", nargs="?", const="", metavar="DIR",
+                   help="reuse parsed matrices from a memory-mapped cache (default dir: $SYAI_RANK_CACHE "
+                        "or ~/.cache/syai_rank)")
+    b.add_argument("--sort-by", help="method whose rank orders the output, in any case (default: first method)")
+    b.add_argument("-q", "--quiet", action="store_true", help="only report failures and the total")
+    b.set_defaults(func=_cmd_batch)
+
+    from .bench import DEFAULT_SIZES, parse_sizes
+
+    r = sub.add_parser("bench", help="time every method in the Python engine and the page's JS",
+                       description="Time ingest, normalization, each method, ranking and Spearman on "
+                                   "seeded synthetic matrices; the JS kernels run under node when found.")
+    r.add_argument("--sizes", type=parse_sizes, default=list(DEFAULT_SIZES),
+                   help="comma-separated NxM sizes (default: %(default)s)")
+    r.add_argument("--repeat", type=int, default=5, help="timed runs per case after one warm-up")
+    r.add_argument("--seed", type=int, default=0)
+    r.add_argument("--workers", type=int, default=1, help="engine threads (default 1, for stable numbers)")
+    r.add_argument("--no-js", dest="js", action="store_false", help="skip the node run")
+    r.add_argument("-o", "--out", help="write the JSON report here (default: stdout)")
+    r.add_argument("-q", "--quiet", action="store_true")
+    r.set_defaults(func=_cmd_bench)
+
+    s = sub.add_parser("serve", help="HTTP API: POST /rank and /compare",
+                       description="Serve POST /rank and /compare (JSON or text/csv bodies); "
+                                   "GET /stats reports p50/p99 latency per route.")
+    s.add_argument("--host", default="127.0.0.1")
+    s.add_argument("--port", type=int, default=8000)
+    s.add_argument("-j", "--jobs", type=int, help="scoring processes (default: all cores; 0 = in-process)")
+    s.add_argument("-q", "--quiet", action="store_true", help="no per-request access log")
+    s.set_defaults(func=_cmd_serve)
+    return p
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
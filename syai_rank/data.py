@@ -0,0 +1,263 @@
+# syai_rank/data.py
+"""Loading decision matrices the way the page's initSYAI/initCmp read a CSV,
+plus Arrow IPC / Parquet input and Parquet output (needs pyarrow)."""
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .engine import ColumnMatrix, ColumnStats, column_stats
+
+ALT_COL = "Alternative"
+
+
+class DecisionMatrix(NamedTuple):
+    names: np.ndarray      # alternative labels (object array)
+    criteria: list[str]
+    X: np.ndarray          # float64, alternatives x criteria (ColumnMatrix from Arrow/Parquet)
+    dropped: int = 0       # rows skipped for missing/non-numeric criteria
+    stats: ColumnStats | None = None  # filled in by ingest_csv
+
+
+def to_numeric(col: pd.Series) -> pd.Series:
+    """toNum for a whole column: strip thousands commas, non-numbers become NaN."""
+    if pd.api.types.is_numeric_dtype(col):
+        return col.astype(np.float64)
+    s = col.astype(str).str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(s, errors="coerce").astype(np.float64)
+
+
+def split_frame(df: pd.DataFrame) -> DecisionMatrix:
+    """Alternative column + numeric criteria; rows with unusable cells are dropped."""
+    df = df.rename(columns=lambda c: str(c).strip())
+    cols = list(df.columns)
+    if not cols:
+        raise ValueError("CSV has no header row")
+    alt = ALT_COL if ALT_COL in cols else cols[0]
+    criteria = [c for c in cols if c != alt]
+    if not criteria:
+        raise ValueError("CSV needs at least one criterion column after Alternative")
+    X = np.column_stack([to_numeric(df[c]).to_numpy() for c in criteria]) if len(df) else np.empty((0, len(criteria)))
+    ok = np.isfinite(X).all(axis=1)
+    names = df[alt].astype(str).to_numpy(dtype=object)
+    if not ok.all():
+        X, names = X[ok], names[ok]
+    return DecisionMatrix(names, criteria, np.ascontiguousarray(X), int((~ok).sum()))
+
+
+def read_csv(source) -> DecisionMatrix:
+    """Read a CSV path/buffer into a DecisionMatrix."""
+    return split_frame(pd.read_csv(source, skipinitialspace=True))
+
+
+# ---------- streaming ingestion ----------
+CHUNK_ROWS = 1 << 16
+
+
+def iter_csv_chunks(source, chunksize: int = CHUNK_ROWS) -> Iterator[DecisionMatrix]:
+    """Parse a CSV in row chunks; each chunk is already numeric and filtered."""
+    for df in pd.read_csv(source, skipinitialspace=True, chunksize=chunksize):
+        yield split_frame(df)
+
+
+def _spill_map(path: str, rows: int, cols: int) -> np.ndarray:
+    if rows == 0:
+        os.remove(path)
+        return np.empty((0, cols))
+    X = np.memmap(path, dtype=np.float64, mode="r", shape=(rows, cols))
+    try:
+        os.remove(path)   # POSIX keeps the mapping alive after unlink
+    except OSError:
+        weakref.finalize(X, os.remove, path)
+    return X
+
+
+def ingest_csv(source, chunksize: int = CHUNK_ROWS, spill_dir: str | Path | None = None,
+               spill: bool = False) -> DecisionMatrix:
+    """Single parse pass that also collects the per-column statistics.
+
+    Each chunk is converted straight to float64 and folded into a running
+    ColumnStats, so scoring can skip its own statistics sweep. With
+    ``spill=True`` (or a ``spill_dir``) the numeric rows are appended to a
+    temporary file and returned as a read-only memory map, keeping resident
+    memory bounded by one chunk regardless of file size.
+    """
+    spill = spill or spill_dir is not None
+    criteria, stats, dropped, rows = None, None, 0, 0
+    names, parts = [], []
+    fh = tempfile.NamedTemporaryFile(dir=spill_dir, prefix="syai_", suffix=".f64", delete=False) if spill else None
+    try:
+        for part in iter_csv_chunks(source, chunksize):
+            if criteria is None:
+                criteria = part.criteria
+            dropped += part.dropped
+            if not len(part.X):
+                continue
+            s = column_stats(part.X, workers=1)
+            stats = s if stats is None else stats.merge(s)
+            names.append(part.names)
+            rows += len(part.X)
+            if fh is not None:
+                fh.write(part.X.data)
+            else:
+                parts.append(part.X)
+    except BaseException:
+        if fh is not None:
+            fh.close()
+            os.remove(fh.name)
+        raise
+    if criteria is None:
+        raise ValueError("CSV has no header row")
+    if fh is not None:
+        fh.close()
+        X = _spill_map(fh.name, rows, len(criteria))
+    else:
+        X = np.concatenate(parts) if parts else np.empty((0, len(criteria)))
+    names = np.concatenate(names) if names else np.empty(0, dtype=object)
+    return DecisionMatrix(names, criteria, X, dropped, stats)
+
+
+# ---------- Arrow IPC / Parquet ----------
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc", ".arrows")
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:   # streamlit already depends on pyarrow; the engine alone does not
+        raise ImportError("Arrow/Parquet files need pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def sniff_format(source) -> str:
+    """"arrow", "parquet" or "csv", from the suffix of a path or the magic bytes of a buffer."""
+    if isinstance(source, (str, os.PathLike)):
+        suffix = Path(source).suffix.lower()
+        return "arrow" if suffix in ARROW_SUFFIXES else "parquet" if suffix in PARQUET_SUFFIXES else "csv"
+    head = bytes(memoryview(source)[:6])
+    if head[:4] == b"PAR1":
+        return "parquet"
+    if head == b"ARROW1" or head[:4] == b"\xff\xff\xff\xff":
+        return "arrow"
+    return "csv"
+
+
+def _open(source):
+    pa = _pyarrow()
+    if isinstance(source, (str, os.PathLike)):
+        return pa.memory_map(os.fspath(source))
+    return pa.BufferReader(source)   # bytes are wrapped, not copied
+
+
+def _schema(source, fmt: str):
+    pa = _pyarrow()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        return pq.read_schema(_open(source))
+    try:
+        return pa.ipc.open_file(_open(source)).schema
+    except pa.ArrowInvalid:
+        return pa.ipc.open_stream(_open(source)).schema
+
+
+def table_columns(source) -> list[str]:
+    """Column names of an Arrow/Parquet file (schema only, no data read)."""
+    return list(_schema(source, sniff_format(source)).names)
+
+
+def _projection(names: list[str], criteria, alt) -> tuple[str, list[str]]:
+    if not names:
+        raise ValueError("table has no columns")
+    alt = alt or (ALT_COL if ALT_COL in names else names[0])
+    criteria = [c for c in names if c != alt] if criteria is None else list(criteria)
+    missing = [c for c in [alt, *criteria] if c not in names]
+    if missing:
+        raise ValueError(f"column(s) not in file: {missing}")
+    if not criteria:
+        raise ValueError("table needs at least one criterion column after Alternative")
+    return alt, criteria
+
+
+def _float_chunks(col) -> list[np.ndarray]:
+    """float64 chunks of an Arrow column; null-free float64 chunks are used in place."""
+    pa = _pyarrow()
+    t = col.type
+    if t == pa.float64() and col.null_count == 0:
+        return [ch.to_numpy(zero_copy_only=True) for ch in col.chunks]
+    if pa.types.is_floating(t) or pa.types.is_integer(t) or pa.types.is_decimal(t):
+        return [ch.to_numpy(zero_copy_only=False) for ch in col.cast(pa.float64()).chunks]  # nulls -> NaN
+    return [to_numeric(col.to_pandas()).to_numpy()]   # text columns follow the CSV rules
+
+
+def from_arrow(table, criteria=None, alt: str | None = None) -> DecisionMatrix:
+    """DecisionMatrix over a pyarrow Table; rows with null/non-numeric criteria are dropped."""
+    alt, criteria = _projection(table.column_names, criteria, alt)
+    cols = [_float_chunks(table.column(c)) for c in criteria]
+    names = table.column(alt).to_pandas().astype(str).to_numpy(dtype=object)
+    ok = np.ones(len(names), dtype=bool)
+    for parts in cols:
+        if parts:
+            ok &= np.concatenate([np.isfinite(p) for p in parts])
+    dropped = len(ok) - int(ok.sum())
+    if dropped:
+        cols, names = [np.concatenate(parts)[ok] for parts in cols], names[ok]
+    X = ColumnMatrix(cols)
+    return DecisionMatrix(names, criteria, X, dropped, column_stats(X) if len(names) else None)
+
+
+def read_arrow(source, criteria=None, alt: str | None = None) -> DecisionMatrix:
+    """Arrow IPC file (Feather v2) or stream. Paths are memory-mapped; batches are
+    read one at a time and cut down to the Alternative column and ``criteria``, so
+    uncompressed float64 columns feed the kernels without a copy and compressed
+    files never hold more than one full batch."""
+    pa = _pyarrow()
+    schema = _schema(source, "arrow")
+    alt, criteria = _projection(list(schema.names), criteria, alt)
+    keep = [alt, *criteria]
+    try:
+        r = pa.ipc.open_file(_open(source))
+        batches = (r.get_batch(i) for i in range(r.num_record_batches))
+    except pa.ArrowInvalid:
+        batches = pa.ipc.open_stream(_open(source))
+    table = pa.Table.from_batches([b.select(keep) for b in batches], schema=pa.schema([schema.field(c) for c in keep]))
+    return from_arrow(table, criteria, alt)
+
+
+def read_parquet(source, criteria=None, alt: str | None = None) -> DecisionMatrix:
+    """Parquet with column projection: only the Alternative column and ``criteria`` are decoded."""
+    import pyarrow.parquet as pq
+    alt, criteria = _projection(list(_schema(source, "parquet").names), criteria, alt)
+    return from_arrow(pq.read_table(_open(source), columns=[alt, *criteria], memory_map=True), criteria, alt)
+
+
+def read_matrix(source, criteria=None, alt: str | None = None, **csv_kw) -> DecisionMatrix:
+    """Any supported input: Arrow/Parquet by suffix or magic bytes, otherwise ingest_csv."""
+    fmt = sniff_format(source)
+    if fmt == "arrow":
+        return read_arrow(source, criteria, alt)
+    if fmt == "parquet":
+        return read_parquet(source, criteria, alt)
+    dm = ingest_csv(source if isinstance(source, (str, os.PathLike)) else io.BytesIO(source), **csv_kw)
+    if criteria is None or list(criteria) == dm.criteria:
+        return dm
+    missing = [c for c in criteria if c not in dm.criteria]
+    if missing:
+        raise ValueError(f"column(s) not in file: {missing}")
+    idx = [dm.criteria.index(c) for c in criteria]
+    X = np.ascontiguousarray(dm.X[:, idx])
+    return DecisionMatrix(dm.names, list(criteria), X, dm.dropped, column_stats(X) if len(X) else None)
+
+
+def write_parquet(df: pd.DataFrame, dest, compression: str = "zstd"):
+    """Write a results table (e.g. batch.score_frame) as Parquet; ``dest`` is a path or binary file."""
+    pa = _pyarrow()
+    import pyarrow.parquet as pq
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), dest, compression=compression)
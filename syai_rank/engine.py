@@ -0,0 +1,678 @@
+# syai_rank/engine.py
+"""Vectorized NumPy ports of the ranking methods embedded in app.py.
+
+Every function works on a float64 alternatives x criteria matrix ``X`` and
+mirrors the corresponding entry of the page's method registry (METHODS in
+SYAIKernels), including the ``|| 1`` fallbacks for zero denominators.
+
+Scoring runs in two sweeps: one pass collects per-column statistics
+(min/max/sum/sum of squares), then a second pass walks the matrix in
+cache-sized row blocks and evaluates every requested method on each block.
+Blocks are independent, so they are spread over a thread pool (NumPy releases
+the GIL inside its kernels). A few constants need more than the statistics
+(EDAS's mean distance to a goal, CODAS's lowest unit value on a Cost column
+that spans 0) and take one extra sweep when asked for; PROMETHEE II's flows
+are per-column ranks and take one sort per column.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Mapping, NamedTuple, Sequence
+
+import numpy as np
+
+BENEFIT = "Benefit"
+COST = "Cost"
+IDEAL = "Ideal (Goal)"
+CRITERION_TYPES = (BENEFIT, COST, IDEAL)
+
+# Same column order as the comparison table in the page.
+METHODS = ("TOPSIS", "VIKOR", "SAW", "SYAI", "COBRA", "WASPAS", "MOORA",
+           "EDAS", "CODAS", "MABAC", "PROMETHEE II")
+# Rank direction per method (True: larger score ranks first).
+HIGHER_IS_BETTER = {
+    "TOPSIS": True, "VIKOR": False, "SAW": True, "SYAI": True,
+    "COBRA": False, "WASPAS": True, "MOORA": True,
+    "EDAS": True, "CODAS": True, "MABAC": True, "PROMETHEE II": True,
+}
+
+_EPS = np.finfo(np.float64).eps
+_CODAS_TAU = 0.02
+_BLOCK_CELLS = 1 << 16  # ~512 KB of float64 per block temporary
+
+
+# ---------- argument helpers ----------
+def as_matrix(X) -> np.ndarray:
+    A = np.asarray(X, dtype=np.float64)
+    if A.ndim != 2:
+        raise ValueError(f"decision matrix must be 2-D, got shape {A.shape}")
+    if A.shape[0] == 0 or A.shape[1] == 0:
+        raise ValueError("decision matrix needs at least one alternative and one criterion")
+    return A
+
+
+class ColumnMatrix:
+    """Alternatives x criteria matrix kept as separate float64 columns.
+
+    Each column is one array or a list of chunk arrays (an Arrow column's
+    record batches); columns may be chunked differently. Arrow and Parquet
+    readers hand their buffers over as they are. Scoring only ever takes row
+    slices, and each slice is copied into a small row-major block on the
+    fly, so the whole matrix is never materialized. Anything else
+    (``np.asarray``) does materialize it.
+    """
+    __slots__ = ("columns", "shape", "_starts")
+    ndim = 2
+    dtype = np.dtype(np.float64)
+
+    def __init__(self, columns: Sequence):
+        self.columns = [[np.asarray(p, dtype=np.float64) for p in (c if isinstance(c, (list, tuple)) else [c])]
+                        for c in columns]
+        self._starts = [np.cumsum([0] + [len(p) for p in c]) for c in self.columns]
+        if not self.columns or any(p.ndim != 1 for c in self.columns for p in c) \
+                or len({int(st[-1]) for st in self._starts}) != 1:
+            raise ValueError("ColumnMatrix needs one or more 1-D columns of equal length")
+        self.shape = (int(self._starts[0][-1]), len(self.columns))
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def _rows(self, a: int, b: int, dtype=np.float64) -> np.ndarray:
+        out = np.empty((b - a, self.shape[1]), dtype=dtype)
+        for j, (parts, st) in enumerate(zip(self.columns, self._starts)):
+            k, pos = int(np.searchsorted(st, a, "right")) - 1, a
+            while pos < b:
+                lo, hi = pos - st[k], min(b, st[k + 1]) - st[k]
+                out[pos - a:pos - a + hi - lo, j] = parts[k][lo:hi]
+                pos += hi - lo
+                k += 1
+        return out
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            a, b, step = key.indices(self.shape[0])
+            if step == 1:
+                return self._rows(a, max(a, b))
+        return np.asarray(self)[key]
+
+    def __array__(self, dtype=None, copy=None):
+        return self._rows(0, self.shape[0], dtype or np.float64)
+
+
+def _row_source(X):
+    """``X`` for the row-block sweeps: a ColumnMatrix stays columnar, anything else is as_matrix'd."""
+    if isinstance(X, ColumnMatrix):
+        if 0 in X.shape:
+            raise ValueError("decision matrix needs at least one alternative and one criterion")
+        return X
+    return as_matrix(X)
+
+
+def _or1(a):
+    """JS ``a || 1`` for numeric arrays/scalars (0 and NaN become 1)."""
+    a = np.asarray(a, dtype=np.float64)
+    return np.where((a == 0) | np.isnan(a), 1.0, a)
+
+
+def _parse_float(v) -> float:
+    if v is None:
+        return np.nan
+    try:
+        x = float(str(v).strip())
+    except ValueError:
+        return np.nan
+    return x if np.isfinite(x) else np.nan
+
+
+def _types(types, m: int) -> np.ndarray:
+    if types is None:
+        return np.full(m, BENEFIT, dtype=object)
+    if isinstance(types, str):
+        types = [types] * m
+    t = np.array([x or BENEFIT for x in types], dtype=object)
+    if t.shape != (m,):
+        raise ValueError(f"expected {m} criterion types, got {len(t)}")
+    bad = set(t) - set(CRITERION_TYPES)
+    if bad:
+        raise ValueError(f"unknown criterion type(s): {sorted(bad)}")
+    return t
+
+
+def _goals(goals, m: int) -> np.ndarray:
+    if goals is None:
+        return np.full(m, np.nan)
+    if isinstance(goals, Mapping):
+        raise TypeError("goals must be a per-column sequence; use as_columns() for dicts")
+    g = np.array([_parse_float(x) for x in goals], dtype=np.float64)
+    if g.shape != (m,):
+        raise ValueError(f"expected {m} goal values, got {len(g)}")
+    return g
+
+
+def as_columns(criteria: Sequence[str], values: Mapping | None, default=None) -> list:
+    """Turn a ``{criterion: value}`` mapping (the page's type/ideal/w dicts) into a list."""
+    values = values or {}
+    return [values.get(c, default) for c in criteria]
+
+
+def _raw_weights(weights, mode: str, m: int) -> np.ndarray:
+    """rawWeights: the weights before normalizing (equal or all zero -> ones)."""
+    if mode == "equal" or weights is None:
+        return np.ones(m)
+    w = np.array([_parse_float(0 if x is None or x == "" else x) for x in weights], dtype=np.float64)
+    if w.shape != (m,):
+        raise ValueError(f"expected {m} weights, got {len(w)}")
+    w = np.where(np.isfinite(w), np.maximum(0.0, w), 0.0)
+    return w if w.sum() > 0 else np.ones(m)
+
+
+def compute_weights(weights=None, mode: str = "equal", m: int | None = None) -> np.ndarray:
+    """computeWeights: equal -> 1/m, custom -> clipped at 0 and normalized to sum 1."""
+    if m is None:
+        if weights is None:
+            raise ValueError("m is required when weights is None")
+        m = len(weights)
+    w = _raw_weights(weights, mode, m)
+    return w / w.sum()
+
+
+# ---------- column statistics ----------
+class ColumnStats(NamedTuple):
+    """Per-criterion reductions shared by every normalization."""
+    n: int
+    min: np.ndarray
+    max: np.ndarray
+    sum: np.ndarray
+    sumsq: np.ndarray
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self.sum / self.n
+
+    @property
+    def norm(self) -> np.ndarray:
+        return np.sqrt(self.sumsq)
+
+    def merge(self, other: "ColumnStats") -> "ColumnStats":
+        """Statistics of the row-wise concatenation of both matrices."""
+        return ColumnStats(self.n + other.n, np.minimum(self.min, other.min),
+                           np.maximum(self.max, other.max), self.sum + other.sum,
+                           self.sumsq + other.sumsq)
+
+
+def _block_slices(n: int, m: int) -> list[slice]:
+    step = max(1, _BLOCK_CELLS // m)
+    return [slice(i, min(i + step, n)) for i in range(0, n, step)]
+
+
+def _map_blocks(fn, slices, workers: int | None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(slices)))
+    if workers == 1:
+        return [fn(s) for s in slices]
+    with ThreadPoolExecutor(workers) as ex:
+        return list(ex.map(fn, slices))
+
+
+def column_stats(X, workers: int | None = None) -> ColumnStats:
+    """One sweep over ``X`` collecting min/max/sum/sum of squares per column."""
+    X = _row_source(X)
+    n, m = X.shape
+
+    def part(s):
+        B = X[s]
+        return B.min(axis=0), B.max(axis=0), B.sum(axis=0), np.einsum("ij,ij->j", B, B)
+
+    parts = _map_blocks(part, _block_slices(n, m), workers)
+    mn = np.min([p[0] for p in parts], axis=0)
+    mx = np.max([p[1] for p in parts], axis=0)
+    if not (np.isfinite(mn).all() and np.isfinite(mx).all()):
+        raise ValueError("decision matrix contains missing or non-numeric values")
+    return ColumnStats(n, mn, mx, np.sum([p[2] for p in parts], axis=0),
+                       np.sum([p[3] for p in parts], axis=0))
+
+
+# ---------- per-column normalization parameters ----------
+def _plan(t: np.ndarray, g: np.ndarray, w: np.ndarray, st: ColumnStats) -> SimpleNamespace:
+    """Derive every method's per-column constants from the shared statistics.
+
+    Columns are grouped Benefit | Cost | Ideal so block kernels can use plain
+    slices; ``perm`` is None when the input is already in that order.
+    """
+    code = np.select([t == BENEFIT, t == COST], [0, 1], 2)
+    perm = np.argsort(code, kind="stable")
+    if (perm == np.arange(len(perm))).all():
+        perm = None
+    else:
+        t, g, w, code = t[perm], g[perm], w[perm], code[perm]
+        st = ColumnStats(st.n, *(a[perm] for a in st[1:]))
+    b1, b2 = np.searchsorted(code, [1, 2])
+    mn, mx = st.min, st.max
+    cost, ideal = t == COST, t == IDEAL
+    P = SimpleNamespace(perm=perm, w=w, ben=slice(0, b1), cost=slice(b1, b2), ideal=slice(b2, None),
+                        any_ideal=bool(ideal.any()))
+
+    # sawUnit
+    P.u_ben = _or1(mx[P.ben])
+    P.u_cost = _or1(mn[P.cost])
+    gi = g[P.ideal]
+    P.u_goal = np.where(np.isnan(gi), (mn[P.ideal] + mx[P.ideal]) / 2, gi)
+    P.u_range = _or1(mx[P.ideal] - mn[P.ideal])
+
+    # vectorNorm (MOORA, TOPSIS)
+    norm = _or1(st.norm)
+    P.moora_raw = np.where(cost, -w, w) / norm
+    P.moora_raw[P.ideal] = 0.0
+    P.topsis_a2 = (w / norm) ** 2
+    P.topsis_plus = np.where(cost, mn, mx)
+    P.topsis_minus = np.where(cost, mx, mn)
+
+    # VIKOR: term = sign * (f* - x) / d
+    f_star = np.where(cost, mn, mx)
+    f_min = np.where(cost, mx, mn)
+    denom = np.where(cost, _or1(f_min - f_star), _or1(np.abs(f_star - f_min)))
+    P.vikor_star = f_star
+    P.vikor_scale = np.where(cost, -w, w) / denom
+
+    # normalizeColumn_SYAI: 0.01 + 0.99 * (1 - |x - x*| / R) == 1 - |x - x*| * (0.99 / R)
+    R = mx - mn
+    x_star = np.where(t == BENEFIT, mx, mn)
+    x_star[ideal] = np.where(np.isnan(g[ideal]), st.mean[ideal], g[ideal])
+    flat = np.abs(R) < 1e-12
+    P.syai_star = x_star
+    P.syai_k = np.where(flat, 0.0, (1 - 0.01) / np.where(flat, 1.0, R))
+
+    # COBRA: r = x / (max || 1) * w
+    c = w / _or1(mx)
+    rmax = np.where(c >= 0, mx * c, mn * c)
+    rmin = np.where(c >= 0, mn * c, mx * c)
+    P.cobra_c = c
+    P.cobra_pis = np.where(cost, rmin, rmax)
+    P.cobra_nis = np.where(cost, rmax, rmin)
+    P.cobra_as = st.mean * c
+
+    # EDAS: average solution (Ideal (Goal): mean distance to x*, filled in by _plan_scan)
+    P.edas_av = st.mean.copy()
+    P.edas_k = w / _or1(np.abs(P.edas_av))
+
+    # CODAS: lowest SAW unit value per column. The unit is monotone in x on each side of the
+    # goal and on each side of 0, so it sits at an end of [min, max] unless a Cost column
+    # spans 0; those take a scan (_plan_scan).
+    P.codas_lo = _unit_block(np.vstack([mn, mx]), P).min(axis=0)
+    P.codas_scan = bool((cost & (mn <= 0) & (mx >= 0)).any())
+    return P
+
+
+def _plan_scan(X, P, want: frozenset, workers: int | None) -> None:
+    """The plan constants that need the values themselves, in one extra sweep when wanted."""
+    edas = "EDAS" in want and P.any_ideal
+    codas = "CODAS" in want and P.codas_scan
+    if not (edas or codas):
+        return
+    n, m = X.shape
+
+    def part(s):
+        B = X[s] if P.perm is None else X[s][:, P.perm]
+        dist = np.abs(B[:, P.ideal] - P.syai_star[P.ideal]).sum(axis=0) if edas else None
+        return dist, _unit_block(B, P).min(axis=0) if codas else None
+
+    parts = _map_blocks(part, _block_slices(n, m), workers)
+    if edas:
+        P.edas_av[P.ideal] = np.sum([p[0] for p in parts], axis=0) / n
+        P.edas_k = P.w / _or1(np.abs(P.edas_av))
+    if codas:
+        P.codas_lo = np.min([p[1] for p in parts], axis=0)
+
+
+# ---------- block kernels ----------
+def _unit_block(B: np.ndarray, P) -> np.ndarray:
+    U = np.empty_like(B)
+    np.divide(B[:, P.ben], P.u_ben, out=U[:, P.ben])
+    C = B[:, P.cost]
+    np.divide(P.u_cost, np.where(C == 0, 1.0, C), out=U[:, P.cost])
+    if P.any_ideal:
+        D = U[:, P.ideal]
+        np.subtract(B[:, P.ideal], P.u_goal, out=D)
+        np.abs(D, out=D)
+        D /= P.u_range
+        np.subtract(1, D, out=D)
+        np.maximum(D, 0.0, out=D)
+    return U
+
+
+def _rownorm(D: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.einsum("ij,ij->i", D, D))
+
+
+def _score_block(B: np.ndarray, P, want: frozenset, out: dict, s: slice):
+    """Evaluate the requested methods on one row block, writing per-row results."""
+    if P.perm is not None:
+        B = B[:, P.perm]
+    T = np.empty_like(B)
+    extra = {}
+
+    if want & {"SAW", "WASPAS", "MOORA", "CODAS"}:
+        U = _unit_block(B, P)
+        sawv = U @ P.w
+        if "SAW" in want:
+            out["SAW"][s] = sawv
+        if "WASPAS" in want:
+            np.maximum(U, 1e-12, out=T)
+            np.log(T, out=T)
+            out["WASPAS"][s] = 0.5 * sawv + 0.5 * np.exp(T @ P.w)
+        if "MOORA" in want:
+            v = B @ P.moora_raw
+            if P.any_ideal:
+                v += U[:, P.ideal] @ P.w[P.ideal]
+            out["MOORA"][s] = v
+        if "CODAS" in want:
+            U -= P.codas_lo             # >= 0: codas_lo is the column's lowest unit value
+            out["_CT"][s] = U @ P.w
+            U *= U
+            out["_CE"][s] = U @ (P.w * P.w)
+        del U
+
+    if "TOPSIS" in want:
+        np.subtract(B, P.topsis_plus, out=T)
+        T *= T
+        dp = np.sqrt(T @ P.topsis_a2)
+        np.subtract(B, P.topsis_minus, out=T)
+        T *= T
+        dm = np.sqrt(T @ P.topsis_a2)
+        den = dp + dm
+        out["TOPSIS"][s] = dm / np.where(den == 0, 1e-12, den)
+
+    if "VIKOR" in want:
+        np.subtract(P.vikor_star, B, out=T)
+        T *= P.vikor_scale
+        out["_S"][s] = T.sum(axis=1)
+        out["_R"][s] = T.max(axis=1)
+
+    if want & {"SYAI", "MABAC"}:
+        np.subtract(B, P.syai_star, out=T)
+        np.abs(T, out=T)
+        T *= P.syai_k
+        np.subtract(1, T, out=T)
+        np.clip(T, 0.01, 1, out=T)
+        if "MABAC" in want:
+            Tm = T - 0.01               # min-max value t = (y - 0.01) / 0.99
+            Tm /= 0.99
+            out["_MQ"][s] = Tm @ P.w
+            extra["mabac"] = np.log1p(Tm).sum(axis=0)
+        if "SYAI" in want:
+            T *= P.w
+            out["_Wsum"][s] = T.sum(axis=1)
+            extra["syai"] = (T.max(axis=0), T.min(axis=0))
+
+    if "EDAS" in want:
+        # signed distance from the average solution; Ideal (Goal) scores |x - x*| as a cost
+        np.subtract(B, P.edas_av, out=T)
+        np.negative(T[:, P.cost], out=T[:, P.cost])
+        if P.any_ideal:
+            D = T[:, P.ideal]
+            np.subtract(B[:, P.ideal], P.syai_star[P.ideal], out=D)
+            np.abs(D, out=D)
+            np.subtract(P.edas_av[P.ideal], D, out=D)
+        out["_EP"][s] = np.maximum(T, 0.0) @ P.edas_k
+        np.minimum(T, 0.0, out=T)
+        out["_EN"][s] = -(T @ P.edas_k)
+
+    if "COBRA" in want:
+        Rw = B * P.cobra_c
+        rs = Rw.sum(axis=1)
+        np.subtract(Rw, P.cobra_pis, out=T)
+        out["_dE_PIS"][s] = _rownorm(T)
+        out["_dT_PIS"][s] = np.abs(P.cobra_pis.sum() - rs)
+        np.subtract(Rw, P.cobra_nis, out=T)
+        out["_dE_NIS"][s] = _rownorm(T)
+        out["_dT_NIS"][s] = np.abs(P.cobra_nis.sum() - rs)
+        np.subtract(Rw, P.cobra_as, out=T)
+        np.maximum(T, 0.0, out=Rw)      # gate eps+ : AS < r
+        out["_dE_ASp"][s] = _rownorm(Rw)
+        out["_dT_ASp"][s] = Rw.sum(axis=1)
+        np.minimum(T, 0.0, out=Rw)      # gate eps- : AS > r
+        out["_dE_ASn"][s] = _rownorm(Rw)
+        out["_dT_ASn"][s] = -Rw.sum(axis=1)
+    return extra
+
+
+_SCRATCH = {
+    "VIKOR": ("_S", "_R"),
+    "SYAI": ("_Wsum",),
+    "COBRA": ("_dE_PIS", "_dT_PIS", "_dE_NIS", "_dT_NIS", "_dE_ASp", "_dT_ASp", "_dE_ASn", "_dT_ASn"),
+    "EDAS": ("_EP", "_EN"),
+    "CODAS": ("_CE", "_CT"),
+    "MABAC": ("_MQ",),
+    "PROMETHEE II": (),         # column-wise, after the block sweep
+}
+
+
+def _column(X, j: int) -> np.ndarray:
+    """Column ``j`` of a row source as one array."""
+    if isinstance(X, ColumnMatrix):
+        parts = X.columns[j]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+    return X[:, j]
+
+
+def _pref_flow(v: np.ndarray) -> np.ndarray:
+    """prefFlow: PROMETHEE net flow x (n - 1) under the usual criterion.
+
+    i is preferred to k iff its value is larger, so the flow is 2r - n - 1 with
+    r the average ascending rank; ties share it.
+    """
+    n = v.shape[0]
+    idx = np.argsort(v, kind="stable")
+    sv = v[idx]
+    start = np.flatnonzero(np.r_[True, sv[1:] != sv[:-1]])
+    end = np.r_[start[1:], n]
+    f = np.empty(n)
+    f[idx] = np.repeat(start + end - n, end - start)
+    return f
+
+
+def _signed_flow(X, j: int, t: str, star: float) -> np.ndarray:
+    """Criterion ``j``'s flow: Cost negates the Benefit flow, Ideal (Goal) ranks -|x - x*|."""
+    v = _column(X, j)
+    if t == IDEAL:
+        return _pref_flow(-np.abs(v - star))
+    f = _pref_flow(v)
+    return np.negative(f, out=f) if t == COST else f
+
+
+def _codas_assessment(E, T, tau: float = _CODAS_TAU) -> np.ndarray:
+    """CODAS relative assessment H_i = sum_k (E_i - E_k) + psi(E_i - E_k) (T_i - T_k).
+
+    psi is 1 where |E_i - E_k| >= tau. Sorted by E, the k within tau of E_i are
+    one window, and prefix sums of T give the rest: O(n log n) (codasScore).
+    """
+    E, T = np.asarray(E, dtype=np.float64), np.asarray(T, dtype=np.float64)
+    n = E.shape[0]
+    idx = np.argsort(E, kind="stable")
+    Es, Ts = E[idx], T[idx]
+    pre = np.concatenate(([0.0], np.cumsum(Ts)))
+    lo = np.searchsorted(Es, Es - tau, "right")
+    hi = np.searchsorted(Es, Es + tau, "left")
+    out = np.empty(n)
+    out[idx] = n * Es - E.sum() + (n - (hi - lo)) * Ts - (pre[n] - pre[hi] + pre[lo])
+    return out
+
+
+def _evaluate(X, types, goals, weights, wmode, methods, stats=None, workers=None) -> dict:
+    X = _row_source(X)
+    n, m = X.shape
+    want = frozenset(methods)
+    unknown = want - set(METHODS)
+    if unknown:
+        raise ValueError(f"unknown method(s): {sorted(unknown)}")
+    if stats is None:
+        stats = column_stats(X, workers)
+    t, raw = _types(types, m), _raw_weights(weights, wmode, m)
+    P = _plan(t, _goals(goals, m), raw / raw.sum(), stats)
+    _plan_scan(X, P, want, workers)
+
+    out = {k: np.empty(n) for k in want if k not in _SCRATCH}
+    for k in want & _SCRATCH.keys():
+        out.update((name, np.empty(n)) for name in _SCRATCH[k])
+    extras = _map_blocks(lambda s: _score_block(X[s], P, want, out, s), _block_slices(n, m), workers)
+
+    if "VIKOR" in want:
+        S, R = out.pop("_S"), out.pop("_R")
+        q = 0.5 * ((S - S.min()) / _or1(S.max() - S.min()))
+        q += 0.5 * ((R - R.min()) / _or1(R.max() - R.min()))
+        out["VIKOR"] = q
+    if "SYAI" in want:
+        a_plus = np.max([e["syai"][0] for e in extras], axis=0)
+        a_minus = np.min([e["syai"][1] for e in extras], axis=0)
+        ws = out.pop("_Wsum")
+        out["_Dp"], out["_Dm"] = a_plus.sum() - ws, ws - a_minus.sum()
+    if "COBRA" in want:
+        d = {}
+        for key in ("PIS", "NIS", "ASp", "ASn"):
+            dE, dT = out.pop("_dE_" + key), out.pop("_dT_" + key)
+            rho = dE.max() - dE.min()
+            d[key] = dE + rho * dE * dT
+        out["COBRA"] = (d["PIS"] - d["NIS"] - d["ASp"] + d["ASn"]) / 4
+    if "EDAS" in want:
+        ep, en = out.pop("_EP"), out.pop("_EN")
+        out["EDAS"] = 0.5 * (ep / _or1(ep.max()) + 1 - en / _or1(en.max()))
+    if "CODAS" in want:
+        out["CODAS"] = _codas_assessment(np.sqrt(out.pop("_CE")), out.pop("_CT"))
+    if "MABAC" in want:
+        # border approximation area g = geometric mean of (t + 1) per criterion
+        g = np.exp(np.sum([e["mabac"] for e in extras], axis=0) / n)
+        out["MABAC"] = out.pop("_MQ") + P.w @ (1 - g)
+    if "PROMETHEE II" in want:
+        # raw weights, scaled once at the end as in the page: integer flows and weights keep
+        # exact ties exact
+        star = np.empty(m)
+        star[P.perm if P.perm is not None else slice(None)] = P.syai_star
+        acc = np.zeros(n)
+        for j in range(m):
+            acc += raw[j] * _signed_flow(X, j, t[j], star[j])
+        out["PROMETHEE II"] = acc * ((1 / sum(raw.tolist())) / ((n - 1) or 1))
+    return out
+
+
+# ---------- normalizations (full matrices) ----------
+def vector_norm(X, stats: ColumnStats | None = None) -> np.ndarray:
+    """vectorNorm applied to every column: x / (||x||_2 || 1)."""
+    X = as_matrix(X)
+    stats = stats or column_stats(X)
+    return X / _or1(stats.norm)
+
+
+def saw_unit(X, types=None, goals=None, stats: ColumnStats | None = None) -> np.ndarray:
+    """sawUnit applied to every column (the U matrix of computeU)."""
+    X = as_matrix(X)
+    m = X.shape[1]
+    P = _plan(_types(types, m), _goals(goals, m), np.ones(m), stats or column_stats(X))
+    if P.perm is None:
+        return _unit_block(X, P)
+    U = np.empty_like(X)
+    U[:, P.perm] = _unit_block(X[:, P.perm], P)
+    return U
+
+
+def normalize_syai(X, types=None, goals=None, stats: ColumnStats | None = None) -> np.ndarray:
+    """normalizeColumn_SYAI applied to every column."""
+    X = as_matrix(X)
+    m = X.shape[1]
+    P = _plan(_types(types, m), _goals(goals, m), np.ones(m), stats or column_stats(X))
+    k, star = np.empty(m), np.empty(m)
+    perm = P.perm if P.perm is not None else slice(None)
+    k[perm], star[perm] = P.syai_k, P.syai_star
+    N = np.abs(X - star)
+    N *= k
+    np.subtract(1, N, out=N)
+    return np.clip(N, 0.01, 1, out=N)
+
+
+# ---------- methods ----------
+def syai(X, types=None, goals=None, weights=None, wmode: str = "equal", beta: float = 0.5,
+         stats: ColumnStats | None = None, workers: int | None = None):
+    """computeSYAI_exact. Returns ``(Dp, Dm, Close)``."""
+    r = _evaluate(X, types, goals, weights, wmode, ("SYAI",), stats, workers)
+    return r["_Dp"], r["_Dm"], syai_closeness(r["_Dp"], r["_Dm"], beta)
+
+
+def syai_closeness(Dp, Dm, beta: float = 0.5) -> np.ndarray:
+    Dm = np.asarray(Dm)
+    denom = beta * np.asarray(Dp) + (1 - beta) * Dm
+    denom = np.where((denom == 0) | np.isnan(denom), _EPS, denom)
+    return ((1 - beta) * Dm) / denom
+
+
+def cobra(X, types=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """computeCOBRA (smaller is better; may be negative)."""
+    return _evaluate(X, types, None, weights, wmode, ("COBRA",), **kw)["COBRA"]
+
+
+def topsis(X, types=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    return _evaluate(X, types, None, weights, wmode, ("TOPSIS",), **kw)["TOPSIS"]
+
+
+def vikor(X, types=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """VIKOR with v = 0.5 (smaller is better)."""
+    return _evaluate(X, types, None, weights, wmode, ("VIKOR",), **kw)["VIKOR"]
+
+
+def saw(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    return _evaluate(X, types, goals, weights, wmode, ("SAW",), **kw)["SAW"]
+
+
+def waspas(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """WASPAS with lambda = 0.5 over the SAW unit matrix."""
+    return _evaluate(X, types, goals, weights, wmode, ("WASPAS",), **kw)["WASPAS"]
+
+
+def moora(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """MOORA ratio system; Ideal (Goal) criteria use the SAW unit column."""
+    return _evaluate(X, types, goals, weights, wmode, ("MOORA",), **kw)["MOORA"]
+
+
+def edas(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """EDAS: positive/negative distance from the average solution, each scaled by its largest."""
+    return _evaluate(X, types, goals, weights, wmode, ("EDAS",), **kw)["EDAS"]
+
+
+def codas(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """CODAS on the SAW unit matrix, tau = 0.02."""
+    return _evaluate(X, types, goals, weights, wmode, ("CODAS",), **kw)["CODAS"]
+
+
+def mabac(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """MABAC on the min-max values of normalizeColumn_SYAI."""
+    return _evaluate(X, types, goals, weights, wmode, ("MABAC",), **kw)["MABAC"]
+
+
+def promethee(X, types=None, goals=None, weights=None, wmode: str = "equal", **kw) -> np.ndarray:
+    """PROMETHEE II net flows with the usual preference function."""
+    return _evaluate(X, types, goals, weights, wmode, ("PROMETHEE II",), **kw)["PROMETHEE II"]
+
+
+def compare(X, types=None, goals=None, weights=None, wmode: str = "equal",
+            methods: Sequence[str] = METHODS, stats: ColumnStats | None = None,
+            workers: int | None = None) -> dict[str, np.ndarray]:
+    """All comparison-tab scores (SYAI at beta = 0.5) from one fused pass over ``X``."""
+    r = _evaluate(X, types, goals, weights, wmode, methods, stats, workers)
+    if "_Dp" in r:
+        r["SYAI"] = syai_closeness(r.pop("_Dp"), r.pop("_Dm"), 0.5)
+    return {k: r[k] for k in methods}
+
+
+# ---------- ranking ----------
+def rank(scores, higher: bool = True) -> np.ndarray:
+    """ranksHigher / ranksLower: 1-based ordinal ranks, ties keep input order."""
+    s = np.asarray(scores, dtype=np.float64)
+    order = np.argsort(-s if higher else s, kind="stable")
+    r = np.empty(s.shape[0], dtype=np.int64)
+    r[order] = np.arange(1, s.shape[0] + 1)
+    return r
+
+
+def rank_all(scores: Mapping[str, np.ndarray]) -> dict[str, np.ndarray]:
+    return {k: rank(v, HIGHER_IS_BETTER.get(k, True)) for k, v in scores.items()}
@@ -0,0 +1,293 @@
+# syai_rank/sensitivity.py
+"""Monte Carlo weight sensitivity: how stable is each ranking when the weights move?
+
+Every method's per-alternative accumulators are linear (SAW, MOORA, the WASPAS
+log-product, SYAI's D+/D-, VIKOR's S, COBRA's signed sums, EDAS, CODAS's
+taxicab distance, MABAC, the PROMETHEE II flows) or quadratic (TOPSIS, COBRA
+and CODAS squared distances) in the normalized weight vector. Only VIKOR's R
+is a row maximum. So each method reduces to a few weight-free
+n x m matrices built once from the decision matrix, and a block of sampled
+weight vectors W (b x m) is scored with plain matrix products ``W @ G.T``
+(or ``W**2 @ G.T``), giving a b x n score block at a time. Sample blocks
+are independent and run on a process pool: besides the products, each block
+ranks its samples (CODAS's assessment and the top-rank counts loop in
+Python), which threads would serialize. Every worker receives the matrices
+once, when it starts.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from .engine import (
+    HIGHER_IS_BETTER,
+    METHODS,
+    ColumnStats,
+    _codas_assessment,
+    _goals,
+    _or1,
+    _plan,
+    _plan_scan,
+    _signed_flow,
+    _types,
+    _unit_block,
+    as_matrix,
+    column_stats,
+    compute_weights,
+    syai_closeness,
+)
+
+_SAMPLE_CELLS = 1 << 20   # b x n score block (~8 MB of float64)
+
+
+class Sensitivity(NamedTuple):
+    weights: np.ndarray              # samples x criteria, rows sum to 1
+    acceptability: dict              # method -> n x depth, share of samples at rank 1..depth
+    first: dict                      # method -> n, probability of ranking first
+
+    @property
+    def samples(self) -> int:
+        return self.weights.shape[0]
+
+
+def sample_weights(m: int, samples: int, center=None, concentration: float = 50.0,
+                   rng: np.random.Generator | int | None = None) -> np.ndarray:
+    """Weight vectors on the simplex: uniform, or Dirichlet around ``center``.
+
+    With a center ``w`` the Dirichlet parameters are ``concentration * w``, so
+    the mean is ``w`` and larger concentrations stay closer to it. Zero
+    weights get a tiny parameter and therefore stay near zero.
+    """
+    rng = np.random.default_rng(rng)
+    if center is None:
+        alpha = np.ones(m)
+    else:
+        c = np.asarray(center, dtype=np.float64)
+        if c.shape != (m,):
+            raise ValueError(f"expected {m} center weights, got {len(c)}")
+        alpha = np.maximum(concentration * c / c.sum(), 1e-3)
+    return rng.dirichlet(alpha, size=samples)
+
+
+# ---------- weight-free method matrices ----------
+def _terms(X: np.ndarray, t, g, st: ColumnStats, want: frozenset) -> tuple:
+    """Per-method matrices in the _plan column order; weights only enter later."""
+    n, m = X.shape
+    P = _plan(t, g, np.ones(m), st)
+    _plan_scan(X, P, want, 1)
+    B = X if P.perm is None else X[:, P.perm]
+    G = {}
+    if want & {"SAW", "WASPAS", "MOORA", "CODAS"}:
+        U = _unit_block(B, P)
+        if want & {"SAW", "WASPAS"}:
+            G["U"] = U
+        if "WASPAS" in want:
+            G["logU"] = np.log(np.maximum(U, 1e-12))
+        if "MOORA" in want:
+            M = B * P.moora_raw
+            M[:, P.ideal] = U[:, P.ideal]
+            G["MOORA"] = M
+        if "CODAS" in want:
+            Ud = U - P.codas_lo
+            G["cdT"], G["cdE"] = Ud, Ud * Ud
+    if "TOPSIS" in want:
+        G["Tp"] = (B - P.topsis_plus) ** 2 * P.topsis_a2
+        G["Tm"] = (B - P.topsis_minus) ** 2 * P.topsis_a2
+    if "VIKOR" in want:
+        G["Vt"] = np.ascontiguousarray(((P.vikor_star - B) * P.vikor_scale).T)
+    if want & {"SYAI", "MABAC"}:
+        N = np.clip(1 - np.abs(B - P.syai_star) * P.syai_k, 0.01, 1)
+        if "SYAI" in want:
+            G["SYp"] = N.max(axis=0) - N
+            G["SYm"] = N - N.min(axis=0)
+        if "MABAC" in want:
+            T = (N - 0.01) / 0.99
+            G["MAB"] = T + 1 - np.exp(np.log1p(T).mean(axis=0))
+    if "EDAS" in want:
+        D = B - P.edas_av
+        D[:, P.cost] *= -1
+        D[:, P.ideal] = P.edas_av[P.ideal] - np.abs(B[:, P.ideal] - P.syai_star[P.ideal])
+        G["EP"], G["EN"] = np.maximum(D, 0.0) * P.edas_k, np.maximum(-D, 0.0) * P.edas_k
+    if "PROMETHEE II" in want:
+        star = np.empty(m)
+        star[P.perm if P.perm is not None else slice(None)] = P.syai_star
+        F = np.column_stack([_signed_flow(X, j, t[j], star[j]) for j in range(m)]) / ((n - 1) or 1)
+        G["PF"] = F if P.perm is None else F[:, P.perm]
+    if "COBRA" in want:
+        F = B * P.cobra_c
+        for key, ref in (("PIS", P.cobra_pis), ("NIS", P.cobra_nis)):
+            D = F - ref
+            G["cE" + key], G["cT" + key] = D * D, -D
+        D = F - P.cobra_as
+        Dp, Dn = np.maximum(D, 0.0), np.minimum(D, 0.0)
+        G["cEASp"], G["cTASp"] = Dp * Dp, Dp
+        G["cEASn"], G["cTASn"] = Dn * Dn, -Dn
+    return P, G
+
+
+def _sqrt(a: np.ndarray) -> np.ndarray:
+    np.maximum(a, 0.0, out=a)
+    return np.sqrt(a, out=a)
+
+
+def _cobra_dist(dE: np.ndarray, dT: np.ndarray, signed: bool) -> np.ndarray:
+    """Eq. 14 per sample row, in place: dE + rho * dE * dT."""
+    rho = dE.max(axis=1, keepdims=True) - dE.min(axis=1, keepdims=True)
+    if signed:
+        np.abs(dT, out=dT)
+    dT *= dE
+    dT *= rho
+    dT += dE
+    return dT
+
+
+def _scores(G: dict, W: np.ndarray, want: frozenset, m: int) -> dict:
+    """b x n scores of every wanted method, one row per weight vector in ``W``."""
+    W2 = W * W
+    out = {}
+    if want & {"SAW", "WASPAS"}:
+        sawv = W @ G["U"].T
+        if "SAW" in want:
+            out["SAW"] = sawv
+        if "WASPAS" in want:
+            v = W @ G["logU"].T
+            np.exp(v, out=v)
+            v += sawv
+            v *= 0.5
+            out["WASPAS"] = v
+    if "MOORA" in want:
+        out["MOORA"] = W @ G["MOORA"].T
+    if "TOPSIS" in want:
+        dp = _sqrt(W2 @ G["Tp"].T)
+        dm = _sqrt(W2 @ G["Tm"].T)
+        dp += dm
+        dp[dp == 0] = 1e-12
+        np.divide(dm, dp, out=dm)
+        out["TOPSIS"] = dm
+    if "VIKOR" in want:
+        Vt = G["Vt"]
+        q = W @ Vt
+        R = np.multiply.outer(W[:, 0], Vt[0])
+        tmp = np.empty_like(R)
+        for j in range(1, m):    # R = max_j w_j * term_j, one running maximum per criterion
+            np.multiply.outer(W[:, j], Vt[j], out=tmp)
+            np.maximum(R, tmp, out=R)
+        for A in (q, R):
+            lo = A.min(axis=1, keepdims=True)
+            A -= lo
+            A /= _or1(A.max(axis=1, keepdims=True))
+        q += R
+        q *= 0.5
+        out["VIKOR"] = q
+    if "SYAI" in want:
+        out["SYAI"] = syai_closeness(W @ G["SYp"].T, W @ G["SYm"].T, 0.5)
+    if "COBRA" in want:
+        d = {key: _cobra_dist(_sqrt(W2 @ G["cE" + key].T), W @ G["cT" + key].T, key in ("PIS", "NIS"))
+             for key in ("PIS", "NIS", "ASp", "ASn")}
+        c = d["PIS"]
+        c -= d["NIS"]
+        c -= d["ASp"]
+        c += d["ASn"]
+        c /= 4
+        out["COBRA"] = c
+    if "EDAS" in want:
+        ep, en = W @ G["EP"].T, W @ G["EN"].T
+        ep /= _or1(ep.max(axis=1, keepdims=True))
+        en /= _or1(en.max(axis=1, keepdims=True))
+        ep += 1
+        ep -= en
+        ep *= 0.5
+        out["EDAS"] = ep
+    if "CODAS" in want:
+        E, T = _sqrt(W2 @ G["cdE"].T), W @ G["cdT"].T
+        out["CODAS"] = np.stack([_codas_assessment(e, t) for e, t in zip(E, T)])
+    if "MABAC" in want:
+        out["MABAC"] = W @ G["MAB"].T
+    if "PROMETHEE II" in want:
+        out["PROMETHEE II"] = W @ G["PF"].T
+    return out
+
+
+def _top_counts(S: np.ndarray, higher: bool, depth: int) -> np.ndarray:
+    """Count, per alternative, how many rows of ``S`` rank it at 1..depth.
+
+    Within each sample ties keep input order, as in rank().
+    """
+    b, n = S.shape
+    key = np.negative(S) if higher else S.copy()
+    rows = np.arange(b)
+    if depth <= 8:
+        # a few argmin sweeps beat a partition; argmin returns the first of equal keys
+        top = np.empty((b, depth), dtype=np.intp)
+        for r in range(depth):
+            top[:, r] = i = key.argmin(axis=1)
+            key[rows, i] = np.inf
+    else:
+        top = np.argpartition(key, depth - 1, axis=1)[:, :depth] if depth < n else np.broadcast_to(np.arange(n), (b, n))
+        order = np.lexsort((top, np.take_along_axis(key, top, axis=1)), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+    flat = top * depth + np.arange(depth)
+    return np.bincount(flat.ravel(), minlength=n * depth).reshape(n, depth)
+
+
+def _count_block(state: tuple, s: slice) -> dict:
+    G, Wp, want, m, depth = state
+    sc = _scores(G, Wp[s], want, m)
+    return {k: _top_counts(v, HIGHER_IS_BETTER[k], depth) for k, v in sc.items()}
+
+
+_STATE = None   # a pool worker's (G, Wp, want, m, depth), set by _init_worker
+
+
+def _init_worker(state: tuple) -> None:
+    global _STATE
+    _STATE = state
+
+
+def _worker_block(s: slice) -> dict:
+    return _count_block(_STATE, s)
+
+
+def weight_sensitivity(X, types=None, goals=None, weights=None, wmode: str = "equal",
+                       samples: int = 10_000, dist: str = "dirichlet", concentration: float = 50.0,
+                       depth: int = 3, methods: Sequence[str] = METHODS,
+                       stats: ColumnStats | None = None, seed=None,
+                       workers: int | None = None) -> Sensitivity:
+    """Rank acceptability of every alternative under randomly perturbed weights.
+
+    ``dist="dirichlet"`` samples around the weights given by ``weights``/``wmode``
+    (see sample_weights); ``dist="uniform"`` samples the whole simplex. For
+    each method, ``acceptability[m][i, r]`` is the share of samples in which
+    alternative ``i`` ranks ``r + 1`` (ranks 1..depth), and ``first`` is
+    its first column. SYAI uses beta = 0.5 as in compare(). Sample blocks
+    are scored on ``workers`` processes (default: all cores; 1 scores them
+    in this process).
+    """
+    X = as_matrix(X)
+    n, m = X.shape
+    want = frozenset(methods)
+    unknown = want - set(METHODS)
+    if unknown:
+        raise ValueError(f"unknown method(s): {sorted(unknown)}")
+    if dist not in ("dirichlet", "uniform"):
+        raise ValueError(f"dist must be 'dirichlet' or 'uniform', got {dist!r}")
+    depth = max(1, min(int(depth), n))
+    center = compute_weights(weights, wmode, m) if dist == "dirichlet" else None
+    W = sample_weights(m, samples, center, concentration, seed)
+
+    P, G = _terms(X, _types(types, m), _goals(goals, m), stats or column_stats(X, workers), want)
+    Wp = W if P.perm is None else W[:, P.perm]
+    step = max(1, _SAMPLE_CELLS // n)
+    slices = [slice(i, min(i + step, samples)) for i in range(0, samples, step)]
+    state = (G, Wp, want, m, depth)
+    workers = max(1, min(os.cpu_count() or 1 if workers is None else workers, len(slices)))
+    if workers == 1:
+        parts = [_count_block(state, s) for s in slices]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(state,)) as ex:
+            parts = list(ex.map(_worker_block, slices))
+    acc = {k: sum(p[k] for p in parts) / samples for k in methods}
+    return Sensitivity(W, acc, {k: a[:, 0] for k, a in acc.items()})
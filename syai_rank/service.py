@@ -0,0 +1,318 @@
+# syai_rank/service.py
+"""Small HTTP API over the engine: ``python -m syai_rank serve``.
+
+Standard library only (ThreadingHTTPServer). Routes:
+
+* ``POST /rank`` - the SYAI tab: D+, D-, Closeness at ``beta`` and Rank.
+* ``POST /compare`` - the Comparison tab: score and rank per method
+  (the batch.score_frame table).
+* ``GET /stats`` - request counts and p50/p99 latency per route.
+* ``GET /health``
+
+A JSON body carries the decision matrix as ``"csv"`` text or as
+``"criteria"`` + ``"alternatives"`` + ``"matrix"`` (rows), plus the page's
+inputs keyed by criterion name: ``types``, ``ideals``, ``wmode``,
+``weights``, ``beta``, and optionally ``methods``, ``sort_by`` and ``top``.
+A raw ``text/csv``, Arrow IPC or Parquet body works too, with the same
+inputs in the query string (``types``/``ideals``/``weights`` as JSON
+objects, ``criteria``/``methods`` comma-separated). ``criteria`` limits the
+columns scored; Arrow/Parquet bodies then never decode the others.
+With ``Accept: application/vnd.apache.parquet`` the table comes back as
+Parquet instead of JSON.
+
+Parsing and scoring run on a process pool that is started and warmed up
+before the port opens, so the first request does not pay for imports.
+Responses are ``{"columns": [...], "rows": [[...], ...], "n", "dropped"}``
+in rank order. Large ones are sent with chunked transfer encoding, a slice
+of rows at a time, instead of being built in memory first. Errors come
+back as ``{"error": ...}``: 400 for bad input, 415 for an Arrow/Parquet
+body or reply without pyarrow, 500 for anything else. Every POST counts in
+``/stats``, failed or not.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from .batch import load_config, score_frame, sort_column
+from .data import DecisionMatrix, read_matrix, split_frame, write_parquet
+from .engine import rank, syai
+
+STREAM_ROWS = 10_000        # larger results go out chunked
+CHUNK_ROWS = 5_000
+MAX_BODY = 256 << 20
+ROUTES = ("/rank", "/compare")
+PARQUET = "application/vnd.apache.parquet"
+
+
+# ---------- request -> table (runs in the pool) ----------
+def _is_list(v, item=object) -> bool:
+    return isinstance(v, list) and all(isinstance(x, item) for x in v)
+
+
+def _check(payload: dict):
+    """Reject JSON fields of the wrong type before they reach the parsers (a string
+    would otherwise be iterated as a list of characters)."""
+    checks = (("csv", lambda v: isinstance(v, str), "a string of CSV text"),
+              ("criteria", lambda v: _is_list(v, str), "a list of column names"),
+              ("alternatives", _is_list, "a list of names"),
+              ("matrix", lambda v: _is_list(v, list), "a list of rows"),
+              ("methods", lambda v: _is_list(v, str), "a list of method names"),
+              ("sort_by", lambda v: v is None or isinstance(v, str), "a method name"),
+              ("top", lambda v: v is None or (isinstance(v, (int, str)) and not isinstance(v, bool)),
+               "a row count"))
+    for key, ok, what in checks:
+        if key in payload and not ok(payload[key]):
+            raise ValueError(f"{key!r} must be {what}")
+
+
+def _matrix(payload: dict) -> DecisionMatrix:
+    if "data" in payload or "csv" in payload:
+        data = payload["data"] if "data" in payload else payload["csv"].encode("utf-8")
+        return read_matrix(data, payload.get("criteria"))
+    try:
+        criteria, names, rows = payload["criteria"], payload["alternatives"], payload["matrix"]
+    except KeyError as e:
+        raise ValueError(f"body needs 'csv' or 'criteria', 'alternatives' and 'matrix' (missing {e})") from None
+    if len(rows) != len(names):
+        raise ValueError(f"{len(names)} alternatives but {len(rows)} matrix rows")
+    df = pd.DataFrame(rows, columns=list(criteria))
+    df.insert(0, "Alternative", names)
+    return split_frame(df)
+
+
+def _payload(body: bytes, ctype: str, query: dict) -> dict:
+    if not ctype.startswith("application/json") and ctype not in ("", "application/x-www-form-urlencoded"):
+        payload = {"data": body}      # CSV, Arrow or Parquet, told apart by read_matrix
+        for k, v in query.items():
+            payload[k] = json.loads(v) if k in ("types", "ideals", "weights") else v
+        for k in ("methods", "criteria"):
+            if k in payload:
+                payload[k] = [c.strip() for c in payload[k].split(",") if c.strip()]
+        if "methods" in payload:
+            payload["methods"] = [m.upper() for m in payload["methods"]]
+        return payload
+    try:
+        payload = json.loads(body or b"{}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}") from None
+    if not isinstance(payload, dict):
+        raise ValueError("JSON body must be an object")
+    return payload
+
+
+def score_request(route: str, body: bytes, ctype: str = "application/json", query: dict | None = None):
+    """Parse one request body and score it; returns ``(table, dropped)`` in rank order."""
+    p = _payload(body, ctype, query or {})
+    _check(p)
+    dm = _matrix(p)
+    if not len(dm.X):
+        raise ValueError("no usable rows")
+    top = p.get("top")
+    methods = ("SYAI",) if route == "/rank" else p.get("methods")
+    cfg = load_config(None, types=p.get("types"), goals=p.get("ideals"), weights=p.get("weights"),
+                      wmode=p.get("wmode"), beta=p.get("beta"), methods=methods)
+    types, goals, weights = cfg.columns(dm.criteria)
+    if route == "/rank":
+        Dp, Dm, close = syai(dm.X, types, goals, weights, cfg.wmode, cfg.beta, workers=1)
+        df = pd.DataFrame({"Alternative": dm.names, "D+": Dp, "D-": Dm, "Closeness": close,
+                           "Rank": rank(close)})
+        key = "Rank"
+    else:
+        df = score_frame(dm, types, goals, weights, cfg.wmode, cfg.beta, cfg.methods, workers=1)
+        key = sort_column(cfg, p.get("sort_by")) + " rank"
+    df = df.nsmallest(int(top), key, keep="first") if top else df.sort_values(key, kind="stable")
+    return df.reset_index(drop=True), dm.dropped
+
+
+def _warm() -> int:
+    """Run each code path once so the first real request finds everything imported."""
+    body = b'{"csv": "Alternative,C1,C2\\nA1,1,2\\nA2,2,1\\n", "types": {"C2": "Ideal (Goal)"}, "ideals": {"C2": 1}}'
+    for route in ROUTES:
+        score_request(route, body)
+    return os.getpid()
+
+
+# ---------- latency ----------
+class Latency:
+    """Rolling per-route request times (last ``window`` requests) for p50/p99."""
+
+    def __init__(self, window: int = 10_000):
+        self._lock = threading.Lock()
+        self._times = defaultdict(lambda: deque(maxlen=window))
+        self._count = defaultdict(int)
+        self._errors = defaultdict(int)
+
+    def record(self, route: str, seconds: float, ok: bool = True):
+        with self._lock:
+            self._times[route].append(seconds)
+            self._count[route] += 1
+            self._errors[route] += not ok
+
+    def summary(self) -> dict:
+        with self._lock:
+            out = {}
+            for route, d in self._times.items():
+                p50, p99 = np.percentile(np.fromiter(d, float, len(d)), [50, 99]) * 1e3
+                out[route] = {"count": self._count[route], "errors": self._errors[route],
+                              "p50_ms": round(float(p50), 3), "p99_ms": round(float(p99), 3)}
+            return out
+
+
+# ---------- service ----------
+class RankService:
+    """Warm process pool plus latency bookkeeping; ``jobs=0`` scores in the request thread."""
+
+    def __init__(self, jobs: int | None = None):
+        self.jobs = (os.cpu_count() or 1) if jobs is None else jobs
+        self.latency = Latency()
+        self.pool = None
+        if self.jobs > 0:
+            self.pool = ProcessPoolExecutor(self.jobs, initializer=_warm)
+            wait([self.pool.submit(os.getpid) for _ in range(self.jobs)])
+        else:
+            _warm()
+
+    def score(self, route: str, body: bytes, ctype: str, query: dict):
+        if self.pool is None:
+            return score_request(route, body, ctype, query)
+        return self.pool.submit(score_request, route, body, ctype, query).result()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "syai-rank"
+
+    @property
+    def service(self) -> RankService:
+        return self.server.service
+
+    def log_message(self, fmt, *args):
+        if not self.server.quiet:
+            super().log_message(fmt, *args)
+
+    def send_response(self, code, message=None):
+        self._responded = True
+        super().send_response(code, message)
+
+    def _fail(self, status: int, e: BaseException):
+        """Error response, unless a (streamed) response has already begun: then drop the connection."""
+        if self._responded:
+            self.close_connection = True
+            self.log_error("%s after the response started: %r", self.path, e)
+            return
+        self._json(status, {"error": str(e) if status < 500 else f"{type(e).__name__}: {e}"})
+
+    def _json(self, status: int, obj):
+        self._send(status, json.dumps(obj).encode())
+
+    def _send(self, status: int, data: bytes, ctype: str = "application/json", headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._json(200, {"status": "ok", "workers": self.service.jobs})
+        elif path == "/stats":
+            self._json(200, self.service.latency.summary())
+        else:
+            self._json(404, {"error": f"no route {path}"})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path not in ROUTES:
+            self._json(404, {"error": f"no route {url.path}"})
+            return
+        t0, ok, self._responded = time.perf_counter(), False, False
+        try:
+            size = int(self.headers.get("Content-Length") or 0)
+            if size > self.server.max_body:
+                self.close_connection = True
+                self._json(413, {"error": f"body over {self.server.max_body} bytes"})
+                return
+            body = self.rfile.read(size)
+            df, dropped = self.service.score(url.path, body, self.headers.get("Content-Type", ""),
+                                             dict(parse_qsl(url.query)))
+            self._send_table(df, dropped)
+            ok = True
+        except (ValueError, TypeError, pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+            self._fail(400, e)
+        except ImportError as e:      # an Arrow/Parquet body or reply without pyarrow installed
+            self._fail(415, e)
+        except Exception as e:        # a worker crash (BrokenProcessPool) or a bug: still answer
+            self.log_error("%s failed: %r", self.path, e)
+            self._fail(500, e)
+        finally:
+            self.service.latency.record(url.path, time.perf_counter() - t0, ok)
+
+    def _send_table(self, df: pd.DataFrame, dropped: int):
+        if PARQUET in self.headers.get("Accept", ""):
+            buf = io.BytesIO()
+            write_parquet(df, buf)
+            self._send(200, buf.getvalue(), PARQUET, {"X-Dropped-Rows": str(dropped)})
+            return
+        head = json.dumps({"columns": list(df.columns), "n": len(df), "dropped": dropped})[:-1]
+        n = len(df)
+        if n <= STREAM_ROWS:
+            rows = df.to_json(orient="values", double_precision=15)
+            self._send(200, f'{head}, "rows": {rows}}}'.encode())
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk(f'{head}, "rows": ['.encode())
+        for a in range(0, n, CHUNK_ROWS):
+            part = df.iloc[a:a + CHUNK_ROWS].to_json(orient="values", double_precision=15)[1:-1]
+            self._chunk(((", " if a else "") + part).encode())
+        self._chunk(b"]}")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, data: bytes):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+
+class RankServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: RankService, max_body: int = MAX_BODY, quiet: bool = False):
+        super().__init__(address, _Handler)
+        self.service, self.max_body, self.quiet = service, max_body, quiet
+
+    def server_close(self):
+        super().server_close()
+        self.service.close()
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, jobs: int | None = None, quiet: bool = False):
+    """Start the warm pool, then serve until interrupted."""
+    server = RankServer((host, port), RankService(jobs), quiet=quiet)
+    h, p = server.server_address[:2]
+    print(f"syai-rank listening on http://{h}:{p} ({server.service.jobs} workers)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,18 @@
+import pytest
+
+# app.py's built-in demo (load_sample_csv_text's fallback)
+SAMPLE_CSV = (
+    "Alternative,Cost,Quality,Delivery\n"
+    "A1,200,8,4\n"
+    "A2,250,7,5\n"
+    "A3,300,9,6\n"
+    "A4,220,8,4\n"
+    "A5,180,6,7\n"
+)
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    p = tmp_path / "sample.csv"
+    p.write_text(SAMPLE_CSV, encoding="utf-8")
+    return p
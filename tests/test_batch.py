@@ -0,0 +1,108 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import syai_rank
+from syai_rank import METHODS, batch
+from syai_rank.batch import SYAI_BETA, load_config, run_batch, score_vectors, sort_column
+from syai_rank.cli import main
+from syai_rank.data import read_matrix
+
+from conftest import SAMPLE_CSV
+
+
+def _config(tmp_path, obj, name="cfg.json"):
+    p = tmp_path / name
+    p.write_text(obj if isinstance(obj, str) else json.dumps(obj), encoding="utf-8")
+    return p
+
+
+def test_load_config_defaults():
+    cfg = load_config()
+    assert cfg.methods == METHODS and cfg.wmode == "equal" and cfg.beta == 0.5
+    assert load_config(weights={"Cost": 2}).wmode == "custom"
+
+
+def test_load_config_toml_and_method_order(tmp_path):
+    p = _config(tmp_path, 'methods = ["VIKOR", "SYAI"]\nbeta = 0.25\n[types]\nCost = "Cost"\n', "cfg.toml")
+    cfg = load_config(p)
+    assert cfg.methods == ("VIKOR", "SYAI") and cfg.beta == 0.25 and cfg.types == {"Cost": "Cost"}
+    assert sort_column(cfg) == "VIKOR"
+    assert load_config(p, methods=["SYAI", "TOPSIS", "SYAI"]).methods == ("SYAI", "TOPSIS")
+
+
+@pytest.mark.parametrize("raw, message", [
+    ([1, 2], "must be an object"),
+    ({"weight": {}}, "unknown config key"),
+    ({"types": ["Cost"]}, "'types' must map"),
+    ({"methods": ["SYAI", "NOPE"]}, "unknown or empty method list"),
+    ({"methods": []}, "unknown or empty method list"),
+    ({"wmode": "heavy"}, "wmode must be"),
+    ({"beta": 1.5}, "beta must be in"),
+    ({"criteria": "Cost"}, "'criteria' must be a list"),
+])
+def test_load_config_errors(tmp_path, raw, message):
+    with pytest.raises(ValueError, match=message):
+        load_config(_config(tmp_path, raw))
+
+
+def test_load_config_unreadable(tmp_path):
+    with pytest.raises(OSError):
+        load_config(tmp_path / "missing.json")
+    with pytest.raises(ValueError):
+        load_config(_config(tmp_path, "{not json"))
+
+
+def test_sort_column():
+    cfg = load_config(methods=["SYAI", "PROMETHEE II"])
+    assert sort_column(cfg) == "SYAI"
+    assert sort_column(cfg, " promethee ii ") == "PROMETHEE II"
+    assert sort_column(cfg, "syai (β)") == SYAI_BETA
+    with pytest.raises(ValueError, match="cannot sort by"):
+        sort_column(cfg, "TOPSIS")
+
+
+def test_score_vectors_one_pass(monkeypatch):
+    calls = []
+    evaluate = batch._evaluate
+    monkeypatch.setattr(batch, "_evaluate", lambda *a: calls.append(a) or evaluate(*a))
+    dm = read_matrix(SAMPLE_CSV.encode())
+    args = (["Cost", "Benefit", "Benefit"], None, [2, 1, 1], "custom")
+    got = score_vectors(dm, *args, methods=["TOPSIS", "SYAI", "CODAS"])
+    assert len(calls) == 1 and list(got) == ["TOPSIS", "D+", "D-", "CODAS"]
+    Dp, Dm, _ = syai_rank.syai(dm.X, *args)
+    np.testing.assert_array_equal(got["D+"], Dp)
+    np.testing.assert_array_equal(got["D-"], Dm)
+    ref = syai_rank.compare(dm.X, *args, methods=["TOPSIS", "CODAS"])
+    np.testing.assert_array_equal(got["CODAS"], ref["CODAS"])
+
+
+def test_run_batch_two_files(tmp_path, sample_csv):
+    second = tmp_path / "more.csv"
+    second.write_text("Alternative,Cost,Quality\nB1,10,3\nB2,12,x\nB3,9,2\n", encoding="utf-8")
+    cfg = load_config(types={"Cost": "Cost"}, methods=["SYAI", "TOPSIS"])
+    out = tmp_path / "out"
+    results = {r.source: r for r in run_batch([str(sample_csv), str(second)], cfg, out, "topsis", jobs=2)}
+    assert not any(r.error for r in results.values())
+    assert (results[str(sample_csv)].rows, results[str(second)].rows, results[str(second)].dropped) == (5, 2, 1)
+    df = pd.read_csv(out / "sample.ranked.csv")
+    assert list(df["TOPSIS rank"]) == [1, 2, 3, 4, 5]
+    assert list(df.columns) == ["Alternative", "D+", "D-", "SYAI", "SYAI rank", "TOPSIS", "TOPSIS rank",
+                                SYAI_BETA, SYAI_BETA + " rank"]
+
+
+def test_run_batch_reports_bad_files(tmp_path, sample_csv):
+    bad = tmp_path / "bad.csv"
+    bad.write_text("Alternative\nA1\n", encoding="utf-8")
+    results = list(run_batch([str(sample_csv), str(bad)], load_config(), tmp_path / "out", jobs=1))
+    assert [r.error is None for r in results] == [True, False]
+    with pytest.raises(ValueError, match="several inputs"):
+        list(run_batch([str(sample_csv), str(sample_csv)], load_config(), tmp_path / "out"))
+
+
+def test_cli_rejects_unknown_sort_before_scoring(tmp_path, sample_csv, capsys):
+    assert main(["batch", str(sample_csv), "-o", str(tmp_path / "out"), "--sort-by", "nope"]) == 2
+    assert "cannot sort by" in capsys.readouterr().err
+    assert not (tmp_path / "out").exists()
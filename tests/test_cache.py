@@ -0,0 +1,69 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from syai_rank.cache import MatrixCache, content_digest
+from syai_rank.data import read_matrix
+
+
+def _csv(path, rows):
+    path.write_text("Alternative,A,B\n" + "".join(f"R{i},{i},{2 * i + 1}\n" for i in range(rows)), encoding="utf-8")
+    return path
+
+
+def test_store_and_load(tmp_path, sample_csv):
+    cache = MatrixCache(tmp_path / "cache")
+    assert sample_csv not in cache
+    dm = cache.load(sample_csv)
+    assert sample_csv in cache
+    ref = read_matrix(sample_csv)
+    assert list(dm.names) == list(ref.names) and dm.criteria == ref.criteria
+    np.testing.assert_array_equal(np.asarray(dm.X), ref.X)
+    np.testing.assert_allclose(dm.stats.sum, ref.stats.sum)
+    assert [d for d, _, _ in cache.entries()] == [content_digest(sample_csv)]
+
+
+def test_load_subset_and_bytes(tmp_path, sample_csv):
+    cache = MatrixCache(tmp_path / "cache")
+    dm = cache.load(sample_csv.read_bytes(), criteria=["Delivery", "Cost"])
+    assert dm.criteria == ["Delivery", "Cost"]
+    np.testing.assert_array_equal(np.asarray(dm.X)[:, 1], [200, 250, 300, 220, 180])
+    assert len(cache.entries()) == 1
+    cache.load(sample_csv)      # same content by path: same entry
+    assert len(cache.entries()) == 1
+    with pytest.raises(ValueError, match="not in file"):
+        cache.load(sample_csv, criteria=["Price"])
+
+
+def test_prune_by_size_keeps_most_recent(tmp_path):
+    cache = MatrixCache(tmp_path / "cache")
+    paths = [_csv(tmp_path / f"f{k}.csv", 50 + k) for k in range(3)]
+    for k, p in enumerate(paths):
+        cache.load(p)
+        os.utime(cache.root / content_digest(p) / "meta.json", (1000 + k, 1000 + k))
+    sizes = {d: s for d, s, _ in cache.entries()}
+    newest = content_digest(paths[2])
+    freed = cache.prune(max_bytes=sizes[newest])
+    assert [d for d, _, _ in cache.entries()] == [newest]
+    assert freed == sum(sizes.values()) - sizes[newest]
+
+
+def test_prune_by_age(tmp_path, sample_csv):
+    cache = MatrixCache(tmp_path / "cache")
+    old, new = _csv(tmp_path / "old.csv", 10), sample_csv
+    cache.load(old)
+    cache.load(new)
+    stale = time.time() - 3600
+    os.utime(cache.root / content_digest(old) / "meta.json", (stale, stale))
+    cache.prune(max_age=600)
+    assert [d for d, _, _ in cache.entries()] == [content_digest(new)]
+
+
+def test_limits_apply_on_store(tmp_path):
+    cache = MatrixCache(tmp_path / "cache", max_bytes=1)
+    a, b = _csv(tmp_path / "a.csv", 10), _csv(tmp_path / "b.csv", 11)
+    assert cache.load(a).X.shape == (10, 2)      # over the limit on its own, still stored
+    assert cache.load(b).X.shape == (11, 2)
+    assert [d for d, _, _ in cache.entries()] == [content_digest(b)]
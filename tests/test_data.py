@@ -0,0 +1,157 @@
+import io
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from syai_rank.data import (ingest_csv, read_arrow, read_csv, read_matrix, read_parquet, sniff_format,
+                             table_columns, write_parquet)
+from syai_rank.engine import ColumnMatrix, column_stats
+
+from conftest import SAMPLE_CSV
+
+
+def _dirty_csv(path, rows=50):
+    """Thousands commas, padding and a few unusable cells, like a hand-edited export."""
+    lines = ["Alternative, Cost,Quality,Delivery"]
+    for i in range(rows):
+        cost = f'"{1000 + 37 * i:,}"' if i % 5 == 0 else str(200 + i)
+        quality = "n/a" if i % 11 == 3 else str(i % 10)
+        delivery = "" if i == 17 else f"{(i * 7) % 13}.5"
+        lines.append(f"A{i}, {cost},{quality},{delivery}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_ingest_csv_spill_matches_pandas_on_demo(sample_csv, tmp_path):
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    dm = ingest_csv(sample_csv, chunksize=2, spill_dir=spill_dir)
+    df = pd.read_csv(sample_csv, skipinitialspace=True)
+    assert isinstance(dm.X, np.memmap) and not dm.X.flags.writeable
+    assert list(spill_dir.iterdir()) == []          # unlinked once mapped
+    assert dm.criteria == ["Cost", "Quality", "Delivery"] and dm.dropped == 0
+    assert list(dm.names) == list(df["Alternative"])
+    np.testing.assert_array_equal(dm.X, df[dm.criteria].to_numpy(np.float64))
+    want = column_stats(df[dm.criteria].to_numpy(np.float64), workers=1)
+    assert dm.stats.n == want.n == 5
+    for field in ("min", "max", "sum", "sumsq"):
+        np.testing.assert_allclose(getattr(dm.stats, field), getattr(want, field), rtol=1e-12)
+
+
+@pytest.mark.parametrize("spill", [False, True])
+def test_ingest_csv_chunks_match_single_parse(tmp_path, spill):
+    path = _dirty_csv(tmp_path / "dirty.csv")
+    one = read_csv(path)
+    dm = ingest_csv(path, chunksize=7, spill=spill)
+    assert isinstance(dm.X, np.memmap) is spill
+    assert dm.criteria == one.criteria and dm.dropped == one.dropped == 6
+    assert list(dm.names) == list(one.names)
+    np.testing.assert_array_equal(dm.X, one.X)
+    assert dm.X[0, 0] == 1000.0                     # "1,000" parsed like toNum
+    want = column_stats(one.X, workers=1)
+    assert dm.stats.n == want.n == len(one.X)
+    np.testing.assert_allclose(dm.stats.sumsq, want.sumsq, rtol=1e-12)
+    np.testing.assert_array_equal(dm.stats.min, want.min)
+
+
+def test_ingest_csv_all_rows_dropped(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("Alternative,Cost\nA1,x\nA2,\n", encoding="utf-8")
+    dm = ingest_csv(path, spill=True, spill_dir=tmp_path)
+    assert dm.X.shape == (0, 1) and dm.dropped == 2 and dm.stats is None
+    assert [p.name for p in tmp_path.iterdir()] == ["bad.csv"]
+
+
+def test_ingest_csv_buffer_without_header():
+    with pytest.raises(ValueError):
+        ingest_csv(io.StringIO(""))
+    dm = ingest_csv(io.StringIO(SAMPLE_CSV))
+    assert len(dm.X) == 5
+
+
+# ---------- Arrow IPC / Parquet ----------
+@pytest.fixture
+def pa():
+    return pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def demo_df(sample_csv):
+    return pd.read_csv(sample_csv, skipinitialspace=True)
+
+
+def _write_ipc(pa, df, path, stream=False):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(str(path), "wb") as sink:
+        with (pa.ipc.new_stream if stream else pa.ipc.new_file)(sink, table.schema) as w:
+            w.write_table(table, max_chunksize=2)     # several record batches
+    return path
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_read_arrow_matches_pandas_zero_copy(pa, demo_df, tmp_path, stream):
+    df = demo_df.astype({"Cost": np.float64, "Quality": np.float64, "Delivery": np.float64})
+    dm = read_arrow(_write_ipc(pa, df, tmp_path / "demo.arrow", stream))
+    assert isinstance(dm.X, ColumnMatrix) and dm.X.shape == (5, 3)
+    assert dm.criteria == ["Cost", "Quality", "Delivery"] and dm.dropped == 0
+    assert list(dm.names) == list(df["Alternative"])
+    np.testing.assert_array_equal(np.asarray(dm.X), df[dm.criteria].to_numpy())
+    parts = [p for col in dm.X.columns for p in col]
+    assert len(parts) == 9                            # 3 batches per column, kept as they are
+    assert all(not p.flags.owndata and not p.flags.writeable for p in parts)   # views of the map
+    np.testing.assert_array_equal(dm.stats.max, df[dm.criteria].max().to_numpy())
+
+
+def test_read_arrow_criteria_subset_and_nulls(pa, demo_df, tmp_path):
+    df = demo_df.copy()
+    df.loc[1, "Quality"] = None                       # int column -> float with a null
+    path = _write_ipc(pa, df, tmp_path / "demo.feather")
+    dm = read_arrow(path, criteria=["Quality", "Cost"])
+    assert dm.criteria == ["Quality", "Cost"] and dm.dropped == 1
+    keep = df.drop(index=1)
+    assert list(dm.names) == list(keep["Alternative"])
+    np.testing.assert_array_equal(np.asarray(dm.X), keep[["Quality", "Cost"]].to_numpy(np.float64))
+    assert table_columns(path) == ["Alternative", "Cost", "Quality", "Delivery"]
+
+
+def test_read_arrow_missing_column(pa, demo_df, tmp_path):
+    path = _write_ipc(pa, demo_df, tmp_path / "demo.arrow")
+    with pytest.raises(ValueError, match="not in file"):
+        read_arrow(path, criteria=["Cost", "Price"])
+
+
+def test_write_parquet_round_trip(pa, demo_df, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "demo.parquet"
+    write_parquet(demo_df, path)
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(path), demo_df)
+    buf = io.BytesIO()
+    write_parquet(demo_df, buf, compression="none")
+    assert sniff_format(buf.getvalue()) == "parquet"
+    pd.testing.assert_frame_equal(pd.read_parquet(io.BytesIO(buf.getvalue())), demo_df)
+
+
+def test_read_parquet_matches_pandas(pa, demo_df, tmp_path):
+    path = tmp_path / "demo.parquet"
+    write_parquet(demo_df, path)
+    for source in (path, path.read_bytes()):
+        dm = read_parquet(source)
+        assert isinstance(dm.X, ColumnMatrix) and dm.criteria == ["Cost", "Quality", "Delivery"]
+        assert list(dm.names) == list(demo_df["Alternative"])
+        np.testing.assert_array_equal(np.asarray(dm.X), demo_df[dm.criteria].to_numpy(np.float64))
+    sub = read_matrix(path, criteria=["Delivery"])
+    np.testing.assert_array_equal(np.asarray(sub.X)[:, 0], demo_df["Delivery"].to_numpy(np.float64))
+    with pytest.raises(ValueError, match="not in file"):
+        read_parquet(path, criteria=["Speed"])
+
+
+def test_arrow_without_pyarrow(monkeypatch, sample_csv):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)    # import pyarrow now raises ImportError
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        read_arrow(b"ARROW1")
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        write_parquet(pd.DataFrame({"a": [1.0]}), io.BytesIO())
+    assert len(read_matrix(sample_csv).X) == 5        # CSV needs no pyarrow
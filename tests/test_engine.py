@@ -0,0 +1,134 @@
+import json
+import subprocess
+
+import numpy as np
+import pytest
+
+import syai_rank
+from syai_rank import bench, engine
+from syai_rank.data import read_matrix
+
+from conftest import SAMPLE_CSV
+
+BENEFIT, COST, IDEAL = syai_rank.BENEFIT, syai_rank.COST, syai_rank.IDEAL
+
+# compareAll from the page's own kernels, on matrices given column-major
+_JS = """
+const fs = require("fs");
+const K = (%s)();
+const cases = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+console.log(JSON.stringify(cases.map(c => {
+  const D = c.csv ? K.toMatrix(K.parseCSVText(c.csv))
+                  : {crit: c.crit, names: c.crit.map(() => ""), n: c.n, m: c.crit.length, X: Float64Array.from(c.X)};
+  const r = K.compareAll(D, c.types, c.ideals, c.weights, c.wmode);
+  return Object.fromEntries(Object.entries(r).map(([k, v]) => [k, Array.from(v)]));
+})));
+"""
+
+
+def _page_scores(cases, tmp_path):
+    node = bench.node_path()
+    if node is None:
+        pytest.skip("node not on PATH")
+    driver, args = tmp_path / "parity.js", tmp_path / "cases.json"
+    driver.write_text(_JS % bench.kernels_source(), encoding="utf-8")
+    args.write_text(json.dumps(cases), encoding="utf-8")
+    out = subprocess.run([node, str(driver), str(args)], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def _matrix_case(X, types, ideals=None, weights=None):
+    crit = [f"C{j + 1}" for j in range(X.shape[1])]
+    return {"crit": crit, "n": X.shape[0], "X": np.asarray(X, dtype=float).T.ravel().tolist(),
+            "types": dict(zip(crit, types)), "ideals": dict(zip(crit, ideals or [""] * len(crit))),
+            "weights": dict(zip(crit, weights or [1] * len(crit))),
+            "wmode": "custom" if weights else "equal"}
+
+
+EDGE_CASES = {
+    "flat column": _matrix_case(np.array([[3, 1, 5], [3, 2, 5], [3, 4, 6], [3, 8, 7]]),
+                                [BENEFIT, COST, IDEAL]),
+    "ties": _matrix_case(np.array([[1, 2, 3], [1, 2, 3], [2, 2, 1], [2, 1, 1], [3, 3, 3]]),
+                         [BENEFIT, BENEFIT, COST], weights=[2, 1, 1]),
+    "negative cost": _matrix_case(np.array([[-4, 2.5, 10], [-1, 0, 12], [0, 3, 9], [2, -2, 11], [5, 1, 10]]),
+                                  [COST, COST, IDEAL], ideals=["", "", "10.5"], weights=[1, 3, 2]),
+}
+
+
+def _engine_scores(case):
+    X = np.array(case["X"]).reshape(len(case["crit"]), case["n"]).T
+    cols = [syai_rank.as_columns(case["crit"], case[k]) for k in ("types", "ideals", "weights")]
+    return syai_rank.compare(X, *cols, case["wmode"])
+
+
+def _assert_same(py, js):
+    assert set(js) == set(syai_rank.METHODS)
+    for k in syai_rank.METHODS:
+        np.testing.assert_allclose(py[k], js[k], rtol=1e-9, atol=1e-12, err_msg=k)
+
+
+def test_sample_csv_matches_page(tmp_path):
+    spec = {"types": {"Cost": COST, "Delivery": IDEAL}, "ideals": {"Delivery": "5"},
+            "weights": {"Cost": 2, "Quality": 1, "Delivery": 1}, "wmode": "custom"}
+    js, = _page_scores([{"csv": SAMPLE_CSV, **spec}], tmp_path)
+    dm = read_matrix(SAMPLE_CSV.encode())
+    py = syai_rank.compare(dm.X, *(syai_rank.as_columns(dm.criteria, spec[k]) for k in ("types", "ideals", "weights")),
+                           "custom")
+    _assert_same(py, js)
+    for k in syai_rank.METHODS:
+        higher = syai_rank.HIGHER_IS_BETTER[k]
+        np.testing.assert_array_equal(syai_rank.rank(py[k], higher), syai_rank.rank(js[k], higher), err_msg=k)
+
+
+@pytest.mark.parametrize("name", list(EDGE_CASES))
+def test_edge_matrices_match_page(name, tmp_path):
+    case = EDGE_CASES[name]
+    js, = _page_scores([case], tmp_path)
+    _assert_same(_engine_scores(case), js)
+
+
+def test_block_sweep_and_column_matrix_agree(monkeypatch):
+    rng = np.random.default_rng(0)
+    X = np.round(rng.normal(0, 10, (200, 4)), 1)
+    args = ([COST, BENEFIT, IDEAL, COST], [None, None, 1.5, None], [1, 2, 3, 4], "custom")
+    ref = syai_rank.compare(X, *args, workers=1)
+    monkeypatch.setattr(engine, "_BLOCK_CELLS", 40)
+    cm = syai_rank.ColumnMatrix([[X[:7, j], X[7:, j]] for j in range(4)])
+    for got in (syai_rank.compare(X, *args, workers=3), syai_rank.compare(cm, *args, workers=2)):
+        for k in syai_rank.METHODS:
+            np.testing.assert_allclose(got[k], ref[k], rtol=1e-12, atol=1e-12, err_msg=k)
+
+
+def test_compute_weights():
+    np.testing.assert_allclose(syai_rank.compute_weights([2, 1, 1], "custom"), [0.5, 0.25, 0.25])
+    np.testing.assert_allclose(syai_rank.compute_weights([2, 1, 1], "equal"), [1 / 3] * 3)
+    np.testing.assert_allclose(syai_rank.compute_weights([0, -1, "x"], "custom"), [1 / 3] * 3)
+    with pytest.raises(ValueError):
+        syai_rank.compute_weights([1, 2], "custom", m=3)
+
+
+def test_rank_keeps_input_order_on_ties():
+    np.testing.assert_array_equal(syai_rank.rank([0.5, 0.9, 0.5]), [2, 1, 3])
+    np.testing.assert_array_equal(syai_rank.rank([0.5, 0.9, 0.5], higher=False), [1, 3, 2])
+
+
+def test_bad_inputs():
+    with pytest.raises(ValueError):
+        syai_rank.compare(np.ones((3, 2)), ["Benefit", "Sideways"])
+    with pytest.raises(ValueError):
+        syai_rank.compare(np.array([[1.0, np.nan], [2.0, 3.0]]))
+    with pytest.raises(ValueError):
+        syai_rank.compare(np.ones((3, 2)), methods=["NOPE"])
+
+
+def test_sensitivity_matches_compare_per_sample():
+    rng = np.random.default_rng(1)
+    X = np.round(rng.normal(5, 4, (30, 3)), 1)
+    types = [BENEFIT, COST, IDEAL]
+    s = syai_rank.weight_sensitivity(X, types, samples=12, seed=3, depth=1, workers=1)
+    for k in syai_rank.METHODS:
+        first = np.zeros(len(X))
+        for w in s.weights:
+            first[syai_rank.rank(syai_rank.compare(X, types, None, w, "custom")[k],
+                                 syai_rank.HIGHER_IS_BETTER[k]).argmin()] += 1
+        np.testing.assert_allclose(s.first[k], first / s.samples, err_msg=k)
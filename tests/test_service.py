@@ -0,0 +1,124 @@
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlencode
+
+import pytest
+
+from syai_rank import service
+from syai_rank.service import RankServer, RankService
+
+from conftest import SAMPLE_CSV
+
+
+@pytest.fixture(scope="module")
+def server():
+    srv = RankServer(("127.0.0.1", 0), RankService(jobs=0), quiet=True)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _request(server, method, path, body=None, ctype="application/json", headers=None):
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    if isinstance(body, dict):
+        body = json.dumps(body).encode()
+    conn.request(method, path, body, {"Content-Type": ctype, **(headers or {})})
+    r = conn.getresponse()
+    data = r.read()
+    conn.close()
+    return r, json.loads(data) if r.getheader("Content-Type") == "application/json" else data
+
+
+SPEC = {"types": {"Cost": "Cost", "Delivery": "Ideal (Goal)"}, "ideals": {"Delivery": 5},
+        "weights": {"Cost": 2, "Quality": 1, "Delivery": 1}}
+
+
+def test_rank_json(server):
+    r, out = _request(server, "POST", "/rank", {"csv": SAMPLE_CSV, **SPEC, "beta": 0.3})
+    assert r.status == 200
+    assert out["columns"] == ["Alternative", "D+", "D-", "Closeness", "Rank"]
+    assert out["n"] == 5 and out["dropped"] == 0
+    assert [row[-1] for row in out["rows"]] == [1, 2, 3, 4, 5]
+
+
+def test_compare_matrix_body_with_top(server):
+    body = {"criteria": ["Cost", "Quality"], "alternatives": ["A", "B", "C"],
+            "matrix": [[200, 8], [250, 7], [180, "x"]], "types": {"Cost": "Cost"},
+            "methods": ["TOPSIS", "SAW"], "sort_by": "saw", "top": 1}
+    r, out = _request(server, "POST", "/compare", body)
+    assert r.status == 200
+    assert out["columns"] == ["Alternative", "TOPSIS", "TOPSIS rank", "SAW", "SAW rank"]
+    assert out["n"] == 1 and out["dropped"] == 1 and out["rows"][0][0] == "A"
+
+
+def test_compare_text_csv_with_query(server):
+    q = urlencode({"types": json.dumps(SPEC["types"]), "methods": "syai,vikor", "criteria": "Cost,Delivery"})
+    r, out = _request(server, "POST", "/compare?" + q, SAMPLE_CSV.encode(), "text/csv")
+    assert r.status == 200
+    assert out["columns"][:3] == ["Alternative", "D+", "D-"]
+    assert "VIKOR rank" in out["columns"] and out["n"] == 5
+
+
+def test_large_results_are_chunked(server, monkeypatch):
+    monkeypatch.setattr(service, "STREAM_ROWS", 3)
+    monkeypatch.setattr(service, "CHUNK_ROWS", 2)
+    r, out = _request(server, "POST", "/rank", {"csv": SAMPLE_CSV})
+    assert r.getheader("Transfer-Encoding") == "chunked"
+    assert out["n"] == 5 and len(out["rows"]) == 5
+    assert sorted(row[-1] for row in out["rows"]) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("body, message", [
+    (b"{not json", "invalid JSON"),
+    (b"[1, 2]", "must be an object"),
+    ({"csv": 5}, "'csv' must be"),
+    ({"csv": SAMPLE_CSV, "criteria": "Cost"}, "'criteria' must be"),
+    ({"csv": SAMPLE_CSV, "sort_by": 5}, "'sort_by' must be"),
+    ({"csv": SAMPLE_CSV, "sort_by": "NOPE"}, "cannot sort by"),
+    ({"csv": SAMPLE_CSV, "methods": ["NOPE"]}, "unknown or empty method list"),
+    ({"criteria": ["C"], "alternatives": ["A", "B"], "matrix": [[1]]}, "2 alternatives but 1"),
+    ({"alternatives": ["A"]}, "body needs 'csv'"),
+    ({"csv": "Alternative,C\nA,x\n"}, "no usable rows"),
+])
+def test_malformed_bodies_get_400(server, body, message):
+    r, out = _request(server, "POST", "/compare", body)
+    assert r.status == 400 and message in out["error"]
+
+
+def test_unexpected_errors_get_500(server, monkeypatch):
+    def boom(*a):
+        raise RuntimeError("worker died")
+    monkeypatch.setattr(service, "score_request", boom)
+    r, out = _request(server, "POST", "/rank", {"csv": SAMPLE_CSV})
+    assert r.status == 500 and "worker died" in out["error"]
+
+
+def test_unknown_route_and_health(server):
+    assert _request(server, "POST", "/nope", {})[0].status == 404
+    r, out = _request(server, "GET", "/health")
+    assert r.status == 200 and out["status"] == "ok"
+
+
+def test_stats_counts_requests_and_errors():
+    srv = RankServer(("127.0.0.1", 0), RankService(jobs=0), quiet=True)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        _request(srv, "POST", "/rank", {"csv": SAMPLE_CSV})
+        _request(srv, "POST", "/rank", {"csv": 5})
+        _request(srv, "POST", "/compare", {"csv": SAMPLE_CSV})
+        # the handler records latency after its reply is out, so wait for all three POSTs to land
+        deadline = time.monotonic() + 5
+        while True:
+            _, stats = _request(srv, "GET", "/stats")
+            if sum(v["count"] for v in stats.values()) >= 3 or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+    finally:
+        srv.shutdown()
+        srv.server_close()
+    assert (stats["/rank"]["count"], stats["/rank"]["errors"]) == (2, 1)
+    assert (stats["/compare"]["count"], stats["/compare"]["errors"]) == (1, 0)
+    assert stats["/rank"]["p99_ms"] >= stats["/rank"]["p50_ms"] > 0